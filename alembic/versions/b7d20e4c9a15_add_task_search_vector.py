@@ -0,0 +1,46 @@
+"""add_task_search_vector
+
+Revision ID: b7d20e4c9a15
+Revises: e2c45e59e7a9
+Create Date: 2026-10-17 16:48:21.530274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d20e4c9a15'
+down_revision: Union[str, None] = 'e2c45e59e7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Копия models.domain.tasks.TASK_SEARCH_VECTOR на момент миграции
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Добавление STORED-колонки переписывает tasks под эксклюзивной блокировкой
+    op.add_column('tasks', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True
+    ))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_search_vector', 'tasks', ['search_vector'],
+            unique=False, postgresql_using='gin', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_search_vector', table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'search_vector')
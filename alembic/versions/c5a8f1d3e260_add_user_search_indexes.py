@@ -0,0 +1,45 @@
+"""add_user_search_indexes
+
+Revision ID: c5a8f1d3e260
+Revises: b7d20e4c9a15
+Create Date: 2026-10-17 17:26:09.118463
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8f1d3e260'
+down_revision: Union[str, None] = 'b7d20e4c9a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FIELDS = ['first_name', 'last_name', 'email']
+
+
+def upgrade() -> None:
+    # pg_trgm - доверенное расширение, владелец базы может создать его сам
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for field in FIELDS:
+            op.create_index(
+                f'ix_users_{field}_trgm', 'users', [field], unique=False,
+                postgresql_using='gin', postgresql_ops={field: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_users_{field}_prefix "
+                f"ON users (lower({field}) text_pattern_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for field in reversed(FIELDS):
+            op.drop_index(f'ix_users_{field}_prefix', table_name='users', postgresql_concurrently=True)
+            op.drop_index(f'ix_users_{field}_trgm', table_name='users', postgresql_concurrently=True)
+    # Расширение не удаляем: его могут использовать другие объекты базы
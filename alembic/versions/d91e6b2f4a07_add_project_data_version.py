@@ -0,0 +1,96 @@
+"""add_project_data_version
+
+Revision ID: d91e6b2f4a07
+Revises: c5a8f1d3e260
+Create Date: 2026-10-17 18:02:44.671905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91e6b2f4a07'
+down_revision: Union[str, None] = 'c5a8f1d3e260'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Копия models.domain.projects на момент миграции
+VERSIONED_TABLES = ('tasks', 'task_columns', 'sprints')
+
+# Таблицы переходов допускают только одно событие на триггер
+TRANSITION_TABLES = {
+    'INSERT': 'NEW TABLE AS new_rows',
+    'UPDATE': 'OLD TABLE AS old_rows NEW TABLE AS new_rows',
+    'DELETE': 'OLD TABLE AS old_rows',
+}
+
+BUMP_PROJECT_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_project_data_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (SELECT project_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (SELECT project_id FROM old_rows);
+    ELSE
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (
+            SELECT unnest(ARRAY[o.project_id, n.project_id])
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o IS DISTINCT FROM n
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+BUMP_ASSIGNEE_PROJECT_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_assignee_project_data_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE projects SET data_version = data_version + 1
+    WHERE id IN (
+        SELECT t.project_id
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        JOIN tasks t ON t.assignee_id = n.id
+        WHERE (o.first_name, o.last_name) IS DISTINCT FROM (n.first_name, n.last_name)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # Константный DEFAULT не переписывает таблицу
+    op.add_column('projects', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute(BUMP_PROJECT_VERSION_FUNCTION)
+    op.execute(BUMP_ASSIGNEE_PROJECT_VERSION_FUNCTION)
+    # Триггеры уровня оператора: одно обновление projects на оператор
+    for table in VERSIONED_TABLES:
+        for action, transition in TRANSITION_TABLES.items():
+            op.execute(
+                f"CREATE TRIGGER {table}_bump_project_data_version_{action.lower()} "
+                f"AFTER {action} ON {table} REFERENCING {transition} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION bump_project_data_version()"
+            )
+    op.execute(
+        "CREATE TRIGGER users_bump_assignee_project_data_version "
+        f"AFTER UPDATE ON users REFERENCING {TRANSITION_TABLES['UPDATE']} "
+        "FOR EACH STATEMENT EXECUTE FUNCTION bump_assignee_project_data_version()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS users_bump_assignee_project_data_version ON users")
+    for table in reversed(VERSIONED_TABLES):
+        for action in TRANSITION_TABLES:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_bump_project_data_version_{action.lower()} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS bump_assignee_project_data_version()")
+    op.execute("DROP FUNCTION IF EXISTS bump_project_data_version()")
+    op.drop_column('projects', 'data_version')
@@ -0,0 +1,40 @@
+"""store_token_jti
+
+Revision ID: de4b71e213f2
+Revises: 9bf680dd3061
+Create Date: 2026-10-17 10:12:41.203518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de4b71e213f2'
+down_revision: Union[str, None] = '9bf680dd3061'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tokens', sa.Column('jti', sa.String(length=32), nullable=True))
+    # Старые токены не содержат jti: ключом служит md5 от строки токена
+    # (core.security.get_token_key вычисляет его так же)
+    op.execute("UPDATE tokens SET jti = md5(token)")
+    op.alter_column('tokens', 'jti', nullable=False)
+    op.create_index(op.f('ix_tokens_jti'), 'tokens', ['jti'], unique=True)
+    op.drop_index(op.f('ix_tokens_token'), table_name='tokens')
+    op.drop_column('tokens', 'token')
+
+
+def downgrade() -> None:
+    # Исходные строки токенов не восстановить: после отката все ранее
+    # выданные токены перестанут проходить проверку.
+    op.add_column('tokens', sa.Column('token', sa.String(), nullable=True))
+    op.execute("UPDATE tokens SET token = jti")
+    op.alter_column('tokens', 'token', nullable=False)
+    op.create_index(op.f('ix_tokens_token'), 'tokens', ['token'], unique=True)
+    op.drop_index(op.f('ix_tokens_jti'), table_name='tokens')
+    op.drop_column('tokens', 'jti')
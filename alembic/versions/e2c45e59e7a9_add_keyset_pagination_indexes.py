@@ -0,0 +1,47 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: e2c45e59e7a9
+Revises: f344fe08c200
+Create Date: 2026-10-17 15:32:47.906114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c45e59e7a9'
+down_revision: Union[str, None] = 'f344fe08c200'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Курсорная пагинация сортирует по (created_at DESC, id DESC) внутри
+# проекта или пользователя: индекс (владелец, created_at, id) отдает
+# страницу без сортировки. Старый индекс уведомлений без id им покрывается.
+INDEXES = [
+    ('ix_project_activities_project_created_id', 'project_activities', ['project_id', 'created_at', 'id']),
+    ('ix_notifications_user_created_id', 'notifications', ['user_id', 'created_at', 'id']),
+    ('ix_messages_project_created_id', 'messages', ['project_id', 'created_at', 'id']),
+    ('ix_reports_project_created_id', 'reports', ['project_id', 'created_at', 'id']),
+]
+REPLACED = [
+    ('ix_notifications_user_created', 'notifications', ['user_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,67 @@
+"""add_hot_path_indexes
+
+Revision ID: f344fe08c200
+Revises: de4b71e213f2
+Create Date: 2026-10-17 14:05:12.481907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f344fe08c200'
+down_revision: Union[str, None] = 'de4b71e213f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя, таблица, колонки) - строятся CONCURRENTLY, без блокировки записи
+INDEXES = [
+    ('ix_tasks_project_id', 'tasks', ['project_id']),
+    ('ix_tasks_sprint_id', 'tasks', ['sprint_id']),
+    ('ix_tasks_assignee_id', 'tasks', ['assignee_id']),
+    ('ix_tasks_column_id', 'tasks', ['column_id']),
+    ('ix_user_project_project_id', 'user_project', ['project_id']),
+    ('ix_task_relations_source_target', 'task_relations', ['source_task_id', 'target_task_id']),
+    ('ix_task_relations_target_task_id', 'task_relations', ['target_task_id']),
+]
+
+
+def upgrade() -> None:
+    # Дубликаты членства мешают уникальному индексу: оставляем запись
+    # владельца, иначе самую раннюю
+    op.execute("""
+        DELETE FROM user_project
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id, project_id
+                    ORDER BY (role = 'OWNER') DESC, id
+                ) AS rn
+                FROM user_project
+            ) AS duplicates
+            WHERE rn > 1
+        )
+    """)
+
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_user_project_user_id_project_id', 'user_project', ['user_id', 'project_id'],
+            unique=True, postgresql_concurrently=True
+        )
+        op.execute(
+            "ALTER TABLE user_project ADD CONSTRAINT uq_user_project_user_id_project_id "
+            "UNIQUE USING INDEX uq_user_project_user_id_project_id"
+        )
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.drop_constraint('uq_user_project_user_id_project_id', 'user_project', type_='unique')
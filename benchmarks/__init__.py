@@ -0,0 +1,13 @@
+# Импорт всех моделей, чтобы Base.metadata.create_all создавал полную схему
+from core.db import Base
+from models.domain.users import User
+from models.domain.projects import Project
+from models.domain.sprints import Sprint
+from models.domain.tasks import *
+from models.domain.messages import Message
+from models.domain.user_project import user_project_table
+from models.domain.task_columns import TaskColumn
+from models.domain.tokens import Token
+from models.domain.notifications import Notification
+from models.domain.project_activities import ProjectActivity
+from models.domain.reports import Report
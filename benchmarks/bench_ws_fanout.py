@@ -0,0 +1,123 @@
+"""Бенчмарк: рассылка одного сообщения чата по --sockets WebSocket-соединениям.
+
+Сравнивает прежнюю рассылку (send_json каждому клиенту по очереди, то есть
+json.dumps на каждого получателя) с текущей: кадр кодируется один раз
+(encode_frame, orjson при наличии), публикуется через InMemoryBroadcast и
+раскладывается по очередям ConnectionRegistry, которые отправляют его через send_text.
+
+Сокеты поддельные, но повторяют работу Starlette: send_json сериализует
+данные, а кадр перед отправкой кодируется в UTF-8. База данных не нужна:
+
+    python -m benchmarks.bench_ws_fanout --sockets 500 --messages 200
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+
+from core.broadcast import InMemoryBroadcast
+from core.connections import ConnectionRegistry, orjson
+
+CONTENT = "Сообщение в чат проекта во время лекции, немного текста для реалистичного размера кадра"
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_json(self, data) -> None:
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def send_text(self, data: str) -> None:
+        self.bytes += len(data.encode("utf-8"))
+        self.frames += 1
+
+
+def message(n: int) -> dict:
+    return {
+        "id": n,
+        "project_id": 1,
+        "sender_id": 42,
+        "content": CONTENT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "sender_name": "Иванов",
+    }
+
+
+def summarize(timings: list[float]) -> dict:
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(int(len(timings) * 0.95) - 1, 0)], 3),
+        "total_ms": round(sum(timings), 1),
+    }
+
+
+async def sequential_send_json(sockets: int, messages: int) -> dict:
+    """Прежний broadcast_message: ждет send_json каждого клиента"""
+    clients = [FakeWebSocket() for _ in range(sockets)]
+    timings = []
+    for n in range(messages):
+        start = time.perf_counter()
+        data = message(n)
+        for websocket in clients:
+            await websocket.send_json(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {**summarize(timings), "frames": sum(c.frames for c in clients)}
+
+
+async def encode_once_queues(sockets: int, messages: int) -> dict:
+    """Текущий путь: одна сериализация, очереди и задачи-отправители"""
+    backend = InMemoryBroadcast()
+    registry = ConnectionRegistry(queue_size=messages + 1)
+    backend.subscribe("chat", registry.broadcast)
+    clients = [FakeWebSocket() for _ in range(sockets)]
+    for websocket in clients:
+        registry.add(1, websocket)
+
+    publish_timings = []
+    delivery_timings = []
+    for n in range(messages):
+        start = time.perf_counter()
+        await backend.publish("chat", 1, message(n))
+        publish_timings.append((time.perf_counter() - start) * 1000)
+        expected = (n + 1) * sockets
+        while sum(c.frames for c in clients) < expected:
+            await asyncio.sleep(0)
+        delivery_timings.append((time.perf_counter() - start) * 1000)
+
+    for websocket in clients:
+        await registry.remove(1, websocket)
+    return {
+        "publish": summarize(publish_timings),
+        "delivery": summarize(delivery_timings),
+        "frames": sum(c.frames for c in clients),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"encoder: {'orjson' if orjson is not None else 'json'}, sockets: {args.sockets}")
+
+    # Прогрев
+    await sequential_send_json(args.sockets, 5)
+    await encode_once_queues(args.sockets, 5)
+
+    before = await sequential_send_json(args.sockets, args.messages)
+    print(f"before (send_json per socket): p50={before['p50_ms']}ms p95={before['p95_ms']}ms")
+
+    after = await encode_once_queues(args.sockets, args.messages)
+    print(
+        f"after (encode once): publish p50={after['publish']['p50_ms']}ms "
+        f"p95={after['publish']['p95_ms']}ms; "
+        f"delivered to all p50={after['delivery']['p50_ms']}ms p95={after['delivery']['p95_ms']}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,204 @@
+"""Рассылка событий WebSocket между воркерами.
+
+Сервис публикует событие один раз (тема, ключ, данные), а каждый воркер
+доставляет его своим локальным сокетам через подписчиков темы. Бэкенд
+выбирается настройкой BROADCAST_BACKEND:
+
+  - memory - события доставляются только в текущем процессе (один воркер, тесты);
+  - postgres - NOTIFY в канал BROADCAST_CHANNEL, все воркеры слушают его LISTEN
+    на отдельном соединении, в том числе тот, что опубликовал событие.
+
+Данные события кодируются в JSON один раз при публикации; подписчики
+получают готовый текст кадра и отправляют его сокетам без повторной сериализации.
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from core.config.settings import settings
+from core.connections import encode_frame
+
+logger = logging.getLogger(__name__)
+
+# Подписчик получает ключ (проект, пользователь) и JSON-текст кадра; он только
+# ставит кадр в очереди сокетов и не должен ждать сеть
+Handler = Callable[[int, str], Any]
+
+
+class BroadcastBackend(ABC):
+    name = "base"
+
+    def __init__(self):
+        self._handlers: dict[str, list[Handler]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.errors = 0
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def unsubscribe(self, topic: str, handler: Handler) -> None:
+        handlers = self._handlers.get(topic, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def _dispatch(self, topic: str, key: int, frame: str) -> None:
+        self.delivered += 1
+        for handler in self._handlers.get(topic, ()):
+            try:
+                handler(key, frame)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Ошибка доставки события {topic}:{key}: {e}")
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, topic: str, key: int, data: Any) -> None:
+        """Доставляет событие подписчикам темы во всех воркерах"""
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.name,
+            "published": self.published,
+            "delivered": self.delivered,
+            "errors": self.errors,
+        }
+
+
+class InMemoryBroadcast(BroadcastBackend):
+    """Доставка в пределах процесса"""
+
+    name = "memory"
+
+    async def publish(self, topic: str, key: int, data: Any) -> None:
+        self.published += 1
+        self._dispatch(topic, key, encode_frame(data))
+
+
+class PostgresBroadcast(BroadcastBackend):
+    """Доставка всем воркерам через LISTEN/NOTIFY.
+
+    Слушает и публикует через одно выделенное соединение asyncpg вне пула
+    SQLAlchemy. Полезная нагрузка NOTIFY ограничена 8000 байт: более крупные
+    события и события, опубликованные без соединения, доставляются только
+    локально.
+    """
+
+    name = "postgres"
+    PAYLOAD_LIMIT = 7999
+    RECONNECT_DELAY_SECONDS = 1.0
+    MAX_RECONNECT_DELAY_SECONDS = 30.0
+
+    def __init__(self, dsn: str, channel: str):
+        super().__init__()
+        self.dsn = dsn
+        self.channel = channel
+        self.local_only = 0
+        self._conn: Optional[asyncpg.Connection] = None
+        self._lock = asyncio.Lock()
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        self._stopping = False
+        await self._connect()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"Ошибка закрытия соединения LISTEN: {e}")
+
+    async def _connect(self) -> None:
+        conn = await asyncpg.connect(self.dsn)
+        await conn.add_listener(self.channel, self._on_notify)
+        conn.add_termination_listener(self._on_terminated)
+        self._conn = conn
+        logger.info(f"Подписка на канал {self.channel} установлена")
+
+    def _on_terminated(self, conn: asyncpg.Connection) -> None:
+        if self._stopping or conn is not self._conn:
+            return
+        self._conn = None
+        logger.error(f"Соединение LISTEN для канала {self.channel} потеряно, переподключение")
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.RECONNECT_DELAY_SECONDS
+        while not self._stopping:
+            try:
+                await self._connect()
+                return
+            except Exception as e:
+                logger.error(f"Не удалось переподключиться к каналу {self.channel}: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SECONDS)
+
+    def _on_notify(self, conn: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        # Формат: "тема<TAB>ключ<TAB>кадр" - кадр передается подписчикам как есть
+        try:
+            topic, key, frame = payload.split("\t", 2)
+            key = int(key)
+        except ValueError as e:
+            self.errors += 1
+            logger.error(f"Некорректное событие в канале {channel}: {e}")
+            return
+        self._dispatch(topic, key, frame)
+
+    async def publish(self, topic: str, key: int, data: Any) -> None:
+        self.published += 1
+        frame = encode_frame(data)
+        payload = f"{topic}\t{key}\t{frame}"
+        if len(payload.encode()) > self.PAYLOAD_LIMIT:
+            logger.warning(f"Событие {topic}:{key} больше лимита NOTIFY, доставлено только локально")
+            self.local_only += 1
+            self._dispatch(topic, key, frame)
+            return
+
+        conn = self._conn
+        if conn is None:
+            self.local_only += 1
+            self._dispatch(topic, key, frame)
+            return
+        try:
+            async with self._lock:
+                await conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+        except Exception as e:
+            self.errors += 1
+            self.local_only += 1
+            logger.error(f"Ошибка NOTIFY в канал {self.channel}: {e}")
+            self._dispatch(topic, key, frame)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "channel": self.channel,
+            "connected": self._conn is not None and not self._conn.is_closed(),
+            "local_only": self.local_only,
+        }
+
+
+def create_broadcast() -> BroadcastBackend:
+    if settings.BROADCAST_BACKEND == "postgres":
+        dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+        return PostgresBroadcast(dsn.render_as_string(hide_password=False), settings.BROADCAST_CHANNEL)
+    return InMemoryBroadcast()
+
+
+broadcast = create_broadcast()
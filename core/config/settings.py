@@ -1,17 +1,59 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyUrl
+from typing import Literal
 import os
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_READ_URL: str | None = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
     CALLBACK_URL: str
     SEVSU_CLIENT_ID: str
     SEVSU_CLIENT_SECRET: str
     SEVSU_AUTH_URL: str = "https://auth.sevsu.ru/realms/portal/protocol/openid-connect/auth"
     SEVSU_TOKEN_URL: str = "https://auth.sevsu.ru/realms/portal/protocol/openid-connect/token"
     SEVSU_USERINFO_URL: str = "https://auth.sevsu.ru/realms/portal/protocol/openid-connect/userinfo"
+    SEVSU_JWKS_URL: str = "https://auth.sevsu.ru/realms/portal/protocol/openid-connect/certs"
+    SEVSU_ISSUER: str = "https://auth.sevsu.ru/realms/portal"
+    SEVSU_VERIFY_ID_TOKEN: bool = False
+    SEVSU_JWKS_CACHE_SECONDS: int = 3600
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+    TOKEN_CLEANUP_BATCH_SIZE: int = 5000
+    TOKEN_CLEANUP_INTERVAL_MINUTES: int = 60
+    PASSWORD_HASH_WORKERS: int = 4
+    DEBUG: bool = False
+    QUERY_REPEAT_WARN_THRESHOLD: int = 5
+
+    HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_SLOW_CONSUMER_POLICY: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+    # Ping/pong на уровне протокола (uvicorn): полуоткрытые сокеты закрываются без ответа на ping
+    WS_PING_INTERVAL_SECONDS: float = 20.0
+    WS_PING_TIMEOUT_SECONDS: float = 20.0
+    # 0 - не закрывать сокеты, от которых давно не было входящих кадров
+    WS_IDLE_TIMEOUT_SECONDS: float = 0
+    WS_REAP_INTERVAL_SECONDS: int = 30
+    WS_MAX_CONNECTIONS_PER_USER: int = 10
+    WS_MAX_CONNECTIONS: int = 10000
+    # Групповая запись сообщений чата: окно ожидания пачки и ее предельный размер
+    CHAT_BATCH_WINDOW_MS: float = 5.0
+    CHAT_BATCH_MAX_SIZE: int = 100
+    CHAT_SENDER_NAME_CACHE_SIZE: int = 10000
+    CHAT_SENDER_NAME_CACHE_TTL_SECONDS: int = 300
+    BROADCAST_BACKEND: Literal["memory", "postgres"] = "memory"
+    BROADCAST_CHANNEL: str = "tasktracker_events"
 
     MINIO_ROOT_USER: str = "minioadmin"
     MINIO_ROOT_PASSWORD: str = "minioadmin"
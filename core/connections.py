@@ -0,0 +1,288 @@
+"""Реестр WebSocket-соединений с собственной очередью отправки у каждого клиента.
+
+Рассылка только кладет кадр в очереди получателей и не ждет сети: каждое
+соединение отправляет свои кадры отдельной задачей. Очередь ограничена
+(WS_SEND_QUEUE_SIZE); если клиент не успевает читать, политика
+WS_SLOW_CONSUMER_POLICY либо вытесняет самый старый кадр (drop_oldest),
+либо закрывает соединение (disconnect).
+
+Кадр кодируется в JSON один раз (orjson, если установлен) и одна и та же
+строка отправляется всем получателям через send_text.
+
+Число соединений ограничено на пользователя и на процесс: место занимается
+reserve() до accept(), поэтому одновременные рукопожатия не превышают лимит.
+reap() периодически
+снимает закрытые сокеты и, если задан тайм-аут, молчащие дольше него.
+"""
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from typing import Any, Hashable, Optional
+
+from fastapi import WebSocket, status
+from starlette.websockets import WebSocketState
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+
+def encode_frame(data: Any) -> str:
+    """JSON-текст кадра, как его отправил бы WebSocket.send_json"""
+    if isinstance(data, str):
+        return data
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class ClientConnection:
+    """Соединение клиента: очередь исходящих кадров и задача, которая ее отправляет"""
+
+    def __init__(
+        self,
+        registry: "ConnectionRegistry",
+        key: Hashable,
+        websocket: WebSocket,
+        user_id: Optional[int] = None
+    ):
+        self.registry = registry
+        self.key = key
+        self.websocket = websocket
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=registry.queue_size)
+        self.dropped = 0
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self._closing: asyncio.Task | None = None
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def touch(self) -> None:
+        """Отмечает входящий кадр от клиента"""
+        self.last_seen = time.monotonic()
+
+    @property
+    def disconnected(self) -> bool:
+        return WebSocketState.DISCONNECTED in (
+            getattr(self.websocket, "client_state", None),
+            getattr(self.websocket, "application_state", None),
+        )
+
+    def enqueue(self, frame: str) -> bool:
+        """Кладет кадр в очередь без ожидания; False, если кадр не будет отправлен"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.registry.policy == DISCONNECT:
+            logger.warning(f"Клиент {self.key} не успевает читать ({self.queue.qsize()} кадров), соединение закрыто")
+            self.registry.slow_disconnects += 1
+            self.abort(status.WS_1013_TRY_AGAIN_LATER)
+            return False
+
+        self.queue.get_nowait()
+        self.queue.put_nowait(frame)
+        self.dropped += 1
+        self.registry.dropped_frames += 1
+        return True
+
+    def abort(self, code: int) -> None:
+        """Снимает соединение с рассылки и закрывает сокет в фоне"""
+        if self.closed:
+            return
+        self.closed = True
+        self.registry.discard(self)
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._closing = asyncio.create_task(self._close_socket(code))
+
+    async def close(self) -> None:
+        """Останавливает отправку; сокет уже закрыт клиентом или закрывается"""
+        self.closed = True
+        self.registry.discard(self)
+        self._writer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._writer
+        if self._closing is not None:
+            await self._closing
+
+    async def _write_loop(self) -> None:
+        while True:
+            frame = await self.queue.get()
+            try:
+                await self.websocket.send_text(frame)
+            except Exception as e:
+                logger.error(f"Ошибка отправки клиенту {self.key}: {e}")
+                self.abort(status.WS_1011_INTERNAL_ERROR)
+                return
+
+    async def _close_socket(self, code: int) -> None:
+        with contextlib.suppress(Exception):
+            await self.websocket.close(code=code)
+
+
+class ConnectionRegistry:
+    """Соединения, сгруппированные по ключу (проект, пользователь)"""
+
+    # Открытые соединения всех реестров процесса, для ограничения max_total
+    open_connections = 0
+
+    def __init__(
+        self,
+        queue_size: int,
+        policy: str = DROP_OLDEST,
+        max_per_user: int = 0,
+        max_total: int = 0
+    ):
+        if policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.queue_size = queue_size
+        self.policy = policy
+        self.max_per_user = max_per_user
+        self.max_total = max_total
+        self.groups: dict[Hashable, dict[WebSocket, ClientConnection]] = {}
+        self.user_connections: dict[int, int] = {}
+        self.dropped_frames = 0
+        self.slow_disconnects = 0
+        self.rejected = 0
+        self.reaped = 0
+
+    def reserve(self, user_id: Optional[int]) -> Optional[str]:
+        """Занимает место под новое соединение; причина отказа или None.
+
+        Занятое место забирает add(..., reserved=True) или освобождает release().
+        """
+        if self.max_total and ConnectionRegistry.open_connections >= self.max_total:
+            return "Too many connections"
+        if self.max_per_user and user_id is not None and self.user_connections.get(user_id, 0) >= self.max_per_user:
+            return "Too many connections for user"
+        self._count(user_id, 1)
+        return None
+
+    def release(self, user_id: Optional[int]) -> None:
+        """Освобождает место, занятое reserve(), если соединение не состоялось"""
+        self._count(user_id, -1)
+
+    def _count(self, user_id: Optional[int], delta: int) -> None:
+        ConnectionRegistry.open_connections += delta
+        if user_id is not None:
+            remaining = self.user_connections.get(user_id, 0) + delta
+            if remaining > 0:
+                self.user_connections[user_id] = remaining
+            else:
+                self.user_connections.pop(user_id, None)
+
+    def add(
+        self,
+        key: Hashable,
+        websocket: WebSocket,
+        user_id: Optional[int] = None,
+        reserved: bool = False
+    ) -> ClientConnection:
+        group = self.groups.setdefault(key, {})
+        connection = group.get(websocket)
+        if connection is None:
+            connection = group[websocket] = ClientConnection(self, key, websocket, user_id)
+            if not reserved:
+                self._count(user_id, 1)
+        elif reserved:
+            self.release(user_id)
+        return connection
+
+    def get(self, key: Hashable, websocket: WebSocket) -> Optional[ClientConnection]:
+        return self.groups.get(key, {}).get(websocket)
+
+    async def remove(self, key: Hashable, websocket: WebSocket) -> None:
+        connection = self.groups.get(key, {}).get(websocket)
+        if connection is not None:
+            await connection.close()
+
+    async def close_all(self, code: int = status.WS_1001_GOING_AWAY) -> None:
+        connections = [c for group in self.groups.values() for c in group.values()]
+        for connection in connections:
+            connection.abort(code)
+        for connection in connections:
+            await connection.close()
+
+    def discard(self, connection: ClientConnection) -> None:
+        group = self.groups.get(connection.key)
+        if group is None or group.get(connection.websocket) is not connection:
+            return
+        del group[connection.websocket]
+        if not group:
+            del self.groups[connection.key]
+        self._count(connection.user_id, -1)
+
+    def close_user(self, key: Hashable, user_id: int, code: int) -> int:
+        """Закрывает сокеты пользователя в группе; возвращает их число"""
+        connections = [c for c in self.groups.get(key, {}).values() if c.user_id == user_id]
+        for connection in connections:
+            connection.abort(code)
+        return len(connections)
+
+    def reap(self, idle_timeout: float = 0) -> int:
+        """Снимает закрытые сокеты и молчащие дольше idle_timeout секунд (0 - без тайм-аута)"""
+        now = time.monotonic()
+        reaped = 0
+        for group in list(self.groups.values()):
+            for connection in list(group.values()):
+                if connection.disconnected:
+                    connection.abort(status.WS_1001_GOING_AWAY)
+                elif idle_timeout and now - connection.last_seen > idle_timeout:
+                    logger.info(f"Соединение {connection.key} молчит {now - connection.last_seen:.0f}s, закрыто")
+                    connection.abort(status.WS_1001_GOING_AWAY)
+                else:
+                    continue
+                reaped += 1
+        self.reaped += reaped
+        return reaped
+
+    def broadcast(self, key: Hashable, frame: Any) -> int:
+        """Ставит кадр в очереди всех соединений группы; возвращает число получателей"""
+        group = self.groups.get(key)
+        if not group:
+            return 0
+        frame = encode_frame(frame)
+        delivered = 0
+        for connection in list(group.values()):
+            if connection.enqueue(frame):
+                delivered += 1
+        return delivered
+
+    def count(self, key: Hashable) -> int:
+        return len(self.groups.get(key, ()))
+
+    def group_summary(self) -> dict[str, int]:
+        """Сводка по группам без их ключей: число групп и самая большая из них"""
+        return {
+            "groups": len(self.groups),
+            "max_per_group": max((len(group) for group in self.groups.values()), default=0),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        depths = [c.queue.qsize() for group in self.groups.values() for c in group.values()]
+        return {
+            "connections": len(depths),
+            "groups": len(self.groups),
+            "queued_frames": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "queue_size": self.queue_size,
+            "policy": self.policy,
+            "dropped_frames": self.dropped_frames,
+            "slow_disconnects": self.slow_disconnects,
+            "rejected": self.rejected,
+            "reaped": self.reaped,
+            "process_connections": ConnectionRegistry.open_connections,
+        }
@@ -1,3 +1,6 @@
+from typing import AsyncGenerator
+
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
@@ -5,12 +8,25 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import declarative_base
 from core.config.settings import settings
+from core.db import query_stats  # noqa: F401 - регистрирует события движка
+
+
+def _create_engine(url: str):
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
 
 # Асинхронный движок
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False
-)
+engine = _create_engine(settings.DATABASE_URL)
+
+# Движок реплики для чтения; без DATABASE_READ_URL чтение идет через основной
+read_engine = _create_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else engine
 
 # Асинхронная фабрика сессий
 AsyncSessionLocal = async_sessionmaker(
@@ -20,8 +36,42 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
 Base = declarative_base()
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+def get_session_factory() -> async_sessionmaker:
+    """Фабрика сессий для долгих соединений (WebSocket).
+
+    Такие обработчики открывают сессию только на время одной операции, чтобы
+    не держать соединение пула всю жизнь сокета.
+    """
+    return AsyncSessionLocal
+
+async def get_read_db(
+    session: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия для тяжелых чтений (списки, поиск, отчеты).
+
+    Если DATABASE_READ_URL не задан, возвращается основная сессия запроса.
+    Репозитории, созданные без read_session, тоже читают через основную сессию.
+    """
+    if read_engine is engine:
+        yield session
+        return
+    async with ReadSessionLocal() as read_session:
+        yield read_session
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
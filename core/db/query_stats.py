@@ -0,0 +1,93 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Счетчик SQL-запросов в рамках одного запроса API.
+
+    Статистика наполняется событиями движка SQLAlchemy. Форма запроса - это
+    текст SQL с плейсхолдерами, поэтому одинаковые запросы с разными
+    параметрами (типичный N+1) группируются в одну запись.
+    """
+
+    def __init__(self, request_id: Optional[str] = None, parent: Optional["QueryStats"] = None):
+        self.request_id = request_id
+        self.parent = parent
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.statements[_WHITESPACE.sub(" ", statement).strip()] += 1
+        if self.parent is not None:
+            self.parent.record(statement, duration_ms)
+
+    def repeated(self, threshold: int = 2) -> list[tuple[str, int]]:
+        """Формы запросов, выполненные не меньше threshold раз, по убыванию"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def as_log_fields(self, threshold: int = 2) -> dict:
+        return {
+            "query_count": self.count,
+            "db_time_ms": round(self.total_ms, 2),
+            "repeated_statements": [
+                {"count": n, "statement": sql[:200]} for sql, n in self.repeated(threshold)[:5]
+            ],
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries(request_id: Optional[str] = None) -> Iterator[QueryStats]:
+    """Собирает статистику запросов текущего контекста.
+
+    Вложенный track_queries дублирует записи во внешний, так что счетчик
+    теста видит запросы, сделанные внутри middleware.
+    """
+    stats = QueryStats(request_id, parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    if context.connection is not None:
+        start_times = context.connection.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
@@ -0,0 +1,88 @@
+import functools
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+AfterCommitCallback = Callable[[], Union[Awaitable[Any], Any]]
+
+_STATE_KEY = "unit_of_work"
+
+
+class UnitOfWork:
+    """Единица работы поверх сессии запроса.
+
+    Репозитории только делают flush, коммит выполняет самый внешний
+    UnitOfWork сессии: вложенные вызовы сервисов (например, TaskService ->
+    ActivityService -> NotificationService) присоединяются к нему, поэтому
+    вызов сервиса фиксируется одним коммитом. При исключении транзакция
+    откатывается целиком.
+
+    Побочные эффекты вне БД (рассылка по WebSocket, сброс кэшей)
+    регистрируются через after_commit и выполняются после успешного коммита.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _state(self) -> dict:
+        return self.session.info.setdefault(_STATE_KEY, {"depth": 0, "after_commit": []})
+
+    @property
+    def active(self) -> bool:
+        return self._state()["depth"] > 0
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._state()["depth"] += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        state = self._state()
+        state["depth"] -= 1
+        if state["depth"] > 0:
+            return False
+
+        callbacks, state["after_commit"] = state["after_commit"], []
+        if exc_type is not None:
+            await self.session.rollback()
+            return False
+
+        try:
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+        for callback in callbacks:
+            try:
+                await _invoke(callback)
+            except Exception as e:
+                logger.error(f"Ошибка в обработчике после коммита: {e}")
+        return False
+
+    async def after_commit(self, callback: AfterCommitCallback) -> None:
+        """Откладывает callback до коммита; вне транзакции выполняет сразу"""
+        if self.active:
+            self._state()["after_commit"].append(callback)
+        else:
+            await _invoke(callback)
+
+
+async def _invoke(callback: AfterCommitCallback) -> None:
+    result = callback()
+    if inspect.isawaitable(result):
+        await result
+
+
+def transactional(method):
+    """Выполняет метод сервиса внутри self.uow"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        async with self.uow:
+            return await method(self, *args, **kwargs)
+
+    return wrapper
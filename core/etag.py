@@ -0,0 +1,60 @@
+import hashlib
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import get_read_db
+from core.permissions import PermissionContext, get_permission_context
+from repositories.project_repository import ProjectRepository
+
+
+def make_etag(collection: str, project_id: int, version: int, query: str = "") -> str:
+    """Слабый ETag коллекции проекта; параметры запроса (фильтры, курсор) входят в хэш"""
+    digest = hashlib.blake2s(query.encode(), digest_size=6).hexdigest()
+    return f'W/"{collection}-{project_id}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Слабое сравнение из RFC 9110: W/ не учитывается"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def project_etag(
+    collection: str,
+    has_access: Callable[[PermissionContext, int], bool] = PermissionContext.is_member
+):
+    """Зависимость условного GET для коллекции проекта.
+
+    Читает projects.data_version, который триггеры увеличивают при изменении
+    задач, колонок, спринтов и имен исполнителей, и отвечает 304 до загрузки строк.
+    Версия читается из той же реплики и раньше самих строк, поэтому ETag
+    никогда не опережает отданные данные. Без доступа проверка пропускается -
+    ошибку вернет сервис.
+    """
+
+    async def dependency(
+        project_id: int,
+        request: Request,
+        response: Response,
+        permissions: PermissionContext = Depends(get_permission_context),
+        read_session: AsyncSession = Depends(get_read_db)
+    ) -> None:
+        if not has_access(permissions, project_id):
+            return
+
+        version = await ProjectRepository(read_session).get_data_version(project_id)
+        if version is None:
+            return
+
+        etag = make_etag(collection, project_id, version, request.url.query)
+        if etag_matches(request.headers.get("If-None-Match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+    return dependency
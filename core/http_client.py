@@ -0,0 +1,44 @@
+from typing import Optional
+
+import httpx
+
+from core.config.settings import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.HTTP_TIMEOUT_SECONDS,
+            connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS
+        )
+    )
+
+
+async def init_http_client() -> None:
+    """Создает общий HTTP-клиент на время жизни приложения"""
+    global _client
+    if _client is None:
+        _client = create_http_client()
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Общий клиент с пулом keep-alive соединений к внешним сервисам"""
+    global _client
+    if _client is None:
+        # lifespan не запускался (например, в тестах через ASGITransport)
+        _client = create_http_client()
+    return _client
@@ -49,6 +49,10 @@ class JsonFormatter(logging.Formatter):
             # Удаляем None значения
             log_obj['request'] = {k: v for k, v in log_obj['request'].items() if v is not None}
                 
+        # Статистика SQL-запросов, собранная RequestLoggingMiddleware
+        if hasattr(record, 'db'):
+            log_obj['db'] = record.db
+
         # Добавляем информацию об ошибке если есть
         if record.exc_info:
             log_obj['error'] = {
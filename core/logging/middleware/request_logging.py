@@ -1,10 +1,13 @@
 import logging
 import threading
+import uuid
 from time import time
 from typing import Optional
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from core.config.settings import settings
+from core.db.query_stats import QueryStats, track_queries
 from ..constants import SKIP_ROUTES, IMPORTANT_ROUTES, HTTP_METHODS_LOG_LEVELS
 
 logger = logging.getLogger(__name__)
@@ -34,15 +37,36 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             self._metrics[path]["count"] += 1
             self._metrics[path]["total_time"] += duration
 
+    def _check_repeated_queries(self, request_id: str, method: str, path: str, stats: QueryStats):
+        repeated = stats.repeated(settings.QUERY_REPEAT_WARN_THRESHOLD)
+        if repeated:
+            logger.warning(
+                f"Возможный N+1 в {method} {path}: запрос повторен {repeated[0][1]} раз",
+                extra={
+                    "request": {"id": request_id, "method": method, "path": path},
+                    "db": stats.as_log_fields(settings.QUERY_REPEAT_WARN_THRESHOLD)
+                }
+            )
+
     async def dispatch(self, request: Request, call_next):
         path = request.url.path
         method = request.method
+        request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        request.state.request_id = request_id
         
         log_level = self._should_log(path, method)
         start_time = time()
 
         try:
-            response = await call_next(request)
+            with track_queries(request_id) as stats:
+                response = await call_next(request)
+
+            self._check_repeated_queries(request_id, method, path, stats)
+            if settings.DEBUG:
+                response.headers["X-Request-ID"] = request_id
+                response.headers["X-DB-Query-Count"] = str(stats.count)
+                response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.2f}"
+                response.headers["X-DB-Max-Repeats"] = str(max(stats.statements.values(), default=0))
             
             if log_level is not None:
                 duration = time() - start_time
@@ -55,12 +79,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                     f"{method} {path}",
                     extra={
                         "request": {
-                            "id": getattr(request.state, "request_id", None),
+                            "id": request_id,
                             "method": method,
                             "path": path,
                             "duration": f"{duration:.3f}s",
                             "status": response.status_code
-                        }
+                        },
+                        "db": stats.as_log_fields()
                     }
                 )
             
@@ -72,7 +97,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 f"Ошибка в {method} {path}: {str(e)}",
                 extra={
                     "request": {
-                        "id": getattr(request.state, "request_id", None),
+                        "id": request_id,
                         "method": method,
                         "path": path,
                         "duration": f"{duration:.3f}s"
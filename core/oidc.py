@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+import httpx
+from jose import JWTError, jwt
+
+from core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JwksCache:
+    """Кэш ключей подписи провайдера (JWKS) с периодическим обновлением"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._keys: dict[str, dict] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, kid: Optional[str]) -> bool:
+        # Отсутствие kid в свежем кэше тоже повод обновиться:
+        # провайдер мог сменить ключ раньше истечения кэша
+        return time.monotonic() < self._expires_at and kid in self._keys
+
+    async def get_key(self, client: httpx.AsyncClient, kid: Optional[str]) -> Optional[dict]:
+        if not self._is_fresh(kid):
+            await self._refresh(client, kid)
+        return self._keys.get(kid)
+
+    async def _refresh(self, client: httpx.AsyncClient, kid: Optional[str]) -> None:
+        async with self._lock:
+            if self._is_fresh(kid):
+                return
+            response = await client.get(settings.SEVSU_JWKS_URL)
+            response.raise_for_status()
+            self._keys = {key.get("kid"): key for key in response.json().get("keys", [])}
+            self._expires_at = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        self._keys = {}
+        self._expires_at = 0.0
+
+
+jwks_cache = JwksCache(settings.SEVSU_JWKS_CACHE_SECONDS)
+
+
+async def verify_id_token(
+    client: httpx.AsyncClient,
+    id_token: str,
+    access_token: str
+) -> Optional[dict[str, Any]]:
+    """Проверяет ID token провайдера локально по закэшированным ключам.
+
+    Возвращает claims или None, если токен проверить не удалось - тогда
+    вызывающий код должен запросить userinfo.
+    """
+    try:
+        header = jwt.get_unverified_header(id_token)
+        key = await jwks_cache.get_key(client, header.get("kid"))
+        if key is None:
+            logger.warning(f"Неизвестный ключ подписи ID token: kid={header.get('kid')}")
+            return None
+        return jwt.decode(
+            id_token,
+            key,
+            algorithms=[key.get("alg", "RS256")],
+            audience=settings.SEVSU_CLIENT_ID,
+            issuer=settings.SEVSU_ISSUER,
+            access_token=access_token
+        )
+    except (JWTError, httpx.HTTPError) as e:
+        logger.warning(f"Не удалось проверить ID token локально: {e}")
+        return None
@@ -0,0 +1,111 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Generic, NamedTuple, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import tuple_
+
+T = TypeVar("T")
+
+Cursor = tuple[datetime, int]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+MAX_PAGE_SIZE = 100
+
+
+class Page(NamedTuple, Generic[T]):
+    items: list[T]
+    next_cursor: Optional[str]
+
+
+def _encode(payload: list) -> str:
+    raw = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    payload = json.loads(raw)
+    if not isinstance(payload, list):
+        raise ValueError("cursor payload must be a list")
+    return payload
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    return _encode([created_at.isoformat(), id])
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Разбирает курсор из запроса; некорректный курсор - ошибка 400"""
+    if not cursor:
+        return None
+    try:
+        created_at, id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+
+
+def encode_sort_cursor(sort: str, value: Any, id: int) -> str:
+    """Курсор для произвольной сортировки: ключ сортировки, значение и id последней строки"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Enum):
+        value = value.value
+    return _encode([sort, value, id])
+
+
+def decode_sort_cursor(cursor: Optional[str], sort: str) -> Optional[tuple[Any, int]]:
+    """Значение и id из курсора; курсор от другой сортировки - ошибка 400.
+
+    Значение возвращается в JSON-виде, привести его к типу колонки - задача
+    вызывающего кода.
+    """
+    if not cursor:
+        return None
+    try:
+        cursor_sort, value, id = _decode(cursor)
+        if cursor_sort != sort:
+            raise ValueError("cursor belongs to another sort order")
+        return value, int(id)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+
+
+def keyset_before(created_at_column, id_column, cursor: Cursor):
+    """Условие "строго после курсора" для сортировки (created_at DESC, id DESC)"""
+    return tuple_(created_at_column, id_column) < tuple_(*cursor)
+
+
+def paginate(rows: Sequence[T], limit: int, cursor_for: Optional[Callable[[T], str]] = None) -> Page[T]:
+    """Строит страницу из limit + 1 строк: лишняя строка означает, что есть продолжение.
+
+    По умолчанию курсор строится по (created_at, id) последней строки.
+    """
+    items = list(rows[:limit])
+    if len(rows) > limit and items:
+        last = items[-1]
+        if cursor_for is not None:
+            return Page(items, cursor_for(last))
+        return Page(items, encode_cursor(last.created_at, last.id))
+    return Page(items, None)
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def page_limit(limit: int = Query(50, ge=1)) -> int:
+    """Размер страницы курсорного списка: больший limit урезается до MAX_PAGE_SIZE, а не отклоняется"""
+    return min(limit, MAX_PAGE_SIZE)
@@ -0,0 +1,30 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+from core.config.settings import settings
+
+# Один контекст на процесс: построение CryptContext не бесплатно
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt отпускает GIL, поэтому пула потоков достаточно, чтобы не блокировать
+# event loop; max_workers ограничивает число одновременных хэширований
+_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, pwd_context.verify, plain_password, hashed_password)
+
+
+def shutdown_password_executor() -> None:
+    _executor.shutdown(wait=False, cancel_futures=True)
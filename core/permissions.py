@@ -0,0 +1,72 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db import get_db
+from core.security import get_current_user
+from models.domain.user_project import Role
+from models.schemas.users import UserResponse
+from repositories.project_repository import ProjectRepository
+
+LEADER_ROLES = {Role.OWNER, Role.ADMIN}
+
+
+class PermissionContext:
+    """Права текущего пользователя в рамках одного запроса.
+
+    Все роли пользователя загружаются из user_project одним запросом,
+    дальнейшие проверки отвечают из памяти.
+    """
+
+    def __init__(self, user_id: int, roles: dict[int, Role], global_role: Optional[str] = None):
+        self.user_id = user_id
+        self.roles = roles
+        self.global_role = global_role
+
+    @classmethod
+    async def load(cls, project_repo: ProjectRepository, user: UserResponse) -> "PermissionContext":
+        roles = await project_repo.get_user_roles(user.id)
+        return cls(user.id, roles, user.role)
+
+    def role_in(self, project_id: int) -> Optional[Role]:
+        return self.roles.get(project_id)
+
+    def is_member(self, project_id: int) -> bool:
+        return project_id in self.roles
+
+    def is_owner(self, project_id: int) -> bool:
+        return self.roles.get(project_id) == Role.OWNER
+
+    def is_leader(self, project_id: int) -> bool:
+        return self.roles.get(project_id) in LEADER_ROLES
+
+    @property
+    def is_teacher(self) -> bool:
+        return self.global_role == "teacher" or Role.TEACHER in self.roles.values()
+
+    async def require_member(self, project_repo: ProjectRepository, project_id: int) -> None:
+        """403, если пользователь не участник проекта, и 404, если проекта нет.
+
+        Участнику отвечает из памяти; для остальных - один EXISTS по projects,
+        чтобы отличить чужой проект от несуществующего.
+        """
+        if self.is_member(project_id):
+            return
+
+        if not await project_repo.exists(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this project"
+        )
+
+
+async def get_permission_context(
+    current_user: UserResponse = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db)
+) -> PermissionContext:
+    return await PermissionContext.load(ProjectRepository(session), current_user)
@@ -1,9 +1,15 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from dependencies import get_db
+from apscheduler.triggers.interval import IntervalTrigger
+from core.config.settings import settings
+from dependencies import get_db, get_notification_manager
+from services.auth_service import AuthService
+from services.message_service import MessageService
 from services.notification_service import NotificationService
 from repositories.notification_repository import NotificationRepository
+from repositories.user_repository import UserRepository
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -11,12 +17,34 @@ async def cleanup_notifications():
     """Периодическая задача очистки старых уведомлений"""
     try:
         async for db in get_db():
-            service = NotificationService(NotificationRepository(db))
+            service = NotificationService(NotificationRepository(db), get_notification_manager())
             deleted_count = await service.cleanup_old_notifications()
             logger.info(f"Удалено {deleted_count} старых уведомлений")
     except Exception as e:
         logger.error(f"Ошибка при очистке уведомлений: {e}")
 
+async def cleanup_tokens():
+    """Периодическая задача удаления истекших и отозванных токенов"""
+    start_time = time.monotonic()
+    try:
+        async for db in get_db():
+            service = AuthService(UserRepository(db))
+            deleted_count = await service.cleanup_expired_tokens()
+            duration_ms = (time.monotonic() - start_time) * 1000
+            logger.info(
+                f"Удалено {deleted_count} истекших токенов за {duration_ms:.0f}ms",
+                extra={"deleted_count": deleted_count, "duration_ms": round(duration_ms, 2)}
+            )
+    except Exception as e:
+        logger.error(f"Ошибка при очистке токенов: {e}")
+
+async def reap_websockets():
+    """Периодическое снятие закрытых и молчащих WebSocket-соединений"""
+    registries = (MessageService.connections, get_notification_manager().connections)
+    reaped = sum(registry.reap(settings.WS_IDLE_TIMEOUT_SECONDS) for registry in registries)
+    if reaped:
+        logger.info(f"Закрыто {reaped} неактивных WebSocket-соединений")
+
 def setup_scheduler():
     """Настройка планировщика задач"""
     scheduler = AsyncIOScheduler()
@@ -27,6 +55,20 @@ def setup_scheduler():
         id="cleanup_notifications",
         replace_existing=True
     )
+
+    scheduler.add_job(
+        cleanup_tokens,
+        IntervalTrigger(minutes=settings.TOKEN_CLEANUP_INTERVAL_MINUTES),
+        id="cleanup_tokens",
+        replace_existing=True
+    )
+
+    scheduler.add_job(
+        reap_websockets,
+        IntervalTrigger(seconds=settings.WS_REAP_INTERVAL_SECONDS),
+        id="reap_websockets",
+        replace_existing=True
+    )
     
     scheduler.start()
-    return scheduler
\ No newline at end of file
+    return scheduler
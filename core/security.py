@@ -1,20 +1,47 @@
+import hashlib
+import time
+
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends, HTTPException, status
 from jose import JWTError, jwt
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.websockets import WebSocket
 
-from core.db import get_db
+from core.cache import TTLCache
+from core.db import get_db, get_session_factory
 from core.config.settings import settings
 from repositories.user_repository import UserRepository
 from models.schemas.users import UserResponse
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login/local")
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: AsyncSession = Depends(get_db)
-) -> UserResponse:
+# Кэш проверенных токенов: token -> UserResponse.
+# Запись живет не дольше exp токена и не дольше TOKEN_CACHE_TTL_SECONDS,
+# чтобы отзыв токена на другом воркере применялся с ограниченной задержкой.
+token_cache: TTLCache[UserResponse] = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+
+def get_token_key(token: str, payload: dict) -> str:
+    """Компактный ключ токена в таблице tokens.
+
+    Новые токены несут claim jti; для токенов, выданных до его появления,
+    используется md5 от строки токена (так же заполнена миграция).
+    """
+    return payload.get("jti") or hashlib.md5(token.encode()).hexdigest()
+
+
+def invalidate_token(token: str) -> None:
+    token_cache.pop(token)
+
+
+def invalidate_user(user_id: int) -> None:
+    token_cache.remove_where(lambda _, user: user.id == user_id)
+
+
+async def authenticate_token(token: str, session: AsyncSession) -> UserResponse:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -29,11 +56,15 @@ async def get_current_user(
         user_id = int(payload.get("sub"))
         if user_id is None:
             raise credentials_exception
-    except (JWTError, ValueError):
+    except (JWTError, ValueError, TypeError):
         raise credentials_exception
 
+    cached_user = token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     user_repo = UserRepository(session)
-    token_db = await user_repo.get_token(token)
+    token_db = await user_repo.get_token(get_token_key(token, payload))
     if not token_db or not token_db.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,13 +75,21 @@ async def get_current_user(
     user = await user_repo.get_by_id(user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    return UserResponse.model_validate(user)
+
+    token_cache.set(token, user, ttl=payload["exp"] - time.time())
+    return user
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db)
+) -> UserResponse:
+    return await authenticate_token(token, session)
 
 
 async def get_current_user_websocket(
         websocket: WebSocket,
-        session: AsyncSession = Depends(get_db)
+        session_factory: async_sessionmaker = Depends(get_session_factory)
 ) -> UserResponse:
     # Извлекаем токен из query-параметров
     token = websocket.query_params.get("token")
@@ -59,28 +98,10 @@ async def get_current_user_websocket(
         raise HTTPException(status_code=401, detail="Missing token")
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id = int(payload.get("sub"))
-        if user_id is None:
-            await websocket.close(code=1008, reason="Invalid token")
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except (JWTError, ValueError):
-        await websocket.close(code=1008, reason="Invalid token")
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-    user_repo = UserRepository(session)
-    token_db = await user_repo.get_token(token)
-    if not token_db or not token_db.is_active:
-        await websocket.close(code=1008, reason="Token is invalid or revoked")
-        raise HTTPException(status_code=401, detail="Token is invalid or revoked")
-
-    user = await user_repo.get_by_id(user_id)
-    if user is None:
-        await websocket.close(code=1008, reason="User not found")
-        raise HTTPException(status_code=404, detail="User not found")
-
-    return UserResponse.model_validate(user)
\ No newline at end of file
+        # Сессия закрывается сразу после проверки токена и не живет вместе с сокетом
+        async with session_factory() as session:
+            return await authenticate_token(token, session)
+    except HTTPException as e:
+        reason = "Invalid token" if e.detail == "Could not validate credentials" else e.detail
+        await websocket.close(code=1008, reason=reason)
+        raise HTTPException(status_code=e.status_code, detail=reason)
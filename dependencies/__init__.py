@@ -1,3 +1,7 @@
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, Callable
+
+import httpx
 from fastapi import Depends
 from repositories.grading_repository import GradingRepository
 from repositories.project_repository import ProjectRepository
@@ -10,8 +14,10 @@ from repositories.message_repository import MessageRepository
 from repositories.notification_repository import NotificationRepository
 from repositories.activity_repository import ActivityRepository
 from services.auth_service import AuthService
+from services.board_service import BoardService
 from services.grading_service import GradingService
 from services.message_service import MessageService
+from services.message_writer import MessageBatchWriter
 from services.notification_service import NotificationService
 from services.notification_manager import NotificationManager
 from services.project_service import ProjectService
@@ -21,11 +27,17 @@ from services.task_column_service import TaskColumnService
 from services.task_service import TaskService
 from services.activity_service import ActivityService
 from services.user_service import UserService
-from core.db import get_db
+from core.db import get_db, get_read_db, get_session_factory
+from core.config.settings import settings
 from core.storage.service import StorageService
-from sqlalchemy.ext.asyncio import AsyncSession
+from core.http_client import get_http_client
+from core.broadcast import broadcast
+from core.permissions import PermissionContext, get_permission_context
+from core.security import get_current_user_websocket
+from models.schemas.users import UserResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-_notification_manager = NotificationManager()
+_notification_manager = NotificationManager(broadcast)
 _storage_service = StorageService()
 
 def get_notification_manager() -> NotificationManager:
@@ -34,25 +46,53 @@ def get_notification_manager() -> NotificationManager:
 def get_storage_service() -> StorageService:
     return _storage_service
 
+_message_writer: MessageBatchWriter | None = None
+
+def get_message_writer(
+    session_factory: async_sessionmaker = Depends(get_session_factory)
+) -> MessageBatchWriter:
+    """Общий для процесса писатель сообщений чата (создается при первом запросе)"""
+    global _message_writer
+    if _message_writer is None:
+        _message_writer = MessageBatchWriter(
+            session_factory,
+            window=settings.CHAT_BATCH_WINDOW_MS / 1000,
+            max_batch=settings.CHAT_BATCH_MAX_SIZE
+        )
+    return _message_writer
+
+async def close_message_writer() -> None:
+    if _message_writer is not None:
+        await _message_writer.close()
+
+def message_writer_stats() -> dict | None:
+    return _message_writer.stats() if _message_writer is not None else None
+
 async def get_auth_service(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
+    http_client: httpx.AsyncClient = Depends(get_http_client)
 ) -> AuthService:
-    return AuthService(UserRepository(session))
+    return AuthService(UserRepository(session), http_client)
 
-async def get_notification_repository(db: AsyncSession = Depends(get_db)):
-    return NotificationRepository(db)
+async def get_notification_repository(
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db)
+):
+    return NotificationRepository(db, read_db)
 
 async def get_notification_service(
     session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
     manager: NotificationManager = Depends(get_notification_manager)
 ) -> NotificationService:
-    notification_repo = NotificationRepository(session)
+    notification_repo = NotificationRepository(session, read_session)
     return NotificationService(notification_repo, manager)
 
 async def get_activity_service(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_read_db)
 ) -> ActivityService:
-    activity_repo = ActivityRepository(db)
+    activity_repo = ActivityRepository(db, read_db)
     user_repo = UserRepository(db)
     column_repo = TaskColumnRepository(db)
     return ActivityService(activity_repo, user_repo, column_repo)
@@ -60,26 +100,30 @@ async def get_activity_service(
 async def get_project_service(
     session: AsyncSession = Depends(get_db),
     notification_service: NotificationService = Depends(get_notification_service),
-    storage_service: StorageService = Depends(get_storage_service)
+    storage_service: StorageService = Depends(get_storage_service),
+    permissions: PermissionContext = Depends(get_permission_context)
 ) -> ProjectService:
     project_repo = ProjectRepository(session)
     column_repo = TaskColumnRepository(session)
     user_repo = UserRepository(session)
-    return ProjectService(project_repo, notification_service, column_repo, storage_service, user_repo)
+    return ProjectService(project_repo, notification_service, column_repo, storage_service, user_repo, permissions)
 
 async def get_sprint_service(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
+    permissions: PermissionContext = Depends(get_permission_context)
 ) -> SprintService:
     sprint_repo = SprintRepository(session)
     project_repo = ProjectRepository(session)
-    return SprintService(sprint_repo, project_repo)
+    return SprintService(sprint_repo, project_repo, permissions)
 
 async def get_task_service(
     session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
     notification_observer: NotificationService = Depends(get_notification_service),
-    activity_service: ActivityService = Depends(get_activity_service)
+    activity_service: ActivityService = Depends(get_activity_service),
+    permissions: PermissionContext = Depends(get_permission_context)
 ) -> TaskService:
-    task_repo = TaskRepository(session)
+    task_repo = TaskRepository(session, read_session)
     project_repo = ProjectRepository(session)
     sprint_repo = SprintRepository(session)
     grading_repo = GradingRepository(session)
@@ -91,23 +135,65 @@ async def get_task_service(
         sprint_repo, 
         grading_service,
         notification_observer,
-        activity_service
+        activity_service,
+        permissions
     )
 
 def get_message_service(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
+    permissions: PermissionContext = Depends(get_permission_context),
+    message_writer: MessageBatchWriter = Depends(get_message_writer)
 ) -> MessageService:
-    message_repo = MessageRepository(session)
+    message_repo = MessageRepository(session, read_session)
     project_repo = ProjectRepository(session)
     user_repo = UserRepository(session)
-    return MessageService(message_repo, project_repo, user_repo)
+    return MessageService(message_repo, project_repo, user_repo, permissions, message_writer)
+
+MessageServiceFactory = Callable[[], AsyncContextManager[MessageService]]
+
+def get_message_service_websocket(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    current_user: UserResponse = Depends(get_current_user_websocket),
+    message_writer: MessageBatchWriter = Depends(get_message_writer)
+) -> MessageServiceFactory:
+    """Сервис чата на одну операцию сокета: сессия берется из пула и закрывается после нее.
+
+    Роли перечитываются на каждую операцию, чтобы исключенный из проекта
+    пользователь не писал в чат через уже открытый сокет.
+    """
+    @asynccontextmanager
+    async def message_service():
+        async with session_factory() as session:
+            message_repo = MessageRepository(session)
+            project_repo = ProjectRepository(session)
+            user_repo = UserRepository(session)
+            permissions = await PermissionContext.load(project_repo, current_user)
+            yield MessageService(message_repo, project_repo, user_repo, permissions, message_writer)
+
+    return message_service
+
+def get_board_service(
+    session: AsyncSession = Depends(get_db),
+    read_session: AsyncSession = Depends(get_read_db),
+    permissions: PermissionContext = Depends(get_permission_context)
+) -> BoardService:
+    # Доска только читает данные, поэтому все запросы идут в реплику
+    return BoardService(
+        TaskRepository(session, read_session),
+        TaskColumnRepository(read_session),
+        SprintRepository(read_session),
+        ProjectRepository(read_session),
+        permissions
+    )
 
 def get_task_column_service(
-    session: AsyncSession = Depends(get_db)
+    session: AsyncSession = Depends(get_db),
+    permissions: PermissionContext = Depends(get_permission_context)
 ) -> TaskColumnService:
     column_repo = TaskColumnRepository(session)
     project_repo = ProjectRepository(session)
-    return TaskColumnService(column_repo, project_repo)
+    return TaskColumnService(column_repo, project_repo, permissions)
 
 async def get_grading_service(
     session: AsyncSession = Depends(get_db),
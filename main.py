@@ -4,7 +4,13 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from core.config.settings import settings
 from core.handlers.exception_handlers import validation_exception_handler
+from core.passwords import shutdown_password_executor
+from core.http_client import init_http_client, close_http_client
+from core.db import dispose_engines
+from core.broadcast import broadcast
+from dependencies import close_message_writer
 from core.scheduler import setup_scheduler
 from core.logging.config import setup_logging
 from core.logging.middleware.request_logging import RequestLoggingMiddleware
@@ -15,7 +21,14 @@ from contextlib import asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_scheduler()
     setup_logging()
+    await init_http_client()
+    await broadcast.start()
     yield
+    await close_message_writer()
+    await broadcast.stop()
+    await close_http_client()
+    shutdown_password_executor()
+    await dispose_engines()
 
 
 # setup_logging()
@@ -37,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # @app.on_event("startup")
@@ -44,5 +58,11 @@ app.add_middleware(
 #     setup_scheduler()
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        ws_ping_interval=settings.WS_PING_INTERVAL_SECONDS,
+        ws_ping_timeout=settings.WS_PING_TIMEOUT_SECONDS
+    )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.ext.declarative import declarative_base
@@ -17,3 +17,7 @@ class Message(Base):
     project = relationship("Project", back_populates="messages")
     sender = relationship("User", back_populates="sent_messages")
 
+    __table_args__ = (
+        Index('ix_messages_project_created_id', project_id, created_at, id),
+    )
+
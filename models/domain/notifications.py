@@ -28,7 +28,7 @@ class Notification(Base):
     user = relationship("User", back_populates="notifications")
 
     __table_args__ = (
-        Index('ix_notifications_user_created', user_id, created_at), 
+        Index('ix_notifications_user_created_id', user_id, created_at, id),
         Index('ix_notifications_created_at', created_at.desc()),    
     )
 
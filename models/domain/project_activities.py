@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -17,4 +17,8 @@ class ProjectActivity(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     project = relationship("Project", back_populates="activities")
-    user = relationship("User", back_populates="activities")
\ No newline at end of file
+    user = relationship("User", back_populates="activities")
+
+    __table_args__ = (
+        Index('ix_project_activities_project_created_id', project_id, created_at, id),
+    )
\ No newline at end of file
@@ -1,8 +1,77 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, ForeignKey
+from sqlalchemy import DDL, BigInteger, Column, Integer, String, DateTime, event, func, ForeignKey
 from sqlalchemy.orm import relationship
 from core.db import Base
 from models.domain.user_project import user_project_table
 
+# Таблицы, изменения которых увеличивают projects.data_version
+VERSIONED_TABLES = ("tasks", "task_columns", "sprints")
+
+# Триггеры уровня оператора: одно обновление projects на оператор, а не на
+# каждую строку. UPDATE, который ничего не изменил, версию не увеличивает;
+# при переносе строки в другой проект меняются версии обоих проектов
+BUMP_PROJECT_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_project_data_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (SELECT project_id FROM new_rows);
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (SELECT project_id FROM old_rows);
+    ELSE
+        UPDATE projects SET data_version = data_version + 1
+        WHERE id IN (
+            SELECT unnest(ARRAY[o.project_id, n.project_id])
+            FROM old_rows o JOIN new_rows n ON n.id = o.id
+            WHERE o IS DISTINCT FROM n
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Списки задач показывают имя исполнителя (assignee_name), поэтому смена
+# имени пользователя увеличивает версии проектов с его задачами
+BUMP_ASSIGNEE_PROJECT_VERSION_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_assignee_project_data_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE projects SET data_version = data_version + 1
+    WHERE id IN (
+        SELECT t.project_id
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        JOIN tasks t ON t.assignee_id = n.id
+        WHERE (o.first_name, o.last_name) IS DISTINCT FROM (n.first_name, n.last_name)
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Таблицы переходов (REFERENCING) допускают только одно событие на триггер
+_TRANSITION_TABLES = {
+    "INSERT": "NEW TABLE AS new_rows",
+    "UPDATE": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+    "DELETE": "OLD TABLE AS old_rows",
+}
+
+
+def project_version_triggers(table: str) -> list[str]:
+    return [
+        f"CREATE TRIGGER {table}_bump_project_data_version_{action.lower()} "
+        f"AFTER {action} ON {table} REFERENCING {transition} "
+        f"FOR EACH STATEMENT EXECUTE FUNCTION bump_project_data_version()"
+        for action, transition in _TRANSITION_TABLES.items()
+    ]
+
+
+ASSIGNEE_VERSION_TRIGGER = (
+    "CREATE TRIGGER users_bump_assignee_project_data_version "
+    f"AFTER UPDATE ON users REFERENCING {_TRANSITION_TABLES['UPDATE']} "
+    "FOR EACH STATEMENT EXECUTE FUNCTION bump_assignee_project_data_version()"
+)
+
 class Project(Base):
     __tablename__ = "projects"
 
@@ -14,6 +83,8 @@ class Project(Base):
     end_date = Column(DateTime(timezone=True))
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_private = Column(Integer, default=0) 
+    # Версия задач, колонок и спринтов проекта для ETag; ведется триггерами
+    data_version = Column(BigInteger, nullable=False, server_default="0")
 
     owner = relationship("User", back_populates="projects_owned")
     sprints = relationship("Sprint", back_populates="project")
@@ -23,4 +94,14 @@ class Project(Base):
     columns = relationship("TaskColumn", back_populates="project")
     user_progress = relationship("UserProjectProgress", back_populates="project")
     activities = relationship("ProjectActivity", back_populates="project", cascade="all, delete-orphan")
-    reports = relationship("Report", back_populates="project")
\ No newline at end of file
+    reports = relationship("Report", back_populates="project")
+
+
+# Для create_all (тесты, бенчмарки): в БД триггеры создает миграция
+for _statement in (
+    BUMP_PROJECT_VERSION_FUNCTION,
+    BUMP_ASSIGNEE_PROJECT_VERSION_FUNCTION,
+    *(trigger for _table in VERSIONED_TABLES for trigger in project_version_triggers(_table)),
+    ASSIGNEE_VERSION_TRIGGER,
+):
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
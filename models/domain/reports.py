@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Date, func
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Date, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -20,4 +20,8 @@ class Report(Base):
 
     project_id = Column(Integer, ForeignKey('projects.id'))
 
-    project = relationship("Project", back_populates="reports")
\ No newline at end of file
+    project = relationship("Project", back_populates="reports")
+
+    __table_args__ = (
+        Index('ix_reports_project_created_id', project_id, created_at, id),
+    )
\ No newline at end of file
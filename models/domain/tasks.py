@@ -1,8 +1,9 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, Enum as SQLEnum, Integer, String, DateTime, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Enum as SQLEnum, Integer, String, DateTime, ForeignKey, Float, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from core.db import Base
 
@@ -38,6 +39,16 @@ class TaskCompletionStatus(str, Enum):
     NOT_COMPLETED = "not_completed"
 
 
+# Заголовок весит больше описания; русская и английская конфигурации
+# дают стемминг для обоих языков
+TASK_SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
 class Task(Base):
     __tablename__ = "tasks"
 
@@ -54,11 +65,13 @@ class Task(Base):
     start_date = Column(DateTime(timezone=True), nullable=True)
     completion_status = Column(SQLEnum(TaskCompletionStatus), nullable=True)
     score = Column(Float, nullable=True)
+    # Поисковый вектор считает сама БД; deferred - чтобы не грузить его с каждой задачей
+    search_vector = deferred(Column(TSVECTOR, Computed(TASK_SEARCH_VECTOR, persisted=True)))
 
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True)
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True) 
-    column_id = Column(Integer, ForeignKey("task_columns.id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False, index=True)
+    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True, index=True)
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    column_id = Column(Integer, ForeignKey("task_columns.id"), nullable=True, index=True)
 
     project = relationship("Project", back_populates="tasks")
     sprint = relationship("Sprint", back_populates="tasks")
@@ -67,6 +80,10 @@ class Task(Base):
     source_relations = relationship("TaskRelation", foreign_keys="[TaskRelation.source_task_id]", back_populates="source_task", cascade="all, delete")
     target_relations = relationship("TaskRelation", foreign_keys="[TaskRelation.target_task_id]", back_populates="target_task", cascade="all, delete")
 
+    __table_args__ = (
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 
 class TaskRelation(Base):
     __tablename__ = "task_relations"
@@ -80,6 +97,11 @@ class TaskRelation(Base):
     source_task = relationship("Task", foreign_keys=[source_task_id], back_populates="source_relations")
     target_task = relationship("Task", foreign_keys=[target_task_id], back_populates="target_relations")
 
+    __table_args__ = (
+        Index('ix_task_relations_source_target', source_task_id, target_task_id),
+        Index('ix_task_relations_target_task_id', target_task_id),
+    )
+
 
 class ProjectGradingSettings(Base):
     __tablename__ = "project_grading_settings"
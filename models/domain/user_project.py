@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, UniqueConstraint, Index
 from core.db import Base
 from enum import Enum as PyEnum
 from sqlalchemy import Enum
@@ -16,4 +16,8 @@ user_project_table = Table(
     Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
     Column("project_id", Integer, ForeignKey("projects.id"), nullable=False),
     Column("role", Enum(Role), nullable=False, default=Role.MEMBER),
+    # Уникальность пары нужна для on_conflict_do_nothing в add_user_to_project,
+    # ее индекс обслуживает и поиск проектов пользователя
+    UniqueConstraint("user_id", "project_id", name="uq_user_project_user_id_project_id"),
+    Index("ix_user_project_project_id", "project_id"),
 )
\ No newline at end of file
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Integer
-from sqlalchemy.orm import relationship, object_session
+from sqlalchemy import DDL, Column, Index, String, Integer, event, func
+from sqlalchemy.orm import relationship
 
 from core.db import Base
-from models.domain.user_project import user_project_table, Role
+from models.domain.user_project import user_project_table
 
 
 class User(Base):
@@ -28,43 +28,21 @@ class User(Base):
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
     activities = relationship("ProjectActivity", back_populates="user")
 
-    @property
-    def is_teacher(self):
-        try:
-            session = object_session(self)
-            if not session:
-                return False 
-                
-            result = session.query(user_project_table).filter(
-                user_project_table.c.user_id == self.id,
-                user_project_table.c.role == Role.TEACHER
-            ).first()
-            
-            return result is not None
-        except Exception:
-            return False
-
-    @property
-    def project_associations(self):
-        session = object_session(self)
-        if not session:
-            return [] 
-        return session.query(user_project_table).filter(
-            user_project_table.c.user_id == self.id
-        ).all()
-
-    def is_project_leader(self, project_id: int) -> bool:
-        try:
-            session = object_session(self)
-            if not session:
-                return False 
-                
-            result = session.query(user_project_table).filter(
-                user_project_table.c.user_id == self.id,
-                user_project_table.c.project_id == project_id,
-                user_project_table.c.role.in_([Role.ADMIN, Role.OWNER])
-            ).first()
-            
-            return result is not None
-        except Exception:
-            return False
\ No newline at end of file
+    __table_args__ = (
+        # Поиск подстроки (ILIKE '%q%') для /users/search
+        Index("ix_users_first_name_trgm", "first_name", postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("ix_users_last_name_trgm", "last_name", postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        # Поиск по префиксу (lower(...) LIKE 'q%') в режиме prefix
+        Index("ix_users_first_name_prefix", func.lower(first_name).label("first_name_lower"), postgresql_ops={"first_name_lower": "text_pattern_ops"}),
+        Index("ix_users_last_name_prefix", func.lower(last_name).label("last_name_lower"), postgresql_ops={"last_name_lower": "text_pattern_ops"}),
+        Index("ix_users_email_prefix", func.lower(email).label("email_lower"), postgresql_ops={"email_lower": "text_pattern_ops"}),
+    )
+
+
+# gin_trgm_ops нужен до создания индексов users (create_all в тестах и бенчмарках)
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
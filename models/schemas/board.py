@@ -0,0 +1,37 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Optional
+
+from models.schemas.projects import ProjectMember
+from models.schemas.sprints import SprintResponse
+from models.schemas.task_columns import TaskColumn
+
+
+class BoardTask(BaseModel):
+    id: int
+    title: str
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    grade: Optional[str] = None
+    column_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    due_date: Optional[datetime] = None
+    start_date: Optional[datetime] = None
+    completion_status: Optional[str] = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class BoardColumn(TaskColumn):
+    tasks: list[BoardTask] = []
+
+
+class Board(BaseModel):
+    project_id: int
+    columns: list[BoardColumn]
+    # Задачи без колонки (column_id = NULL), чтобы они не терялись на доске
+    unassigned_tasks: list[BoardTask] = []
+    members: list[ProjectMember]
+    sprints: list[SprintResponse]
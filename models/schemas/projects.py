@@ -25,4 +25,24 @@ class Project(ProjectBase):
     start_date: datetime
     end_date: datetime | None = None
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+
+class ProjectMember(BaseModel):
+    id: int
+    email: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    avatar: str | None = None
+    role: str
+
+    @classmethod
+    def from_row(cls, row) -> "ProjectMember":
+        data = dict(row._mapping)
+        data["role"] = row.role.value
+        return cls(**data)
+
+class ProjectListItem(Project):
+    member_count: int = 0
+    # Первые участники проекта, если запрошены (members_limit > 0)
+    members: list[ProjectMember] | None = None
@@ -1,6 +1,12 @@
 from datetime import datetime, date
+from enum import Enum
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Mapping, Optional
+
+from models.domain.tasks import TaskGrade, TaskPriority, TaskStatus
+
+# Ключи сортировки списка задач; "-" перед ключом - по убыванию
+TASK_SORT_KEYS = ("created_at", "updated_at", "due_date", "priority", "status", "title")
 
 class TaskBase(BaseModel):
     title: str = Field(..., max_length=200)
@@ -59,6 +65,51 @@ class TaskResponse(TaskBase):
         data = obj.__dict__.copy()
         return cls(**data)
 
+    @classmethod
+    def from_row(cls, row: Mapping) -> "TaskResponse":
+        """Ответ из строки TaskRepository._task_rows_query() с именами исполнителя и колонки"""
+        data = {key: value.value if isinstance(value, Enum) else value for key, value in row.items()}
+        return cls(**data)
+
+class TaskListQuery(BaseModel):
+    """Фильтры, сортировка и пагинация списка задач проекта"""
+    status: Optional[list[TaskStatus]] = None
+    priority: Optional[list[TaskPriority]] = None
+    grade: Optional[list[TaskGrade]] = None
+    assignee_id: Optional[int] = None
+    column_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+    due_from: Optional[datetime] = None
+    due_to: Optional[datetime] = None
+    q: Optional[str] = Field(None, min_length=1, max_length=200)
+    sort: str = Field("created_at", pattern=rf"^-?({'|'.join(TASK_SORT_KEYS)})$")
+    # Без limit возвращается весь список, как раньше
+    limit: Optional[int] = Field(None, ge=1, le=500)
+    cursor: Optional[str] = None
+
+    @property
+    def sort_key(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+class TaskSearchResult(BaseModel):
+    id: int
+    title: str
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    column_id: Optional[int] = None
+    sprint_id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    rank: float
+    # HTML-экранированный текст, совпадения обернуты в <mark></mark>
+    title_highlight: str
+    description_highlight: Optional[str] = None
+
+    model_config = {"from_attributes": True}
+
 class TaskApproval(BaseModel):
     is_teacher_approval: bool = False
     comment: str | None = None
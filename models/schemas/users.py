@@ -1,7 +1,5 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
-from sqlalchemy.orm import object_session
-from models.domain.user_project import user_project_table
 
 class UserCreate(BaseModel):
     sub: Optional[str] = None
@@ -11,6 +9,10 @@ class UserCreate(BaseModel):
     middle_name: Optional[str] = None
     group: Optional[str] = None
     role: Optional[str] = "student"
+    # У пользователей SEVSU пароля нет
+    password: Optional[str] = None
+
+class UserRegister(UserCreate):
     password: str
 
 class UserResponse(BaseModel):
@@ -29,27 +31,8 @@ class UserResponse(BaseModel):
         
     @classmethod
     def model_validate(cls, obj):
-        data = obj.__dict__.copy()
-        data["is_teacher"] = getattr(obj, 'is_teacher', False)
-        data["project_roles"] = {}
-        
-        try:
-            session = object_session(obj)
-            if session:
-                role_records = session.query(
-                    user_project_table.c.project_id,
-                    user_project_table.c.role
-                ).filter(
-                    user_project_table.c.user_id == obj.id
-                ).all()
-                
-                for project_id, role in role_records:
-                    if hasattr(role, 'value'):
-                        data["project_roles"][project_id] = role.value
-        except Exception:
-            pass
-        
-        return cls(**data)
+        # Роли в проектах здесь не читаются: их загружает PermissionContext
+        return cls(**obj.__dict__)
 
 class Token(BaseModel):
     access_token: str
@@ -2,6 +2,7 @@ from datetime import datetime
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.domain.project_activities import ProjectActivity
+from core.pagination import Cursor, keyset_before
 from typing import List, Optional, Dict, Any
 
 def serialize_datetime(obj: Any) -> Any:
@@ -14,8 +15,9 @@ def serialize_datetime(obj: Any) -> Any:
     return obj
 
 class ActivityRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
+        self.read_session = read_session or session
 
     async def create(self, 
         project_id: int,
@@ -34,7 +36,7 @@ class ActivityRepository:
             changes=serialize_datetime(changes) if changes else None
         )
         self.session.add(activity)
-        await self.session.commit()
+        await self.session.flush()
         return activity
 
     async def get_project_activities(
@@ -44,10 +46,14 @@ class ActivityRepository:
         offset: int = 0,
         start_date: datetime = None,
         end_date: datetime = None,
-        action: str = None
+        action: str = None,
+        cursor: Optional[Cursor] = None
     ) -> List[ProjectActivity]:
         query = select(ProjectActivity).where(ProjectActivity.project_id == project_id)
 
+        if cursor:
+            query = query.where(keyset_before(ProjectActivity.created_at, ProjectActivity.id, cursor))
+
         if start_date and end_date:
             query = query.where(and_(
                 ProjectActivity.created_at >= start_date,
@@ -57,10 +63,12 @@ class ActivityRepository:
         if action:
             query = query.where(ProjectActivity.action == action)
 
-        query = query.order_by(ProjectActivity.created_at.desc())
-        query = query.offset(offset).limit(limit)
+        query = query.order_by(ProjectActivity.created_at.desc(), ProjectActivity.id.desc())
+        if not cursor:
+            query = query.offset(offset)
+        query = query.limit(limit)
 
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         return result.scalars().all()
 
     async def count_project_activities(
@@ -81,7 +89,7 @@ class ActivityRepository:
         if action:
             conditions.append(ProjectActivity.action == action)
 
-        result = await self.session.execute(
+        result = await self.read_session.execute(
             select(func.count()).select_from(ProjectActivity).where(and_(*conditions))
         )
         return result.scalar_one()
\ No newline at end of file
@@ -39,7 +39,7 @@ class GradingRepository:
             .where(Task.id == task_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         task_repository = TaskRepository(self.session)
         return await task_repository.get_by_id(task_id)
 
@@ -58,7 +58,7 @@ class GradingRepository:
         else:
             for key, value in settings.items():
                 setattr(progress, key, value)
-        await self.session.commit()
+        await self.session.flush()
 
     async def create_or_update_progress(self, progress_data: dict) -> UserProjectProgress:
         progress = await self.get_user_progress(
@@ -73,7 +73,7 @@ class GradingRepository:
             for key, value in progress_data.items():
                 setattr(progress, key, value)
 
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(progress)
         return progress
 
@@ -1,22 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select
 from sqlalchemy.orm import selectinload
 from models.domain.messages import Message
+from core.pagination import Cursor, keyset_before
 
 class MessageRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
+        self.read_session = read_session or session
 
-    async def create(self, message_data: dict) -> Message:
-        try:
-            message = Message(**message_data)
-            self.session.add(message)
-            await self.session.commit()
-            await self.session.refresh(message)
-            return message
-        except Exception as e:
-            await self.session.rollback()
-            raise
+    async def create_many(self, messages: list[dict]) -> list[Row]:
+        """Несколько сообщений одним INSERT ... RETURNING; строки в порядке messages"""
+        result = await self.session.execute(
+            insert(Message).returning(
+                Message.id,
+                Message.project_id,
+                Message.sender_id,
+                Message.content,
+                Message.created_at,
+                sort_by_parameter_order=True
+            ),
+            messages
+        )
+        return result.all()
 
     async def get_by_id(self, message_id: int) -> Message | None:
         result = await self.session.execute(
@@ -29,15 +35,23 @@ class MessageRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_messages_by_project(self, project_id: int, limit: int = 50) -> list[Message]:
-        result = await self.session.execute(
+    async def get_messages_by_project(
+        self,
+        project_id: int,
+        limit: int = 50,
+        cursor: Cursor | None = None
+    ) -> list[Message]:
+        query = (
             select(Message)
             .options(
                 selectinload(Message.project),
                 selectinload(Message.sender),
             )
             .where(Message.project_id == project_id)
-            .order_by(Message.created_at.desc())
-            .limit(limit)
+        )
+        if cursor:
+            query = query.where(keyset_before(Message.created_at, Message.id, cursor))
+        result = await self.read_session.execute(
+            query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit)
         )
         return result.scalars().all()
\ No newline at end of file
@@ -2,17 +2,19 @@ from sqlalchemy import select, update, and_, delete, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from models.domain.notifications import Notification
+from core.pagination import Cursor, keyset_before
 from models.schemas.notifications import NotificationCreate, NotificationUpdate
 from typing import List, Optional
 
 class NotificationRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
+        self.read_session = read_session or session
 
     async def create(self, notification: NotificationCreate) -> Notification:
         db_notification = Notification(**notification.model_dump())
         self.session.add(db_notification)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(db_notification)
         return db_notification
 
@@ -27,17 +29,23 @@ class NotificationRepository:
         user_id: int, 
         skip: int = 0, 
         limit: int = 50,
-        unread_only: bool = False
+        unread_only: bool = False,
+        cursor: Optional[Cursor] = None
     ) -> List[Notification]:
         query = select(Notification).where(Notification.user_id == user_id)
         
         if unread_only:
             query = query.where(Notification.read == False)
+
+        if cursor:
+            query = query.where(keyset_before(Notification.created_at, Notification.id, cursor))
+        else:
+            query = query.offset(skip)
             
-        query = query.order_by(Notification.created_at.desc())
-        query = query.offset(skip).limit(limit)
+        query = query.order_by(Notification.created_at.desc(), Notification.id.desc())
+        query = query.limit(limit)
         
-        result = await self.session.execute(query)
+        result = await self.read_session.execute(query)
         return result.scalars().all()
 
     async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
@@ -51,7 +59,7 @@ class NotificationRepository:
             )
             .values(read=True)
         )
-        await self.session.commit()
+        await self.session.flush()
         return result.rowcount > 0
 
     async def mark_all_as_read(self, user_id: int) -> bool:
@@ -65,14 +73,14 @@ class NotificationRepository:
             )
             .values(read=True)
         )
-        await self.session.commit()
+        await self.session.flush()
         return result.rowcount > 0
 
     async def delete(self, notification_id: int, user_id: int) -> bool:
         notification = await self.get_by_id(notification_id)
         if notification and notification.user_id == user_id:
             await self.session.delete(notification)
-            await self.session.commit()
+            await self.session.flush()
             return True
         return False
 
@@ -99,5 +107,5 @@ class NotificationRepository:
                 )
             )
         )
-        await self.session.commit()
+        await self.session.flush()
         return result.rowcount
\ No newline at end of file
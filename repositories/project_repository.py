@@ -1,8 +1,7 @@
 from typing import Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import Row, exists, func, select, update, delete, literal, or_, union_all
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import joinedload
 
 from models.domain.projects import Project
 from models.domain.users import User
@@ -17,32 +16,115 @@ class ProjectRepository:
     async def create(self, project_data: dict) -> Project:
         project = Project(**project_data)
         self.session.add(project)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(project)
         return project
 
     async def get_by_id(self, project_id: int) -> Project | None:
         result = await self.session.execute(
-            select(Project)
-            .where(Project.id == project_id)
-            .options(
-                joinedload(Project.owner),
-                joinedload(Project.users),
-            )
+            select(Project).where(Project.id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def exists(self, project_id: int) -> bool:
+        result = await self.session.execute(
+            select(exists().where(Project.id == project_id))
+        )
+        return result.scalar_one()
+
+    async def is_member(self, project_id: int, user_id: int) -> bool:
+        """Состоит ли пользователь в проекте: один EXISTS по уникальному (user_id, project_id).
+
+        Владелец проекта считается участником, как и в get_user_roles.
+        """
+        membership = exists().where(
+            user_project_table.c.project_id == project_id,
+            user_project_table.c.user_id == user_id
         )
-        return result.unique().scalar_one_or_none()
+        owned = exists().where(Project.id == project_id, Project.owner_id == user_id)
+        result = await self.session.execute(select(or_(membership, owned)))
+        return result.scalar_one()
+
+    async def get_data_version(self, project_id: int) -> int | None:
+        """Версия задач, колонок и спринтов проекта (см. projects.data_version)"""
+        result = await self.session.execute(
+            select(Project.data_version).where(Project.id == project_id)
+        )
+        return result.scalar_one_or_none()
 
     async def get_all_for_user(self, user_id: int) -> Sequence[Project]:
         result = await self.session.execute(
             select(Project)
             .join(user_project_table, user_project_table.c.project_id == Project.id)  # Условие соединения
             .where(user_project_table.c.user_id == user_id)
-            .options(
-                joinedload(Project.owner),
-                joinedload(Project.users),
+        )
+        return result.scalars().all()
+
+    async def list_for_user(
+        self,
+        user_id: int,
+        limit: int | None = None,
+        before_id: int | None = None,
+        public_only: bool = False
+    ) -> Sequence[Row]:
+        """Проекты пользователя (новые первыми) с числом участников.
+
+        Число участников - коррелированный подзапрос по ix_user_project_project_id,
+        поэтому строк столько же, сколько проектов. При limit читается limit + 1.
+        """
+        member_count = (
+            select(func.count())
+            .select_from(user_project_table)
+            .where(user_project_table.c.project_id == Project.id)
+            .correlate(Project)
+            .scalar_subquery()
+        )
+        query = (
+            select(Project, member_count.label("member_count"))
+            .join(user_project_table, user_project_table.c.project_id == Project.id)
+            .where(user_project_table.c.user_id == user_id)
+            .order_by(Project.id.desc())
+        )
+        if public_only:
+            query = query.where(func.coalesce(Project.is_private, 0) == 0)
+        if before_id is not None:
+            query = query.where(Project.id < before_id)
+        if limit is not None:
+            query = query.limit(limit + 1)
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_members_preview(self, project_ids: Sequence[int], per_project: int) -> dict[int, list[Row]]:
+        """Первые per_project участников каждого проекта одним запросом"""
+        if not project_ids or per_project <= 0:
+            return {}
+
+        position = func.row_number().over(
+            partition_by=user_project_table.c.project_id,
+            order_by=(user_project_table.c.role, User.last_name, User.id)
+        )
+        ranked = (
+            select(
+                user_project_table.c.project_id,
+                User.id, User.email, User.first_name, User.last_name, User.avatar,
+                user_project_table.c.role,
+                position.label("position")
             )
+            .join(User, User.id == user_project_table.c.user_id)
+            .where(user_project_table.c.project_id.in_(project_ids))
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(ranked)
+            .where(ranked.c.position <= per_project)
+            .order_by(ranked.c.project_id, ranked.c.position)
         )
-        return result.unique().scalars().all()
+
+        members: dict[int, list[Row]] = {}
+        for row in result.all():
+            members.setdefault(row.project_id, []).append(row)
+        return members
 
     async def update(self, project_id: int, update_data: dict) -> Project | None:
         await self.session.execute(
@@ -50,7 +132,7 @@ class ProjectRepository:
             .where(Project.id == project_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         return await self.get_by_id(project_id)
 
     async def delete(self, project_id: int) -> None:
@@ -60,7 +142,7 @@ class ProjectRepository:
         await self.session.execute(
             delete(Project).where(Project.id == project_id)
         )
-        await self.session.commit()
+        await self.session.flush()
 
     async def add_user_to_project(self, project_id: int, user_id: int, role: str) -> None:
         try:
@@ -73,7 +155,7 @@ class ProjectRepository:
             role=role_enum
         ).on_conflict_do_nothing()
         await self.session.execute(stmt)
-        await self.session.commit()
+        await self.session.flush()
 
     async def remove_user_from_project(self, project_id: int, user_id: int) -> None:
         await self.session.execute(
@@ -81,7 +163,7 @@ class ProjectRepository:
             .where(user_project_table.c.project_id == project_id)
             .where(user_project_table.c.user_id == user_id)
         )
-        await self.session.commit()
+        await self.session.flush()
 
     async def get_project_users(self, project_id: int) -> Sequence[UserResponse]:
         stmt = (
@@ -92,4 +174,39 @@ class ProjectRepository:
         result = await self.session.execute(stmt)
         users = result.unique().scalars().all()
 
-        return [UserResponse.model_validate(user) for user in users]
\ No newline at end of file
+        return [UserResponse.model_validate(user) for user in users]
+
+    async def get_project_members(self, project_id: int) -> Sequence[Row]:
+        """Участники проекта вместе с ролью одним запросом, без загрузки User"""
+        result = await self.session.execute(
+            select(
+                User.id, User.email, User.first_name, User.last_name, User.avatar,
+                user_project_table.c.role
+            )
+            .join(user_project_table, User.id == user_project_table.c.user_id)
+            .where(user_project_table.c.project_id == project_id)
+            .order_by(User.last_name, User.first_name, User.id)
+        )
+        return result.all()
+
+    async def get_user_roles(self, user_id: int) -> dict[int, Role]:
+        """Роли пользователя во всех его проектах одним запросом.
+
+        Владелец проекта (projects.owner_id) получает роль OWNER, даже если
+        в user_project для него нет записи.
+        """
+        memberships = select(
+            user_project_table.c.project_id,
+            user_project_table.c.role
+        ).where(user_project_table.c.user_id == user_id)
+        owned = select(
+            Project.id,
+            literal(Role.OWNER, user_project_table.c.role.type)
+        ).where(Project.owner_id == user_id)
+
+        result = await self.session.execute(union_all(memberships, owned))
+        roles: dict[int, Role] = {}
+        for project_id, role in result.all():
+            if role == Role.OWNER or project_id not in roles:
+                roles[project_id] = role
+        return roles
\ No newline at end of file
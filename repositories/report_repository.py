@@ -6,6 +6,7 @@ from sqlalchemy.orm import selectinload
 
 from models.domain.reports import Report
 from models.schemas.reports import ReportCreate, ReportResponse
+from core.pagination import Cursor, keyset_before
 
 
 class ReportRepository:
@@ -16,11 +17,10 @@ class ReportRepository:
         try:
             report = Report(**report_data)
             self.session.add(report)
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(report)
             return report
         except Exception as e:
-            await self.session.rollback()
             raise HTTPException(status_code=500, detail="Не удалось создать отчет")
 
     async def get_by_id(self, report_id: int) -> Report | None:
@@ -33,15 +33,23 @@ class ReportRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_reports_by_project(self, project_id: int, limit: int = 50) -> list[Report]:
-        result = await self.session.execute(
+    async def get_reports_by_project(
+        self,
+        project_id: int,
+        limit: int = 50,
+        cursor: Cursor | None = None
+    ) -> list[Report]:
+        query = (
             select(Report)
             .options(
                 selectinload(Report.project),
             )
             .where(Report.project_id == project_id)
-            .order_by(Report.created_at.desc())
-            .limit(limit)
+        )
+        if cursor:
+            query = query.where(keyset_before(Report.created_at, Report.id, cursor))
+        result = await self.session.execute(
+            query.order_by(Report.created_at.desc(), Report.id.desc()).limit(limit)
         )
         return result.scalars().all()
 
@@ -54,13 +62,12 @@ class ReportRepository:
             for key, value in update_data.items():
                 setattr(report, key, value)
 
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(report)
             return report
         except HTTPException:
             raise
         except Exception as e:
-            await self.session.rollback()
             raise HTTPException(status_code=500, detail="Не удалось обновить отчет")
 
     async def delete(self, report_id: int) -> bool:
@@ -70,10 +77,9 @@ class ReportRepository:
                 raise HTTPException(status_code=404, detail="Отчет не найден")
 
             await self.session.delete(report)
-            await self.session.commit()
+            await self.session.flush()
             return True
         except HTTPException:
             raise
         except Exception as e:
-            await self.session.rollback()
             raise HTTPException(status_code=500, detail="Не удалось удалить отчет")
\ No newline at end of file
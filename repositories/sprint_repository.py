@@ -10,7 +10,7 @@ class SprintRepository:
     async def create(self, sprint_data: dict) -> Sprint:
         sprint = Sprint(**sprint_data)
         self.session.add(sprint)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(sprint)
         return sprint
 
@@ -25,6 +25,12 @@ class SprintRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_project_id(self, sprint_id: int) -> int | None:
+        result = await self.session.execute(
+            select(Sprint.project_id).where(Sprint.id == sprint_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_for_project(self, project_id: int) -> list[Sprint]:
         result = await self.session.execute(
             select(Sprint)
@@ -33,17 +39,26 @@ class SprintRepository:
         )
         return result.scalars().all()
 
+    async def get_for_project_board(self, project_id: int) -> list[Sprint]:
+        """Спринты проекта без задач - задачи доски загружаются отдельно"""
+        result = await self.session.execute(
+            select(Sprint)
+            .where(Sprint.project_id == project_id)
+            .order_by(Sprint.start_date, Sprint.id)
+        )
+        return result.scalars().all()
+
     async def update(self, sprint_id: int, update_data: dict) -> Sprint | None:
         await self.session.execute(
             update(Sprint)
             .where(Sprint.id == sprint_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         return await self.get_by_id(sprint_id)
 
     async def delete(self, sprint_id: int) -> None:
         await self.session.execute(
             delete(Sprint).where(Sprint.id == sprint_id)
         )
-        await self.session.commit()
\ No newline at end of file
+        await self.session.flush()
\ No newline at end of file
@@ -11,7 +11,7 @@ class TaskColumnRepository:
     async def create(self, column_data: dict) -> TaskColumn:
         column = TaskColumn(**column_data)
         self.session.add(column)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(column)
         return column
 
@@ -37,7 +37,7 @@ class TaskColumnRepository:
             .where(TaskColumn.id == column_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         result = await self.session.execute(select(TaskColumn).where(TaskColumn.id == column_id))
         return result.scalar_one_or_none()
 
@@ -45,4 +45,4 @@ class TaskColumnRepository:
         await self.session.execute(
             delete(TaskColumn).where(TaskColumn.id == column_id)
         )
-        await self.session.commit()
\ No newline at end of file
+        await self.session.flush()
\ No newline at end of file
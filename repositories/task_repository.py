@@ -1,16 +1,73 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from datetime import datetime
+from typing import Any
+from sqlalchemy import DateTime, Enum as SQLEnum, Row, RowMapping, Select, and_, func, or_, select, tuple_, update, delete
 from sqlalchemy.orm import selectinload
 from models.domain.tasks import Task, TaskRelation, TaskRelationType
+from models.domain.task_columns import TaskColumn
+from models.domain.users import User
+from models.schemas.tasks import TaskListQuery
+
+TASK_SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "due_date": Task.due_date,
+    "priority": Task.priority,
+    "status": Task.status,
+    "title": Task.title,
+}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# MaxFragments > 0 - ts_headline возвращает только фрагменты с совпадениями
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+
+def _html_escape(expression):
+    """Экранирует текст до ts_headline: парсер оставляет сущности как есть,
+    поэтому в ответе размечены только совпадения"""
+    return func.replace(func.replace(func.replace(expression, "&", "&amp;"), "<", "&lt;"), ">", "&gt;")
+
+
+def _headline(expression, query, options: str):
+    """ts_headline по тем же конфигурациям, что и search_vector.
+
+    Русская выбирает фрагменты, английская досвечивает в них свои совпадения;
+    слово, найденное обеими, размечается один раз.
+    """
+    marked = func.ts_headline(
+        "english", func.ts_headline("russian", _html_escape(expression), query, options), query, HEADLINE_OPTIONS
+    )
+    return func.replace(func.replace(marked, "<mark><mark>", "<mark>"), "</mark></mark>", "</mark>")
+
+
+def _search_query(text: str):
+    return func.websearch_to_tsquery("russian", text).op("||")(func.websearch_to_tsquery("english", text))
+
+
+def _cursor_value(column, value: Any) -> Any:
+    """Приводит значение из курсора (JSON) к типу колонки сортировки"""
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, SQLEnum):
+        return column.type.enum_class(value)
+    return str(value)
 
 class TaskRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, read_session: AsyncSession | None = None):
         self.session = session
+        self.read_session = read_session or session
 
     async def create(self, task_data: dict) -> Task:
         task = Task(**task_data)
         self.session.add(task)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(task)
         return task
 
@@ -28,7 +85,7 @@ class TaskRepository:
         return result.scalar_one_or_none()
 
     async def get_tasks_by_project(self, project_id: int) -> list[Task]:
-        result = await self.session.execute(
+        result = await self.read_session.execute(
             select(Task)
             .options(
                 selectinload(Task.project),
@@ -40,6 +97,162 @@ class TaskRepository:
         )
         return result.scalars().all()
 
+    @staticmethod
+    def _task_rows_query() -> Select:
+        """Колонки задачи, нужные TaskResponse, плюс имя исполнителя и колонки.
+
+        Строки не попадают в identity map сессии и не тянут связи,
+        в отличие от select(Task) с selectinload.
+        """
+        return (
+            select(
+                Task.id, Task.title, Task.description, Task.status, Task.priority, Task.grade,
+                Task.column_id, Task.start_date, Task.due_date, Task.completion_status, Task.score,
+                Task.created_at, Task.updated_at, Task.project_id, Task.sprint_id, Task.assignee_id,
+                Task.feedback,
+                func.nullif(func.concat_ws(" ", User.first_name, User.last_name), "").label("assignee_name"),
+                TaskColumn.name.label("column_name"),
+            )
+            .outerjoin(User, User.id == Task.assignee_id)
+            .outerjoin(TaskColumn, TaskColumn.id == Task.column_id)
+        )
+
+    @staticmethod
+    def _apply_task_filters(query: Select, filters: TaskListQuery) -> Select:
+        if filters.status:
+            query = query.where(Task.status.in_(filters.status))
+        if filters.priority:
+            query = query.where(Task.priority.in_(filters.priority))
+        if filters.grade:
+            query = query.where(Task.grade.in_(filters.grade))
+        if filters.assignee_id is not None:
+            query = query.where(Task.assignee_id == filters.assignee_id)
+        if filters.column_id is not None:
+            query = query.where(Task.column_id == filters.column_id)
+        if filters.sprint_id is not None:
+            query = query.where(Task.sprint_id == filters.sprint_id)
+        if filters.due_from is not None:
+            query = query.where(Task.due_date >= filters.due_from)
+        if filters.due_to is not None:
+            query = query.where(Task.due_date <= filters.due_to)
+        if filters.q:
+            query = query.where(Task.title.ilike(f"%{_escape_like(filters.q)}%", escape="\\"))
+        return query
+
+    @staticmethod
+    def _apply_task_sort(query: Select, filters: TaskListQuery, after: tuple[Any, int] | None) -> Select:
+        """Сортировка по ключу с id для однозначности; NULL-значения всегда в конце.
+
+        after - (значение, id) последней строки предыдущей страницы.
+        """
+        column = TASK_SORT_COLUMNS[filters.sort_key]
+        descending = filters.descending
+
+        if after is not None:
+            value, last_id = after
+            value = _cursor_value(column, value)
+            id_beyond = Task.id < last_id if descending else Task.id > last_id
+            if value is None:
+                query = query.where(column.is_(None), id_beyond)
+            else:
+                beyond = column < value if descending else column > value
+                query = query.where(or_(beyond, and_(column == value, id_beyond), column.is_(None)))
+
+        if descending:
+            return query.order_by(column.desc().nulls_last(), Task.id.desc())
+        return query.order_by(column.asc().nulls_last(), Task.id.asc())
+
+    async def get_task_rows_by_project(
+        self,
+        project_id: int,
+        filters: TaskListQuery | None = None,
+        after: tuple[Any, int] | None = None
+    ) -> list[RowMapping]:
+        """Задачи проекта с фильтрами; при filters.limit читается limit + 1 строка"""
+        filters = filters or TaskListQuery()
+        query = self._task_rows_query().where(Task.project_id == project_id)
+        query = self._apply_task_filters(query, filters)
+        query = self._apply_task_sort(query, filters, after)
+        if filters.limit is not None:
+            query = query.limit(filters.limit + 1)
+
+        result = await self.read_session.execute(query)
+        return result.mappings().all()
+
+    async def search_tasks(
+        self,
+        project_id: int,
+        text: str,
+        limit: int,
+        after: tuple[float, int] | None = None
+    ) -> list[RowMapping]:
+        """Полнотекстовый поиск по ix_tasks_search_vector, по убыванию ранга.
+
+        Читается limit + 1 строка; after - (ранг, id) последней строки
+        предыдущей страницы.
+        """
+        query = _search_query(text)
+        rank = func.ts_rank_cd(Task.search_vector, query)
+        matches = (
+            select(Task.id, rank.label("rank"))
+            .where(Task.project_id == project_id, Task.search_vector.op("@@")(query))
+            .order_by(rank.desc(), Task.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            matches = matches.where(tuple_(rank, Task.id) < tuple_(*after))
+        matches = matches.subquery()
+
+        # ts_headline дорогой, поэтому считается только для строк страницы
+        stmt = (
+            select(
+                Task.id, Task.title, Task.status, Task.priority,
+                Task.column_id, Task.sprint_id, Task.assignee_id,
+                matches.c.rank,
+                _headline(Task.title, query, HEADLINE_OPTIONS).label("title_highlight"),
+                _headline(Task.description, query, SNIPPET_OPTIONS).label("description_highlight"),
+            )
+            .join(matches, matches.c.id == Task.id)
+            .order_by(matches.c.rank.desc(), Task.id.desc())
+        )
+        result = await self.read_session.execute(stmt)
+        return result.mappings().all()
+
+    async def get_task_row(self, task_id: int) -> RowMapping | None:
+        # Основная сессия: строка должна включать изменения текущей транзакции
+        result = await self.session.execute(self._task_rows_query().where(Task.id == task_id))
+        return result.mappings().one_or_none()
+
+    async def get_task_rows_by_sprint(self, sprint_id: int) -> list[RowMapping]:
+        result = await self.read_session.execute(
+            self._task_rows_query().where(Task.sprint_id == sprint_id).order_by(Task.id)
+        )
+        return result.mappings().all()
+
+    async def get_board_tasks(
+        self,
+        project_id: int,
+        sprint_id: int | None = None,
+        assignee_id: int | None = None
+    ) -> list[Row]:
+        """Плоские строки задач для доски, без загрузки связей"""
+        query = (
+            select(
+                Task.id, Task.title, Task.status, Task.priority, Task.grade,
+                Task.column_id, Task.sprint_id, Task.assignee_id,
+                Task.due_date, Task.start_date, Task.completion_status, Task.created_at,
+            )
+            .where(Task.project_id == project_id)
+            .order_by(Task.column_id, Task.created_at, Task.id)
+        )
+        if sprint_id is not None:
+            query = query.where(Task.sprint_id == sprint_id)
+        if assignee_id is not None:
+            query = query.where(Task.assignee_id == assignee_id)
+
+        result = await self.read_session.execute(query)
+        return result.all()
+
     async def get_tasks_by_sprint(self, sprint_id: int) -> list[Task]:
         result = await self.session.execute(
             select(Task)
@@ -59,7 +272,7 @@ class TaskRepository:
             .where(Task.id == task_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         return await self.get_by_id(task_id)
 
     async def update_partial(self, task_id: int, update_data: dict) -> Task | None:
@@ -71,14 +284,14 @@ class TaskRepository:
             .where(Task.id == task_id)
             .values(**update_data)
         )
-        await self.session.commit()
+        await self.session.flush()
         return await self.get_by_id(task_id)
 
     async def delete(self, task_id: int) -> None:
         await self.session.execute(
             delete(Task).where(Task.id == task_id)
         )
-        await self.session.commit()
+        await self.session.flush()
 
     async def get_related_tasks(self, task_id: int) -> list[Task]:
         task = await self.get_by_id(task_id)
@@ -104,7 +317,7 @@ class TaskRepository:
     async def create_relation(self, relation_data: dict) -> TaskRelation:
         relation = TaskRelation(**relation_data)
         self.session.add(relation)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(relation)
         return relation
 
@@ -112,7 +325,7 @@ class TaskRepository:
         await self.session.execute(
             delete(TaskRelation).where(TaskRelation.id == relation_id)
         )
-        await self.session.commit()
+        await self.session.flush()
 
     async def delete_relation_by_tasks(self, source_task_id: int, target_task_id: int) -> None:
         await self.session.execute(
@@ -121,7 +334,7 @@ class TaskRepository:
                 ((TaskRelation.source_task_id == target_task_id) & (TaskRelation.target_task_id == source_task_id))
             )
         )
-        await self.session.commit()
+        await self.session.flush()
 
     async def get_task_relations(self, task_id: int, relation_type: TaskRelationType = None) -> list[Task]:
         query = (
@@ -1,21 +1,24 @@
 import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
-from passlib.context import CryptContext
+from sqlalchemy import select, update, delete, func, or_
 from typing import Optional, Sequence
 
+from core.passwords import hash_password, verify_password
 from models.domain.users import User
 from models.domain.tokens import Token
 from models.schemas.users import UserCreate, UserResponse
 
+# Короче триграмма pg_trgm не может использовать индекс для '%q%'
+TRIGRAM_MIN_LENGTH = 3
+
+
 class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
     async def create_user(self, user_data: UserCreate) -> UserResponse:
-        hashed_password = self.pwd_context.hash(user_data.password) if user_data.password else None
+        hashed_password = await hash_password(user_data.password) if user_data.password else None
         user = User(
             sub=user_data.sub,
             email=user_data.email,
@@ -26,7 +29,7 @@ class UserRepository:
             hashed_password=hashed_password
         )
         self.session.add(user)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(user)
         return UserResponse.model_validate(user)
 
@@ -45,36 +48,68 @@ class UserRepository:
         return result.scalar_one_or_none()
 
     async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await verify_password(plain_password, hashed_password)
 
-    async def create_token(self, user_id: int, token: str, expires_at: datetime) -> None:
+    async def create_token(self, user_id: int, jti: str, expires_at: datetime) -> None:
         token_obj = Token(
-            token=token,
+            jti=jti,
             user_id=user_id,
             expires_at=expires_at
         )
         self.session.add(token_obj)
-        await self.session.commit()
+        await self.session.flush()
 
-    async def get_token(self, token: str) -> Optional[Token]:
-        result = await self.session.execute(select(Token).where(Token.token == token))
+    async def get_token(self, jti: str) -> Optional[Token]:
+        result = await self.session.execute(select(Token).where(Token.jti == jti))
         return result.scalar_one_or_none()
 
-    async def revoke_token(self, token: str) -> None:
+    async def revoke_token(self, jti: str) -> None:
         await self.session.execute(
             update(Token)
-            .where(Token.token == token)
+            .where(Token.jti == jti)
             .values(is_active=False)
         )
-        await self.session.commit()
+        await self.session.flush()
+
+    async def delete_expired_tokens(self, batch_size: int) -> int:
+        """Удаляет одну пачку истекших или отозванных токенов.
 
-    async def search_users(self, query: str) -> Sequence[UserResponse]:
-        search_pattern = f"%{query}%"
-        stmt = select(User).where(
-            (func.lower(User.first_name).like(func.lower(search_pattern))) |
-            (func.lower(User.last_name).like(func.lower(search_pattern))) |
-            (func.lower(User.email).like(func.lower(search_pattern)))
+        Каждая пачка коммитится отдельно, чтобы не держать долгих блокировок;
+        строки, заблокированные другими транзакциями, пропускаются.
+        """
+        expired_ids = (
+            select(Token.id)
+            .where(or_(Token.expires_at < func.now(), Token.is_active == False))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
         )
+        result = await self.session.execute(
+            delete(Token).where(Token.id.in_(expired_ids))
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def search_users(self, query: str, limit: int = 20, prefix: bool = False) -> Sequence[UserResponse]:
+        """Поиск по имени, фамилии и email для автодополнения.
+
+        Подстрока ищется по trigram GIN-индексам (ix_users_*_trgm), результаты
+        ранжируются по word_similarity. В режиме prefix ищется начало строки
+        по btree-индексам lower(...) text_pattern_ops. Запрос короче трех
+        символов не дает триграмм, поэтому всегда ищется как префикс.
+        """
+        query = query.strip()
+        escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        fields = (User.first_name, User.last_name, User.email)
+
+        if prefix or len(query) < TRIGRAM_MIN_LENGTH:
+            condition = or_(*(func.lower(field).like(f"{escaped}%", escape="\\") for field in fields))
+            order_by = (User.last_name, User.first_name, User.id)
+        else:
+            condition = or_(*(field.ilike(f"%{escaped}%", escape="\\") for field in fields))
+            rank = func.greatest(*(func.coalesce(func.word_similarity(query, field), 0) for field in fields))
+            order_by = (rank.desc(), User.last_name, User.id)
+
+        stmt = select(User).where(condition).order_by(*order_by).limit(limit)
         result = await self.session.execute(stmt)
         users = result.scalars().all()
         return [UserResponse.model_validate(user) for user in users]
@@ -88,7 +123,7 @@ class UserRepository:
         if user:
             for key, value in data.items():
                 setattr(user, key, value)
-            await self.session.commit()
+            await self.session.flush()
             await self.session.refresh(user)
         
         return user
\ No newline at end of file
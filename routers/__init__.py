@@ -9,6 +9,7 @@ from .report import router as reports_router
 from .media import router as media_router
 from .user import router as users_router
 from .grading import router as grading_router
+from .metrics import router as metrics_router
 
 router = APIRouter()
 
@@ -22,3 +23,4 @@ router.include_router(reports_router, tags=["reports"])
 router.include_router(media_router, tags=["media"])
 router.include_router(users_router, tags=["users"])
 router.include_router(grading_router, tags=["grading"])
+router.include_router(metrics_router, tags=["metrics"])
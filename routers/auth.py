@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from starlette import status
 
 from dependencies import get_auth_service, get_user_service
 from services.auth_service import AuthService
 from services.user_service import UserService
-from models.schemas.users import Token, UserResponse, UserCreate, UserLogin
+from models.schemas.users import Token, UserResponse, UserRegister, UserLogin
 from models.domain.users import User
 from core.config.settings import settings
 from core.security import get_current_user, oauth2_scheme
@@ -18,6 +18,7 @@ async def login_via_sevsu():
         "auth_url": (
             f"{settings.SEVSU_AUTH_URL}?"
             f"response_type=code&"
+            f"scope=openid&"
             f"client_id={settings.SEVSU_CLIENT_ID}&"
             f"redirect_uri={settings.CALLBACK_URL}"
         )
@@ -45,7 +46,7 @@ async def get_current_user_route(
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register_user(
-    user: UserCreate,
+    user: UserRegister,
     auth_service: AuthService = Depends(get_auth_service)
 ):
     return await auth_service.create_user(user)
@@ -60,11 +61,14 @@ async def logout(
 
 @router.get("/users/search", response_model=list[UserResponse])
 async def search_users(
-    q: str,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    prefix: bool = False,
     user_service: UserService = Depends(get_user_service),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Поиск пользователей по имени, фамилии или email
+    Поиск пользователей по имени, фамилии или email.
+    Результаты отсортированы по похожести; prefix=true ищет только по началу строки
     """
-    return await user_service.search_users(q)
\ No newline at end of file
+    return await user_service.search_users(q, limit, prefix)
\ No newline at end of file
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Response, status, WebSocket, WebSocketDisconnect
 from services.message_service import MessageService
 from models.schemas.messages import MessageCreate, MessageResponse
 from core.security import get_current_user, get_current_user_websocket
-from dependencies import get_message_service
+from dependencies import MessageServiceFactory, get_message_service, get_message_service_websocket
 from models.schemas.users import UserResponse
+from core.pagination import page_limit, set_next_cursor
 
 router = APIRouter(prefix="/projects/{project_id}/chat", tags=["chat"])
 
@@ -19,23 +20,39 @@ async def create_message(
 @router.get("/messages/", response_model=list[MessageResponse])
 async def get_messages(
     project_id: int,
+    response: Response,
+    limit: int = Depends(page_limit),
+    cursor: str | None = None,
     service: MessageService = Depends(get_message_service),
     current_user: UserResponse = Depends(get_current_user),
 ):
-    return await service.get_messages_by_project(project_id, current_user.id)
+    page = await service.get_messages_by_project(project_id, current_user.id, limit, cursor)
+    set_next_cursor(response, page.next_cursor)
+    return page.items
 
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
     project_id: int,
-    service: MessageService = Depends(get_message_service),
+    message_services: MessageServiceFactory = Depends(get_message_service_websocket),
     current_user: UserResponse = Depends(get_current_user_websocket),
 ):
-    await service.connect(websocket, project_id, current_user.id)
+    # Сессия БД берется только на время каждой операции, а не на всю жизнь сокета
+    async with message_services() as service:
+        connection = await service.connect(websocket, project_id, current_user.id)
     try:
         while True:
             data = await websocket.receive_text()
+            connection.touch()
             message_data = MessageCreate(content=data)
-            await service.create_message(project_id, message_data, current_user.id)
+            async with message_services() as service:
+                await service.create_message(project_id, message_data, current_user.id)
     except WebSocketDisconnect:
-        await service.disconnect(websocket, project_id)
\ No newline at end of file
+        pass
+    except HTTPException:
+        # Пользователя исключили из проекта, пока сокет был открыт
+        connection.abort(status.WS_1008_POLICY_VIOLATION)
+        await connection.close()
+    finally:
+        async with message_services() as service:
+            await service.disconnect(websocket, project_id)
\ No newline at end of file
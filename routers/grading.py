@@ -16,8 +16,8 @@ async def get_user_tasks_for_grading(
     project_service: ProjectService = Depends(get_project_service),
     current_user: UserResponse = Depends(get_current_user)
 ):
-    project = await project_service.get_project(project_id, user_id)
-    if not any(user.id == user_id for user in project.users):
+    await project_service.get_project(project_id, current_user.id)
+    if not await project_service.is_project_member(project_id, user_id):
         raise HTTPException(status_code=404, detail="User not found in project")
     
     return await service.get_user_tasks_for_grading(project_id, user_id)
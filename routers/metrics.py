@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from core.broadcast import broadcast
+from core.permissions import PermissionContext, get_permission_context
+from core.security import token_cache
+from dependencies import get_notification_manager, message_writer_stats
+from services.message_service import MessageService
+
+router = APIRouter(tags=["metrics"])
+
+async def require_teacher(
+    permissions: PermissionContext = Depends(get_permission_context)
+) -> None:
+    if not permissions.is_teacher:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only teachers can view metrics"
+        )
+
+@router.get("/metrics", dependencies=[Depends(require_teacher)])
+async def get_metrics():
+    """Внутренние счетчики процесса (кэши, соединения); только для преподавателей"""
+    return {
+        "token_cache": token_cache.stats(),
+        "chat_websockets": MessageService.connections.stats(),
+        "chat_websockets_per_project": MessageService.connections.group_summary(),
+        "notification_websockets": get_notification_manager().connections.stats(),
+        "broadcast": broadcast.stats(),
+        "chat_writer": message_writer_stats(),
+    }
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, WebSocket
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from dependencies import get_db, get_notification_manager, get_notification_service
 from core.security import get_current_user, get_current_user_websocket
@@ -8,24 +8,34 @@ from models.schemas.notifications import NotificationResponse
 from repositories.notification_repository import NotificationRepository
 from services.notification_service import NotificationService
 from services.notification_manager import NotificationManager
+from core.pagination import page_limit, set_next_cursor
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
-    skip: int = 0,
-    limit: int = 50,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Depends(page_limit),
     unread_only: bool = False,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     service: NotificationService = Depends(get_notification_service)
 ):
-    """Получить список уведомлений пользователя"""
-    return await service.get_user_notifications(
+    """Получить список уведомлений пользователя.
+
+    Следующая страница - по курсору из заголовка X-Next-Cursor; skip
+    оставлен для совместимости и игнорируется при переданном курсоре.
+    """
+    page = await service.get_user_notifications(
         current_user.id,
         skip=skip,
         limit=limit,
-        unread_only=unread_only
+        unread_only=unread_only,
+        cursor=cursor
     )
+    set_next_cursor(response, page.next_cursor)
+    return page.items
 
 @router.post("/{notification_id}/read")
 async def mark_as_read(
@@ -67,8 +77,13 @@ async def websocket_notifications(
     current_user: User = Depends(get_current_user_websocket)
 ):
     """WebSocket соединение для уведомлений в реальном времени"""
-    await manager.connect(websocket, current_user.id)
+    connection = await manager.connect(websocket, current_user.id)
     try:
-        await websocket.receive_text()
-    except:
-        await manager.disconnect(current_user.id)
\ No newline at end of file
+        # Входящие кадры не обрабатываются, но держат соединение живым для reap()
+        while True:
+            await websocket.receive_text()
+            connection.touch()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await manager.disconnect(current_user.id, websocket)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
@@ -10,14 +10,19 @@ from services.activity_service import ActivityService
 from repositories.activity_repository import ActivityRepository
 
 from models.domain.users import User
-from models.schemas.projects import ProjectCreate, ProjectUpdate, Project
-from dependencies import get_project_service, get_task_column_service, get_grading_service, get_activity_service
+from models.schemas.projects import ProjectCreate, ProjectUpdate, Project, ProjectListItem
+from dependencies import get_project_service, get_task_column_service, get_grading_service, get_activity_service, get_board_service
 from core.security import get_current_user
+from core.permissions import PermissionContext, get_permission_context
+from core.etag import project_etag
+from core.pagination import page_limit, set_next_cursor
 from models.schemas.task_columns import TaskColumnUpdate, TaskColumnCreate, TaskColumn
+from models.schemas.board import Board
 from models.schemas.users import UserResponse
 from services.project_service import ProjectService
 from services.task_column_service import TaskColumnService
 from services.grading_service import GradingService
+from services.board_service import BoardService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -38,12 +43,18 @@ async def get_project(
 ):
     return await service.get_project(project_id, current_user.id)  # TODO:: заменить на current_user.id
 
-@router.get("/", response_model=list[Project])
+@router.get("/", response_model=list[ProjectListItem])
 async def get_all_projects(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    members_limit: int = Query(0, ge=0, le=50),
     service: ProjectService = Depends(get_project_service),
     current_user: dict = Depends(get_current_user)
 ):
-    return await service.get_all_projects(current_user.id)  # TODO:: заменить на current_user.id
+    page = await service.get_all_projects(current_user.id, limit, cursor, members_limit)
+    set_next_cursor(response, page.next_cursor)
+    return page.items
 
 @router.put("/{project_id}", response_model=Project)
 async def update_project(
@@ -91,7 +102,18 @@ async def get_project_users(
 ):
     return await service.get_project_users(project_id, current_user.id)  # TODO:: заменить на current_user.id
 
-@router.get("/{project_id}/columns", response_model=list[TaskColumn])
+@router.get("/{project_id}/board", response_model=Board)
+async def get_board(
+    project_id: int,
+    sprint_id: Optional[int] = None,
+    assignee_id: Optional[int] = None,
+    board_service: BoardService = Depends(get_board_service),
+    current_user: UserResponse = Depends(get_current_user)
+):
+    """Колонки с задачами, участники и спринты проекта одним ответом"""
+    return await board_service.get_board(project_id, current_user.id, sprint_id, assignee_id)
+
+@router.get("/{project_id}/columns", response_model=list[TaskColumn], dependencies=[Depends(project_etag("columns"))])
 async def get_columns(
     project_id: int,
     column_service: TaskColumnService = Depends(get_task_column_service),
@@ -133,7 +155,8 @@ async def get_project_participants_report(
     project_id: int,
     service: ProjectService = Depends(get_project_service),
     grading_service: GradingService = Depends(get_grading_service),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    permissions: PermissionContext = Depends(get_permission_context)
 ):
     """
     Get a report of all participants' progress in the project.
@@ -141,7 +164,7 @@ async def get_project_participants_report(
     Only project leaders and teachers can access this endpoint.
     """
     # Check if user is project leader or teacher
-    if not (current_user.is_teacher or await service._is_user_project_leader(current_user.id, project_id)):
+    if not (permissions.is_teacher or permissions.is_leader(project_id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only project leaders and teachers can access project reports"
@@ -156,14 +179,15 @@ async def set_participant_manual_grade(
     grade: str,
     service: ProjectService = Depends(get_project_service),
     grading_service: GradingService = Depends(get_grading_service),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    permissions: PermissionContext = Depends(get_permission_context)
 ):
     """
     Set a manual grade for a project participant.
     Only project leaders and teachers can set grades.
     """
     # Check if user is project leader or teacher
-    if not (current_user.is_teacher or await service._is_user_project_leader(current_user.id, project_id)):
+    if not (permissions.is_teacher or permissions.is_leader(project_id)):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only project leaders and teachers can set manual grades"
@@ -175,11 +199,12 @@ async def set_participant_manual_grade(
 @router.get("/{project_id}/activities")
 async def get_project_activities(
     project_id: int,
-    offset: int = 0,
-    limit: int = 50,
+    offset: int = Query(0, ge=0),
+    limit: int = Depends(page_limit),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     action: Optional[str] = None,
+    cursor: Optional[str] = None,
     service: ActivityService = Depends(get_activity_service),
     current_user: dict = Depends(get_current_user)
 ):
@@ -189,7 +214,8 @@ async def get_project_activities(
         limit=limit,
         start_date=start_date,
         end_date=end_date,
-        action=action
+        action=action,
+        cursor=cursor
     )
 
 @router.post("/{project_id}/logo")
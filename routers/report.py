@@ -1,11 +1,12 @@
 # routers/report_router.py
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Response
+from typing import List, Optional
 
 from core.security import get_current_user
 from dependencies import get_report_service
 from models.schemas.reports import ReportResponse, ReportCreate
 from services.report_service import ReportService
+from core.pagination import page_limit, set_next_cursor
 
 
 router = APIRouter(prefix="/project/{project_id}/report", tags=["report"])
@@ -30,11 +31,16 @@ async def create_report(
 @router.get("/", response_model=List[ReportResponse])
 async def get_reports(
     project_id: int,
+    response: Response,
+    limit: int = Depends(page_limit),
+    cursor: Optional[str] = None,
     report_service: ReportService = Depends(get_report_service),
     current_user: dict = Depends(get_current_user)
 ):
     try:
-        return await report_service.get_reports_for_project(project_id, current_user.id)
+        page = await report_service.get_reports_for_project(project_id, current_user.id, limit, cursor)
+        set_next_cursor(response, page.next_cursor)
+        return page.items
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -5,6 +5,8 @@ from services.sprint_service import SprintService
 from core.db import get_db
 from core.security import get_current_user
 from dependencies import get_sprint_service
+from core.etag import project_etag
+from core.permissions import PermissionContext
 
 router = APIRouter(prefix="/projects/{project_id}/sprints", tags=["sprints"])
 
@@ -29,7 +31,8 @@ async def get_sprint(
 ):
     return await service.get_sprint(sprint_id, current_user.id)
 
-@router.get("/", response_model=list[SprintResponse])
+# Список спринтов доступен только владельцу, как и в SprintService
+@router.get("/", response_model=list[SprintResponse], dependencies=[Depends(project_etag("sprints", PermissionContext.is_owner))])
 async def get_all_sprints(
     project_id: int,
     service: SprintService = Depends(get_sprint_service),
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from models.domain.tasks import TaskStatus, TaskGrade
 from models.domain.users import User
 from services.task_service import TaskService
-from models.schemas.tasks import TaskCreate, TaskUpdate, TaskResponse, TaskApproval, TaskRejection
+from models.schemas.tasks import TaskCreate, TaskUpdate, TaskResponse, TaskApproval, TaskRejection, TaskListQuery, TaskSearchResult
+from core.pagination import set_next_cursor
+from core.etag import project_etag
 from core.security import get_current_user
+from core.permissions import PermissionContext, get_permission_context
 from dependencies import get_task_service
 
 router = APIRouter(prefix="/projects/{project_id}/tasks", tags=["tasks"])
@@ -21,6 +26,26 @@ async def create_task(
         current_user.id
     )
 
+# Объявлен до /{task_id}, иначе "search" разбирался бы как идентификатор задачи
+@router.get("/search", response_model=list[TaskSearchResult])
+async def search_tasks(
+    project_id: int,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    service: TaskService = Depends(get_task_service),
+    current_user: dict = Depends(get_current_user)
+):
+    """Поиск по заголовку и описанию (синтаксис websearch: "фраза", OR, -слово).
+
+    Результаты отсортированы по релевантности, курсор следующей страницы -
+    в X-Next-Cursor.
+    """
+    page = await service.search_tasks(project_id, current_user.id, q, limit, cursor)
+    set_next_cursor(response, page.next_cursor)
+    return page.items
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     project_id: int,
@@ -30,13 +55,21 @@ async def get_task(
 ):
     return await service.get_task(task_id, current_user.id)
 
-@router.get("/", response_model=list[TaskResponse])
+@router.get("/", response_model=list[TaskResponse], dependencies=[Depends(project_etag("tasks"))])
 async def get_tasks_by_project(
     project_id: int,
+    response: Response,
+    filters: Annotated[TaskListQuery, Query()],
     service: TaskService = Depends(get_task_service),
     current_user: dict = Depends(get_current_user)
 ):
-    return await service.get_tasks_by_project(project_id, current_user.id)
+    """Фильтры повторяемых параметров (status, priority, grade) объединяются по ИЛИ.
+
+    При заданном limit курсор следующей страницы возвращается в X-Next-Cursor.
+    """
+    page = await service.get_tasks_by_project(project_id, current_user.id, filters)
+    set_next_cursor(response, page.next_cursor)
+    return page.items
 
 @router.get("/sprint/{sprint_id}", response_model=list[TaskResponse])
 async def get_tasks_by_sprint(
@@ -99,12 +132,13 @@ async def approve_task(
         task_id: int,
         approval_data: TaskApproval,
         service: TaskService = Depends(get_task_service),
-        current_user: User = Depends(get_current_user)  # Убедитесь что возвращает User модель
+        current_user: User = Depends(get_current_user),  # Убедитесь что возвращает User модель
+        permissions: PermissionContext = Depends(get_permission_context)
 ):
     task = await service.get_task(task_id, current_user.id)
 
     if approval_data.is_teacher_approval:
-        if not current_user.is_teacher:
+        if not permissions.is_teacher:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only teachers can perform teacher approval"
@@ -115,7 +149,7 @@ async def approve_task(
                 detail="Only hard tasks require teacher approval"
             )
     else:
-        if not await service._is_project_leader(current_user.id, task.project_id):
+        if not permissions.is_leader(task.project_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only project leaders can approve tasks"
@@ -152,14 +186,15 @@ async def patch_task(
         task_id: int,
         task_data: TaskUpdate,
         service: TaskService = Depends(get_task_service),
-        current_user: User = Depends(get_current_user)
+        current_user: User = Depends(get_current_user),
+        permissions: PermissionContext = Depends(get_permission_context)
 ):
     task = await service.get_task(task_id, current_user.id)
 
     can_edit = (
-            current_user.is_teacher or
+            permissions.is_teacher or
             task.assignee_id == current_user.id or
-            await service._is_project_leader(current_user.id, task.project_id)
+            permissions.is_leader(task.project_id)
     )
 
     if not can_edit:
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, File, UploadFile
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, Query, Response, UploadFile
+from core.pagination import set_next_cursor
 from core.security import get_current_user
 from dependencies import get_user_service, get_project_service
 from services.user_service import UserService
 from models.schemas.users import UserResponse
 from models.schemas.users import UserUpdate
-from models.schemas.projects import ProjectCreate, ProjectUpdate, Project
+from models.schemas.projects import ProjectCreate, ProjectUpdate, Project, ProjectListItem
 from services.project_service import ProjectService
 
 
@@ -27,10 +30,15 @@ async def update_profile(
     return await service.update_profile(current_user.id, user_data)
 
 
-@router.get("/{user_id}/projects", response_model=list[Project])
+@router.get("/{user_id}/projects", response_model=list[ProjectListItem])
 async def get_all_projects(
     user_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
     service: ProjectService = Depends(get_project_service),
     current_user: dict = Depends(get_current_user)
 ):
-    return await service.get_all_public_projects(user_id)
\ No newline at end of file
+    page = await service.get_all_public_projects(user_id, limit, cursor)
+    set_next_cursor(response, page.next_cursor)
+    return page.items
\ No newline at end of file
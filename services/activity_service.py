@@ -5,6 +5,8 @@ from repositories.user_repository import UserRepository
 from models.schemas.activities import ActivityResponse
 from repositories.task_column_repository import TaskColumnRepository
 from datetime import datetime
+from core.pagination import decode_cursor, paginate
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class EntityType(str, Enum):
     TASK = "TASK"
@@ -25,9 +27,11 @@ class ActivityService:
         column_repository: TaskColumnRepository
     ):
         self.repository = activity_repository
+        self.uow = UnitOfWork(activity_repository.session)
         self.user_repository = user_repository
         self.column_repository = column_repository
     
+    @transactional
     async def log_activity(
         self,
         project_id: int,
@@ -53,16 +57,19 @@ class ActivityService:
         offset: int = 0,
         start_date: datetime = None,
         end_date: datetime = None,
-        action: str = None
+        action: str = None,
+        cursor: str = None
     ):
-        activities = await self.repository.get_project_activities(
+        rows = await self.repository.get_project_activities(
             project_id=project_id,
-            limit=limit,
+            limit=limit + 1,
             offset=offset,
             start_date=start_date,
             end_date=end_date,
-            action=action
+            action=action,
+            cursor=decode_cursor(cursor)
         )
+        activities, next_cursor = paginate(rows, limit)
         
         total = await self.repository.count_project_activities(
             project_id=project_id,
@@ -82,7 +89,7 @@ class ActivityService:
             
             formatted_activities.append(ActivityResponse(**activity_dict))
             
-        return {"items": formatted_activities, "total": total}
+        return {"items": formatted_activities, "total": total, "next_cursor": next_cursor}
 
     async def _format_activity_message(self, activity) -> str:
         """Форматирует сообщение об активности в человекочитаемый вид"""
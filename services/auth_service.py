@@ -1,3 +1,5 @@
+import uuid
+
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 from fastapi import Depends, HTTPException, status
@@ -5,41 +7,42 @@ from fastapi.security import OAuth2AuthorizationCodeBearer, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db import get_db
-from core.security import oauth2_scheme
+from core.security import oauth2_scheme, invalidate_token, get_token_key
 from models.schemas.users import UserResponse, Token, UserCreate, UserLogin
 from repositories.user_repository import UserRepository
 from core.config.settings import settings
+from core.http_client import get_http_client
+from core.oidc import verify_id_token
 import httpx
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class AuthService:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, http_client: httpx.AsyncClient | None = None):
         self.user_repo = user_repo
+        self.uow = UnitOfWork(user_repo.session)
+        self.http_client = http_client or get_http_client()
         self.oauth2_scheme = OAuth2AuthorizationCodeBearer(
             authorizationUrl=settings.SEVSU_AUTH_URL,
             tokenUrl=settings.SEVSU_TOKEN_URL
         )
         self.local_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login/local")
 
+    @transactional
     async def authenticate_user_sevsu(self, code: str) -> Token:
-        async with httpx.AsyncClient() as client:
-            token_data = {
-                "client_id": settings.SEVSU_CLIENT_ID,
-                "client_secret": settings.SEVSU_CLIENT_SECRET,
-                "code": code,
-                "grant_type": "authorization_code"
-            }
-            token_response = await client.post(settings.SEVSU_TOKEN_URL, data=token_data)
-            if token_response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid authorization code"
-                )
-            access_token = token_response.json()["access_token"]
-            user_response = await client.get(
-                settings.SEVSU_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
+        token_data = {
+            "client_id": settings.SEVSU_CLIENT_ID,
+            "client_secret": settings.SEVSU_CLIENT_SECRET,
+            "code": code,
+            "grant_type": "authorization_code"
+        }
+        token_response = await self.http_client.post(settings.SEVSU_TOKEN_URL, data=token_data)
+        if token_response.status_code != 200:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authorization code"
             )
-            user_info = user_response.json()
+        tokens = token_response.json()
+        user_info = await self._get_sevsu_user_info(tokens)
 
         user = await self.user_repo.get_by_sub(user_info["sub"])
         if not user:
@@ -49,16 +52,30 @@ class AuthService:
                 first_name=user_info.get("given_name"),
                 last_name=user_info.get("family_name"),
                 middle_name=user_info.get("middle_name"),
-                group=user_info.get("syncable_cohorts", [""])[0],
-                password=None
+                group=user_info.get("syncable_cohorts", [""])[0]
             )
             user = await self.user_repo.create_user(user_data)
 
         return await self.create_jwt(user)
 
+    async def _get_sevsu_user_info(self, tokens: dict) -> dict:
+        """Данные пользователя из ID token, а если его нельзя проверить - из userinfo"""
+        access_token = tokens["access_token"]
+        if settings.SEVSU_VERIFY_ID_TOKEN and tokens.get("id_token"):
+            claims = await verify_id_token(self.http_client, tokens["id_token"], access_token)
+            if claims and claims.get("email"):
+                return claims
+
+        user_response = await self.http_client.get(
+            settings.SEVSU_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        return user_response.json()
+
+    @transactional
     async def authenticate_user_local(self, email: str, password: str) -> Token:
         user = await self.user_repo.get_by_email(email)
-        if not user or not user.hashed_password or not self.user_repo.verify_password(password, user.hashed_password):
+        if not user or not user.hashed_password or not await self.user_repo.verify_password(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
@@ -74,18 +91,21 @@ class AuthService:
         user_id = user.id
         
         expires_at = datetime.utcnow() + timedelta(minutes=30)
+        jti = uuid.uuid4().hex
         payload = {
             "sub": str(user_id),
-            "exp": expires_at
+            "exp": expires_at,
+            "jti": jti
         }
         token = jwt.encode(
             payload,
             settings.JWT_SECRET,
             algorithm=settings.JWT_ALGORITHM
         )
-        await self.user_repo.create_token(user_id, token, expires_at)
+        await self.user_repo.create_token(user_id, jti, expires_at)
         return Token(access_token=token, token_type="bearer")
 
+    @transactional
     async def create_user(self, user: UserCreate) -> UserResponse:
         if await self.user_repo.get_by_email(user.email):
             raise HTTPException(
@@ -98,8 +118,32 @@ class AuthService:
             
         return await self.user_repo.create_user(user)
 
+    @transactional
     async def revoke_token(self, token: str) -> None:
-        await self.user_repo.revoke_token(token)
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET,
+                algorithms=[settings.JWT_ALGORITHM],
+                options={"verify_exp": False}
+            )
+        except JWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"}
+            )
+        await self.user_repo.revoke_token(get_token_key(token, payload))
+        await self.uow.after_commit(lambda: invalidate_token(token))
+
+    async def cleanup_expired_tokens(self, batch_size: int = settings.TOKEN_CLEANUP_BATCH_SIZE) -> int:
+        """Удаляет истекшие и отозванные токены пачками, возвращает число удаленных строк"""
+        total = 0
+        while True:
+            deleted = await self.user_repo.delete_expired_tokens(batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
 
     async def get_current_user_info(self, user_id: int) -> UserResponse:
         """
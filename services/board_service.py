@@ -0,0 +1,80 @@
+from typing import Optional
+
+from core.permissions import PermissionContext
+from models.schemas.board import Board, BoardColumn, BoardTask
+from models.schemas.projects import ProjectMember
+from models.schemas.sprints import SprintResponse
+from repositories.project_repository import ProjectRepository
+from repositories.sprint_repository import SprintRepository
+from repositories.task_column_repository import TaskColumnRepository
+from repositories.task_repository import TaskRepository
+
+
+class BoardService:
+    """Канбан-доска проекта одним ответом.
+
+    Колонки, задачи, участники и спринты читаются четырьмя запросами
+    независимо от числа задач; задачи раскладываются по колонкам в памяти.
+    """
+
+    def __init__(
+        self,
+        task_repo: TaskRepository,
+        column_repo: TaskColumnRepository,
+        sprint_repo: SprintRepository,
+        project_repo: ProjectRepository,
+        permissions: PermissionContext
+    ):
+        self.task_repo = task_repo
+        self.column_repo = column_repo
+        self.sprint_repo = sprint_repo
+        self.project_repo = project_repo
+        self.permissions = permissions
+
+    async def _check_project_access(self, project_id: int):
+        await self.permissions.require_member(self.project_repo, project_id)
+
+    async def get_board(
+        self,
+        project_id: int,
+        user_id: int,
+        sprint_id: Optional[int] = None,
+        assignee_id: Optional[int] = None
+    ) -> Board:
+        await self._check_project_access(project_id)
+
+        columns = await self.column_repo.get_by_project(project_id)
+        task_rows = await self.task_repo.get_board_tasks(project_id, sprint_id, assignee_id)
+        member_rows = await self.project_repo.get_project_members(project_id)
+        sprints = await self.sprint_repo.get_for_project_board(project_id)
+
+        # Колонки собираются по полям: from_attributes обратился бы к
+        # незагруженной связи TaskColumn.tasks
+        board_columns = {
+            column.id: BoardColumn(
+                id=column.id,
+                project_id=column.project_id,
+                name=column.name,
+                position=column.position,
+                color=column.color
+            )
+            for column in columns
+        }
+        unassigned = []
+        for row in task_rows:
+            task = BoardTask.model_validate(row)
+            column = board_columns.get(task.column_id)
+            if column is not None:
+                column.tasks.append(task)
+            else:
+                unassigned.append(task)
+
+        members = [ProjectMember.from_row(row) for row in member_rows]
+
+        return Board(
+            project_id=project_id,
+            columns=list(board_columns.values()),
+            unassigned_tasks=unassigned,
+            members=members,
+            sprints=[SprintResponse.model_validate(sprint) for sprint in sprints]
+        )
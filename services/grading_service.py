@@ -2,11 +2,14 @@ from typing import Optional
 from models.domain.tasks import TaskGrade, TaskStatus, TaskCompletionStatus
 from models.schemas.tasks import TaskGradeUpdate, ProjectGradingSettings
 from repositories.grading_repository import GradingRepository
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class GradingService:
     def __init__(self, grading_repository: GradingRepository):
         self.grading_repository = grading_repository
+        self.uow = UnitOfWork(grading_repository.session)
 
+    @transactional
     async def update_user_progress(self, task, user_id: int) -> None:
         if task.status not in [TaskStatus.APPROVED_BY_LEADER.value, TaskStatus.APPROVED_BY_TEACHER.value]:
             return
@@ -31,6 +34,7 @@ class GradingService:
         progress = await self.grading_repository.create_or_update_progress(progress_data)
         await self.calculate_auto_grade(progress)
 
+    @transactional
     async def calculate_auto_grade(self, progress) -> Optional[str]:
         settings = await self.grading_repository.get_grading_settings(progress.project_id)
         if not settings:
@@ -50,7 +54,7 @@ class GradingService:
             grade = "Fail"
 
         progress.auto_grade = grade
-        await self.grading_repository.session.commit()
+        await self.grading_repository.session.flush()
         return grade
 
     async def get_participants_progress(self, project_id: int) -> list[dict]:
@@ -76,6 +80,7 @@ class GradingService:
             
         return report
     
+    @transactional
     async def set_manual_grade(self, user_id: int, project_id: int, grade: str) -> None:
         """
         Set manual grade for a user in a project
@@ -95,7 +100,7 @@ class GradingService:
         else:
             # Update existing progress record
             progress.manual_grade = grade
-            await self.grading_repository.session.commit()
+            await self.grading_repository.session.flush()
 
     async def get_user_tasks_for_grading(self, project_id: int, user_id: int) -> dict:
         stats = {
@@ -135,6 +140,7 @@ class GradingService:
         
         return stats
 
+    @transactional
     async def update_task_grade(self, task_id: int, grade_data: TaskGradeUpdate) -> dict:
         grade_scores = {
             TaskGrade.HARD: 50,
@@ -168,5 +174,6 @@ class GradingService:
             "required_hard_tasks": settings.required_hard_tasks
         }
 
+    @transactional
     async def save_grading_settings(self, project_id: int, settings: ProjectGradingSettings) -> None:
         await self.grading_repository.save_grading_settings(project_id, settings.dict())
@@ -1,48 +1,68 @@
+import json
 import logging
 from fastapi import HTTPException, status, WebSocket, Depends
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from models.domain.messages import Message
 from repositories.message_repository import MessageRepository
 from repositories.project_repository import ProjectRepository
 from repositories.user_repository import UserRepository
 from models.schemas.messages import MessageCreate, MessageResponse
+from core.cache import TTLCache
 from core.db import get_db
+from core.config.settings import settings
+from core.connections import ClientConnection, ConnectionRegistry
+from core.broadcast import broadcast
+from core.permissions import PermissionContext
+from core.pagination import Page, decode_cursor, paginate
+from services.message_writer import MessageBatchWriter
 
 # Настройка логирования
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class MessageService:
-    _instance = None
+CHAT_TOPIC = "chat"
+# Исключение участника: воркеры закрывают его сокеты чата проекта
+CHAT_REVOKE_TOPIC = "chat_revoke"
+
+# Имя отправителя (фамилия) по user_id для ответов и рассылки без повторного
+# чтения пользователя; значение - кортеж, чтобы кэшировать и отсутствующую фамилию
+sender_names: TTLCache[tuple[str | None]] = TTLCache(
+    max_size=settings.CHAT_SENDER_NAME_CACHE_SIZE,
+    ttl=settings.CHAT_SENDER_NAME_CACHE_TTL_SECONDS
+)
+
 
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(MessageService, cls).__new__(cls)
-            cls._instance.websocket_connections = {}
-        return cls._instance
+def invalidate_sender_name(user_id: int) -> None:
+    sender_names.pop(user_id)
+
+class MessageService:
+    # Реестр WebSocket-соединений общий для всех экземпляров в процессе,
+    # репозитории и права - свои у каждого запроса
+    connections = ConnectionRegistry(
+        settings.WS_SEND_QUEUE_SIZE,
+        settings.WS_SLOW_CONSUMER_POLICY,
+        max_per_user=settings.WS_MAX_CONNECTIONS_PER_USER,
+        max_total=settings.WS_MAX_CONNECTIONS
+    )
 
     def __init__(
         self,
-        message_repository: MessageRepository = Depends(),
-        project_repository: ProjectRepository = Depends(),
-        user_repository: UserRepository = Depends(),
+        message_repository: MessageRepository,
+        project_repository: ProjectRepository,
+        user_repository: UserRepository,
+        permissions: PermissionContext,
+        message_writer: MessageBatchWriter,
     ):
-        if not hasattr(self, 'initialized'):
-            self.message_repository = message_repository
-            self.project_repository = project_repository
-            self.user_repository = user_repository
-            self.initialized = True
+        self.message_repository = message_repository
+        self.project_repository = project_repository
+        self.user_repository = user_repository
+        self.permissions = permissions
+        self.message_writer = message_writer
 
     async def _validate_project_access(self, project_id: int, user_id: int | None):
         if user_id is None:
             logger.warning(f"Пропущена проверка доступа для project_id={project_id}")
             return
-        project = await self.project_repository.get_by_id(project_id)
-        project_users = await self.project_repository.get_project_users(project_id)
-        logger.info(f"project_users={project_users}")
-        if not project or not any(user.id == user_id for user in project_users):
+        if not self.permissions.is_member(project_id):
             logger.error(f"Нет доступа к проекту {project_id} для user_id={user_id}")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -50,70 +70,73 @@ class MessageService:
             )
         logger.info(f"Доступ к проекту {project_id} подтвержден для user_id={user_id}")
 
+    async def _sender_name(self, user_id: int) -> str | None:
+        cached = sender_names.get(user_id)
+        if cached is not None:
+            return cached[0]
+        user = await self.user_repository.get_by_id(user_id)
+        name = user.last_name if user else "Anonymous"
+        sender_names.set(user_id, (name,))
+        return name
+
     async def create_message(self, project_id: int, message_data: MessageCreate, user_id: int | None) -> MessageResponse:
+        """Записывает сообщение в пачке MessageBatchWriter и рассылает его после коммита пачки"""
         await self._validate_project_access(project_id, user_id)
 
-        message = await self.message_repository.create({
+        sender_id = user_id if user_id else 0
+        row = await self.message_writer.submit({
             "project_id": project_id,
-            "sender_id": user_id if user_id else 0,
+            "sender_id": sender_id,
             "content": message_data.content,
         })
-        logger.info(f"Создано сообщение id={message.id} для project_id={project_id}")
-
-        query = await self.message_repository.session.execute(
-            select(Message)
-            .options(
-                selectinload(Message.project),
-                selectinload(Message.sender),
-            )
-            .filter_by(id=message.id)
-        )
-        message = query.scalar_one()
-
-        response = MessageResponse.model_validate({
-            **message.__dict__,
-            "sender_name": message.sender.last_name if message.sender else "Anonymous",
-        })
-        logger.info(f"Подготовлено сообщение для рассылки: {response}")
+        logger.info(f"Создано сообщение id={row['id']} для project_id={project_id}")
 
+        response = MessageResponse(**row, sender_name=await self._sender_name(sender_id))
         await self.broadcast_message(project_id, response)
         return response
 
-    async def get_messages_by_project(self, project_id: int, user_id: int | None) -> list[MessageResponse]:
+    async def get_messages_by_project(
+        self,
+        project_id: int,
+        user_id: int | None,
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Page[MessageResponse]:
         await self._validate_project_access(project_id, user_id)
-        messages = await self.message_repository.get_messages_by_project(project_id)
+        rows = await self.message_repository.get_messages_by_project(project_id, limit + 1, decode_cursor(cursor))
+        messages, next_cursor = paginate(rows, limit)
         logger.info(f"Получено {len(messages)} сообщений для project_id={project_id}")
-        return [
+        return Page([
             MessageResponse.model_validate({
                 **message.__dict__,
                 "sender_name": message.sender.last_name if message.sender else "Anonymous",
             })
             for message in messages
-        ]
+        ], next_cursor)
 
-    async def connect(self, websocket: WebSocket, project_id: int, user_id: int | None):
+    async def connect(self, websocket: WebSocket, project_id: int, user_id: int | None) -> ClientConnection:
         await self._validate_project_access(project_id, user_id)
-        await websocket.accept()
-        if project_id not in self.websocket_connections:
-            self.websocket_connections[project_id] = []
-        if websocket not in self.websocket_connections[project_id]:
-            self.websocket_connections[project_id].append(websocket)
-        logger.info(f"Клиент подключен к project_id={project_id}. Всего соединений: {len(self.websocket_connections[project_id])}")
+        reason = self.connections.reserve(user_id)
+        if reason:
+            self.connections.rejected += 1
+            logger.warning(f"Отказ в подключении к project_id={project_id} для user_id={user_id}: {reason}")
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=reason)
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=reason)
+        try:
+            await websocket.accept()
+        except BaseException:
+            self.connections.release(user_id)
+            raise
+        connection = self.connections.add(project_id, websocket, user_id, reserved=True)
+        logger.info(f"Клиент подключен к project_id={project_id}. Всего соединений: {self.connections.count(project_id)}")
+        return connection
 
     async def disconnect(self, websocket: WebSocket, project_id: int):
-        if project_id in self.websocket_connections and websocket in self.websocket_connections[project_id]:
-            self.websocket_connections[project_id].remove(websocket)
-            logger.info(f"Клиент отключен от project_id={project_id}. Осталось соединений: {len(self.websocket_connections[project_id])}")
-            if not self.websocket_connections[project_id]:
-                del self.websocket_connections[project_id]
-                logger.info(f"Все клиенты отключены от project_id={project_id}")
+        await self.connections.remove(project_id, websocket)
+        logger.info(f"Клиент отключен от project_id={project_id}. Осталось соединений: {self.connections.count(project_id)}")
 
     async def broadcast_message(self, project_id: int, message: MessageResponse):
-        if project_id not in self.websocket_connections:
-            logger.warning(f"Нет активных соединений для project_id={project_id}")
-            return
-
-        logger.info(f"Рассылка сообщения для {len(self.websocket_connections[project_id])} клиентов в project_id={project_id}")
+        """Публикует сообщение один раз; каждый воркер ставит его в очереди своих клиентов проекта"""
         message_data = {
             "id": message.id,
             "project_id": message.project_id,
@@ -122,14 +145,21 @@ class MessageService:
             "created_at": message.created_at.isoformat(),
             "sender_name": message.sender_name,
         }
-        disconnected_clients = []
-        for websocket in self.websocket_connections[project_id][:]:
-            try:
-                await websocket.send_json(message_data)
-                logger.info(f"Сообщение отправлено клиенту в project_id={project_id}")
-            except Exception as e:
-                logger.error(f"Ошибка отправки клиенту в project_id={project_id}: {e}")
-                disconnected_clients.append(websocket)
-
-        for websocket in disconnected_clients:
-            await self.disconnect(websocket, project_id)
\ No newline at end of file
+        await broadcast.publish(CHAT_TOPIC, project_id, message_data)
+        logger.info(f"Сообщение id={message.id} опубликовано для project_id={project_id}")
+
+
+async def revoke_chat_access(project_id: int, user_id: int) -> None:
+    """Закрывает открытые сокеты чата пользователя во всех воркерах"""
+    await broadcast.publish(CHAT_REVOKE_TOPIC, project_id, {"user_id": user_id})
+
+
+def _close_revoked(project_id: int, frame: str) -> None:
+    user_id = json.loads(frame)["user_id"]
+    closed = MessageService.connections.close_user(project_id, user_id, status.WS_1008_POLICY_VIOLATION)
+    if closed:
+        logger.info(f"Закрыто {closed} сокетов user_id={user_id} в project_id={project_id}: доступ отозван")
+
+
+broadcast.subscribe(CHAT_TOPIC, MessageService.connections.broadcast)
+broadcast.subscribe(CHAT_REVOKE_TOPIC, _close_revoked)
\ No newline at end of file
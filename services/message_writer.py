@@ -0,0 +1,95 @@
+import asyncio
+import contextlib
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from repositories.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MessageBatchWriter:
+    """Групповая запись сообщений чата.
+
+    Сообщения, пришедшие в пределах window секунд (или до max_batch штук),
+    записываются одним INSERT ... RETURNING в одной транзакции. submit
+    возвращает строку сообщения только после коммита его пачки. Если пачка не
+    записалась, сообщения повторяются по одному, чтобы ошибка одного
+    (например, нарушение внешнего ключа) не отклоняла остальные.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, window: float, max_batch: int):
+        self.session_factory = session_factory
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._full = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self.batches = 0
+        self.messages = 0
+        self.failed = 0
+
+    async def submit(self, message_data: dict) -> dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((message_data, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._run())
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+        return await future
+
+    async def close(self) -> None:
+        """Дожидается записи уже принятых сообщений"""
+        if self._flush_task is not None:
+            self._full.set()
+            with contextlib.suppress(Exception):
+                await self._flush_task
+
+    async def _run(self) -> None:
+        # Первая пачка ждет окно; сообщения, пришедшие во время записи,
+        # уже подождали и уходят следующей пачкой сразу
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._full.wait(), self.window)
+        while self._pending:
+            self._full.clear()
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            await self._write(batch)
+
+    async def _write(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        try:
+            rows = await self._insert([data for data, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                self.failed += 1
+                logger.error(f"Ошибка записи сообщения: {e}")
+                if not batch[0][1].done():
+                    batch[0][1].set_exception(e)
+                return
+            logger.warning(f"Ошибка записи пачки из {len(batch)} сообщений, запись по одному: {e}")
+            for item in batch:
+                await self._write([item])
+            return
+
+        self.batches += 1
+        self.messages += len(batch)
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(dict(row._mapping))
+
+    async def _insert(self, messages: list[dict]) -> list:
+        async with self.session_factory() as session:
+            rows = await MessageRepository(session).create_many(messages)
+            await session.commit()
+            return rows
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "avg_batch_size": round(self.messages / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self._pending),
+            "failed": self.failed,
+        }
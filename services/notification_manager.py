@@ -1,40 +1,58 @@
-from typing import Dict
-from fastapi import WebSocket
+from typing import Optional
+from fastapi import HTTPException, WebSocket, status
+from core.broadcast import BroadcastBackend
+from core.config.settings import settings
+from core.connections import ClientConnection, ConnectionRegistry
 from models.schemas.notifications import NotificationResponse
 
+NOTIFICATIONS_TOPIC = "notifications"
+
+
 class NotificationManager:
-    def __init__(self):
-        self.websocket_connections: Dict[int, WebSocket] = {}
+    def __init__(self, backend: Optional[BroadcastBackend] = None):
+        """Без backend уведомления доставляются только сокетам этого менеджера"""
+        self.connections = ConnectionRegistry(
+            settings.WS_SEND_QUEUE_SIZE,
+            settings.WS_SLOW_CONSUMER_POLICY,
+            max_per_user=settings.WS_MAX_CONNECTIONS_PER_USER,
+            max_total=settings.WS_MAX_CONNECTIONS
+        )
+        self.backend = backend
+        if backend is not None:
+            backend.subscribe(NOTIFICATIONS_TOPIC, self.connections.broadcast)
 
-    async def connect(self, websocket: WebSocket, user_id: int):
+    async def connect(self, websocket: WebSocket, user_id: int) -> ClientConnection:
         """Подключение нового пользователя"""
-        await websocket.accept()
-        self.websocket_connections[user_id] = websocket
+        reason = self.connections.reserve(user_id)
+        if reason:
+            self.connections.rejected += 1
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=reason)
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=reason)
+        try:
+            await websocket.accept()
+        except BaseException:
+            self.connections.release(user_id)
+            raise
+        return self.connections.add(user_id, websocket, user_id, reserved=True)
 
-    async def disconnect(self, user_id: int = None):
-        """Отключение пользователя или всех пользователей"""
-        if user_id:
-            if user_id in self.websocket_connections:
-                try:
-                    await self.websocket_connections[user_id].close()
-                except:
-                    pass
-                del self.websocket_connections[user_id]
+    async def disconnect(self, user_id: int = None, websocket: WebSocket = None):
+        """Отключение сокета пользователя или всех пользователей"""
+        if user_id is None:
+            await self.connections.close_all()
+        elif websocket is not None:
+            await self.connections.remove(user_id, websocket)
         else:
-            for ws in self.websocket_connections.values():
-                try:
-                    await ws.close()
-                except:
-                    pass
-            self.websocket_connections.clear()
-            
+            for connection in list(self.connections.groups.get(user_id, {}).values()):
+                connection.abort(status.WS_1000_NORMAL_CLOSURE)
+                await connection.close()
+
     async def send_notification(self, user_id: int, notification: NotificationResponse):
-        """Отправка уведомления через WebSocket"""
-        if connection := self.websocket_connections.get(user_id):
-            try:
-                await connection.send_json({
-                    "type": "notification",
-                    "data": notification.model_dump()
-                })
-            except Exception:
-                await self.disconnect(user_id)
\ No newline at end of file
+        """Публикует уведомление; доставляет воркер, держащий сокет пользователя"""
+        frame = {
+            "type": "notification",
+            "data": notification.model_dump(mode="json")
+        }
+        if self.backend is None:
+            self.connections.broadcast(user_id, frame)
+        else:
+            await self.backend.publish(NOTIFICATIONS_TOPIC, user_id, frame)
@@ -10,6 +10,8 @@ from models.schemas.notifications import (
 from models.domain.notifications import NotificationType
 from repositories.notification_repository import NotificationRepository
 from .notification_manager import NotificationManager
+from core.pagination import Page, decode_cursor, paginate
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class NotificationObserver(Protocol):
     async def on_task_assigned(self, user_id: int, task_id: int, task_title: str, project_id: int, project_name: str) -> None:
@@ -27,6 +29,7 @@ class NotificationObserver(Protocol):
 class NotificationService(NotificationObserver):
     def __init__(self, repository: NotificationRepository, notification_manager: NotificationManager):
         self.repository = repository
+        self.uow = UnitOfWork(repository.session)
         self.notification_manager = notification_manager
 
     def _validate_metadata(self, type: NotificationType, metadata: Dict[str, Any]):
@@ -42,6 +45,7 @@ class NotificationService(NotificationObserver):
         if validator := validators.get(type):
             validator(**metadata)
 
+    @transactional
     async def create_notification(
         self,
         user_id: int,
@@ -64,7 +68,9 @@ class NotificationService(NotificationObserver):
         )
         
         notification_response = NotificationResponse.model_validate(notification)
-        await self.notification_manager.send_notification(user_id, notification_response)
+        await self.uow.after_commit(
+            lambda: self.notification_manager.send_notification(user_id, notification_response)
+        )
         return notification_response
 
     async def get_user_notifications(
@@ -72,22 +78,28 @@ class NotificationService(NotificationObserver):
         user_id: int,
         skip: int = 0,
         limit: int = 50,
-        unread_only: bool = False
-    ) -> List[NotificationResponse]:
-        notifications = await self.repository.get_user_notifications(
-            user_id, skip, limit, unread_only
+        unread_only: bool = False,
+        cursor: Optional[str] = None
+    ) -> Page[NotificationResponse]:
+        rows = await self.repository.get_user_notifications(
+            user_id, skip, limit + 1, unread_only, decode_cursor(cursor)
         )
-        return [NotificationResponse.model_validate(n) for n in notifications]
+        notifications, next_cursor = paginate(rows, limit)
+        return Page([NotificationResponse.model_validate(n) for n in notifications], next_cursor)
 
+    @transactional
     async def mark_as_read(self, notification_id: int, user_id: int) -> bool:
         return await self.repository.mark_as_read(notification_id, user_id)
 
+    @transactional
     async def mark_all_as_read(self, user_id: int) -> bool:
         return await self.repository.mark_all_as_read(user_id)
 
+    @transactional
     async def delete_notification(self, notification_id: int, user_id: int) -> bool:
         return await self.repository.delete(notification_id, user_id)
 
+    @transactional
     async def cleanup_old_notifications(self) -> int:
         return await self.repository.cleanup_old_notifications()
 
@@ -4,7 +4,7 @@ from fastapi import HTTPException, status, UploadFile
 from io import BytesIO
 
 from models.domain.projects import Project
-from models.schemas.projects import ProjectCreate, ProjectUpdate
+from models.schemas.projects import ProjectCreate, ProjectUpdate, ProjectListItem, ProjectMember
 from models.schemas.users import UserResponse
 from repositories.project_repository import ProjectRepository
 from repositories.task_column_repository import TaskColumnRepository
@@ -12,8 +12,12 @@ from repositories.user_repository import UserRepository
 from models.domain.users import User
 from models.domain.user_project import Role
 from services.notification_service import NotificationService
+from services.message_service import revoke_chat_access
 from core.storage.service import StorageService
+from core.permissions import PermissionContext
 from core.storage.utils import validate_file_type, validate_file_size, get_safe_filename
+from core.db.unit_of_work import UnitOfWork, transactional
+from core.pagination import Page, decode_sort_cursor, encode_sort_cursor, paginate
 
 
 class ProjectService:
@@ -23,22 +27,25 @@ class ProjectService:
         notification_service: NotificationService,
         column_repository: TaskColumnRepository,
         storage_service: StorageService,
-        user_repo: UserRepository  
+        user_repo: UserRepository,
+        permissions: PermissionContext
     ):
         self.project_repo = project_repository
+        self.uow = UnitOfWork(project_repository.session)
         self.notification_service = notification_service
         self.column_repo = column_repository
         self.storage_service = storage_service
         self.user_repo = user_repo
+        self.permissions = permissions
 
     async def validate_project_access(self, project_id: int, user_id: int):
-        project = await self.project_repo.get_by_id(project_id)
-        if not project or project.owner_id != user_id:
+        if not self.permissions.is_owner(project_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="No access to project"
             )
 
+    @transactional
     async def create_project(self, project_data: dict, owner_id: int) -> Project:
         project = await self.project_repo.create({
             **project_data,
@@ -62,28 +69,65 @@ class ProjectService:
         return projects
 
     async def get_project(self, project_id: int, user_id: int) -> Optional[Project]:
+        await self.permissions.require_member(self.project_repo, project_id)
         project = await self.project_repo.get_by_id(project_id)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found"
             )
-        # Проверяем, является ли пользователь участником проекта
-        user_ids = [u.id for u in project.users]
-        if user_id not in user_ids and project.owner_id != user_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have access to this project"
-            )
         return project
 
-    async def get_all_projects(self, user_id: int) -> Sequence[Project]:
-        return await self.project_repo.get_all_for_user(user_id)
+    async def is_project_member(self, project_id: int, user_id: int) -> bool:
+        """Состоит ли в проекте другой пользователь (для текущего есть PermissionContext)"""
+        return await self.project_repo.is_member(project_id, user_id)
 
-    async def get_all_public_projects(self, user_id: int) -> Sequence[Project]:
-        projects = await self.get_all_projects(user_id)
-        return [project for project in projects if not project.is_private]
+    async def get_all_projects(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        members_limit: int = 0,
+        public_only: bool = False
+    ) -> Page[ProjectListItem]:
+        """Проекты пользователя с числом участников и, по запросу, первыми участниками.
+
+        Два запроса независимо от числа проектов и участников; без limit
+        возвращается весь список.
+        """
+        after = decode_sort_cursor(cursor, "-id")
+        rows = await self.project_repo.list_for_user(
+            user_id,
+            limit=limit,
+            before_id=after[1] if after else None,
+            public_only=public_only
+        )
+        page = Page(rows, None) if limit is None else paginate(
+            rows, limit, lambda row: encode_sort_cursor("-id", row.Project.id, row.Project.id)
+        )
+
+        members = await self.project_repo.get_members_preview(
+            [row.Project.id for row in page.items], members_limit
+        )
+        items = []
+        for row in page.items:
+            item = ProjectListItem.model_validate(row.Project)
+            item.member_count = row.member_count
+            if members_limit > 0:
+                item.members = [ProjectMember.from_row(member) for member in members.get(row.Project.id, [])]
+            items.append(item)
+        return Page(items, page.next_cursor)
+
+    async def get_all_public_projects(
+        self,
+        user_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Page[ProjectListItem]:
+        # Участники чужих проектов не раскрываются: /projects/{id}/users требует членства
+        return await self.get_all_projects(user_id, limit, cursor, public_only=True)
 
+    @transactional
     async def update_project(
         self,
         project_id: int,
@@ -99,6 +143,7 @@ class ProjectService:
             )
         return await self.project_repo.update(project_id, project_data.model_dump(exclude_unset=True))
 
+    @transactional
     async def delete_project(self, project_id: int, user_id: int) -> None:
         project = await self.get_project(project_id, user_id)
         # Только владелец может удалять проект
@@ -109,6 +154,7 @@ class ProjectService:
             )
         await self.project_repo.delete(project_id)
 
+    @transactional
     async def add_user_to_project(
         self,
         project_id: int,
@@ -135,6 +181,7 @@ class ProjectService:
         
         return project
 
+    @transactional
     async def remove_user_from_project(self, project_id: int, user_id: int, current_user_id: int) -> None:
         project = await self.get_project(project_id, current_user_id)
         if project.owner_id != current_user_id:
@@ -148,27 +195,13 @@ class ProjectService:
                 detail="Cannot remove project owner"
             )
         await self.project_repo.remove_user_from_project(project_id, user_id)
+        await self.uow.after_commit(lambda: revoke_chat_access(project_id, user_id))
 
     async def get_project_users(self, project_id: int, user_id: int) -> Sequence[UserResponse]:
-        await self.get_project(project_id, user_id)  # Проверка доступа
+        await self.permissions.require_member(self.project_repo, project_id)
         return await self.project_repo.get_project_users(project_id)
 
-    async def _is_user_project_leader(self, user_id: int, project_id: int) -> bool:
-        """
-        Check if user is project leader (owner or admin)
-        """
-        user = await self.project_repo.session.get(User, user_id)
-        if not user:
-            return False
-        
-        # Check if user is project owner
-        project = await self.project_repo.get_by_id(project_id)
-        if project and project.owner_id == user_id:
-            return True
-            
-        # Check if user is project admin
-        return user.is_project_leader(project_id)
-
+    @transactional
     async def update_project_logo(self, project_id: int, file: UploadFile, user_id: int) -> Project:
         """Обновляет логотип проекта"""
         await self.validate_project_access(project_id, user_id)
@@ -2,6 +2,8 @@ from fastapi import HTTPException
 from models.domain.reports import Report
 from repositories.report_repository import ReportRepository
 from services.project_service import ProjectService
+from core.pagination import Page, decode_cursor, paginate
+from core.db.unit_of_work import UnitOfWork, transactional
 
 
 class ReportService:
@@ -11,8 +13,10 @@ class ReportService:
         project_service: ProjectService,
     ):
         self.report_repository = report_repository
+        self.uow = UnitOfWork(report_repository.session)
         self.project_service = project_service
 
+    @transactional
     async def create(self, report_data: dict, current_user_id: int) -> Report:
         await self._check_project_access(report_data["project_id"], current_user_id)
         return await self.report_repository.create(report_data)
@@ -24,6 +28,7 @@ class ReportService:
         await self._check_project_access(report.project_id, current_user_id)
         return report
 
+    @transactional
     async def update_report(self, report_id: int, update_data: dict, current_user_id: int):
         report = await self.report_repository.get_by_id(report_id)
         if not report:
@@ -31,6 +36,7 @@ class ReportService:
         await self._check_project_access(report.project_id, current_user_id)
         return await self.report_repository.update(report_id, update_data)
 
+    @transactional
     async def delete_report(self, report_id: int, current_user_id: int) -> bool:
         report = await self.report_repository.get_by_id(report_id)
         if not report:
@@ -38,9 +44,16 @@ class ReportService:
         await self._check_project_access(report.project_id, current_user_id)
         return await self.report_repository.delete(report_id)
 
-    async def get_reports_for_project(self, project_id: int, current_user_id: int, limit: int = 50):
+    async def get_reports_for_project(
+        self,
+        project_id: int,
+        current_user_id: int,
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Page[Report]:
         await self._check_project_access(project_id, current_user_id)
-        return await self.report_repository.get_reports_by_project(project_id, limit)
+        rows = await self.report_repository.get_reports_by_project(project_id, limit + 1, decode_cursor(cursor))
+        return paginate(rows, limit)
 
     async def _check_project_access(self, project_id: int, current_user_id: int):
         await self.project_service.validate_project_access(project_id, current_user_id)
\ No newline at end of file
@@ -7,20 +7,29 @@ from models.domain.sprints import Sprint
 from repositories.sprint_repository import SprintRepository
 from repositories.project_repository import ProjectRepository
 from models.schemas.sprints import SprintResponse
+from core.permissions import PermissionContext
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class SprintService:
-    def __init__(self, sprint_repository: SprintRepository, project_repo: ProjectRepository):
+    def __init__(
+        self,
+        sprint_repository: SprintRepository,
+        project_repo: ProjectRepository,
+        permissions: PermissionContext
+    ):
         self.sprint_repository = sprint_repository
+        self.uow = UnitOfWork(sprint_repository.session)
         self.project_repo = project_repo
+        self.permissions = permissions
 
     async def _validate_project_access(self, project_id: int, user_id: int):
-        project = await self.project_repo.get_by_id(project_id)
-        if not project or project.owner_id != user_id:
+        if not self.permissions.is_owner(project_id):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="No access to project"
             )
 
+    @transactional
     async def create_sprint(self, sprint_data: dict, user_id: int) -> SprintResponse:
         await self._validate_project_access(sprint_data["project_id"], user_id)
         sprint = await self.sprint_repository.create(sprint_data)
@@ -47,11 +56,13 @@ class SprintService:
         sprints = await self.sprint_repository.get_for_project(project_id)
         return [SprintResponse.model_validate(s) for s in sprints]
 
+    @transactional
     async def update_sprint(self, sprint_id: int, update_data: dict, user_id: int) -> SprintResponse:
         sprint = await self.get_sprint(sprint_id, user_id)
         updated = await self.sprint_repository.update(sprint_id, update_data)
         return SprintResponse.model_validate(updated)
 
+    @transactional
     async def delete_sprint(self, sprint_id: int, user_id: int) -> None:
         await self.get_sprint(sprint_id, user_id)
         await self.sprint_repository.delete(sprint_id)
\ No newline at end of file
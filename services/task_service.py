@@ -8,11 +8,14 @@ from models.domain.users import User
 from repositories.task_repository import TaskRepository
 from repositories.project_repository import ProjectRepository
 from repositories.sprint_repository import SprintRepository
-from models.schemas.tasks import TaskResponse
+from models.schemas.tasks import TaskListQuery, TaskResponse, TaskSearchResult
 from services.grading_service import GradingService
 from services.notification_service import NotificationService, NotificationObserver
 from models.domain.notifications import NotificationType
 from services.activity_service import ActivityService, EntityType, ActionType
+from core.permissions import PermissionContext
+from core.db.unit_of_work import UnitOfWork, transactional
+from core.pagination import Page, decode_sort_cursor, encode_sort_cursor, paginate
 
 
 class TaskService:
@@ -23,23 +26,26 @@ class TaskService:
         sprint_repository: SprintRepository,
         grading_service: GradingService,
         notification_observer: NotificationObserver,
-        activity_service: ActivityService
+        activity_service: ActivityService,
+        permissions: PermissionContext
     ):
         self.task_repository = task_repository
+        self.uow = UnitOfWork(task_repository.session)
         self.project_repository = project_repository
         self.sprint_repository = sprint_repository
         self.grading_service = grading_service
         self.notification_observer = notification_observer
         self.activity_service = activity_service
+        self.permissions = permissions
 
     async def validate_project_access(self, project_id: int, user_id: int):
-        project = await self.project_repository.get_by_id(project_id)
-        # if not project or project.owner_id != user_id:
-        #     raise HTTPException(
-        #         status_code=status.HTTP_403_FORBIDDEN,
-        #         detail="No access to project"
-        #     )
+        if not self.permissions.is_member(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="No access to project"
+            )
 
+    @transactional
     async def create_task(self, task_data: dict, user_id: int) -> TaskResponse:
         await self.validate_project_access(task_data["project_id"], user_id)
 
@@ -84,36 +90,78 @@ class TaskService:
             changes=task_data
         )
 
-        task = await self.task_repository.get_by_id(task.id)
-        return TaskResponse.model_validate(task)
+        return await self._task_response(task.id)
+
+    async def _task_response(self, task_id: int) -> TaskResponse | None:
+        row = await self.task_repository.get_task_row(task_id)
+        return TaskResponse.from_row(row) if row else None
 
     async def get_task(self, task_id: int, user_id: int) -> TaskResponse:
-        task = await self.task_repository.get_by_id(task_id)
+        task = await self._task_response(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
 
         await self.validate_project_access(task.project_id, user_id)
-        return TaskResponse.model_validate(task)
+        return task
 
-    async def get_tasks_by_project(self, project_id: int, user_id: int) -> list[TaskResponse]:
+    async def get_tasks_by_project(
+        self,
+        project_id: int,
+        user_id: int,
+        filters: TaskListQuery | None = None
+    ) -> Page[TaskResponse]:
         await self.validate_project_access(project_id, user_id)
-        tasks = await self.task_repository.get_tasks_by_project(project_id)
-        return [TaskResponse.model_validate(task) for task in tasks]
+        filters = filters or TaskListQuery()
+        rows = await self.task_repository.get_task_rows_by_project(
+            project_id,
+            filters,
+            after=decode_sort_cursor(filters.cursor, filters.sort)
+        )
+        responses = [TaskResponse.from_row(row) for row in rows]
+        if filters.limit is None:
+            return Page(responses, None)
+        return paginate(
+            responses,
+            filters.limit,
+            lambda task: encode_sort_cursor(filters.sort, getattr(task, filters.sort_key), task.id)
+        )
+
+    async def search_tasks(
+        self,
+        project_id: int,
+        user_id: int,
+        text: str,
+        limit: int = 20,
+        cursor: str | None = None
+    ) -> Page[TaskSearchResult]:
+        await self.validate_project_access(project_id, user_id)
+        after = decode_sort_cursor(cursor, "rank")
+        if after is not None:
+            value, last_id = after
+            try:
+                after = (float(value), last_id)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+        rows = await self.task_repository.search_tasks(project_id, text, limit, after)
+        results = [TaskSearchResult.model_validate(dict(row)) for row in rows]
+        return paginate(results, limit, lambda result: encode_sort_cursor("rank", result.rank, result.id))
 
     async def get_tasks_by_sprint(self, sprint_id: int, user_id: int) -> list[TaskResponse]:
-        sprint = await self.sprint_repository.get_by_id(sprint_id)
-        if not sprint:
+        project_id = await self.sprint_repository.get_project_id(sprint_id)
+        if project_id is None:
             raise HTTPException(status_code=404, detail="Sprint not found")
 
-        await self.validate_project_access(sprint.project_id, user_id)
-        tasks = await self.task_repository.get_tasks_by_sprint(sprint_id)
-        return [TaskResponse.model_validate(task) for task in tasks]
+        await self.validate_project_access(project_id, user_id)
+        rows = await self.task_repository.get_task_rows_by_sprint(sprint_id)
+        return [TaskResponse.from_row(row) for row in rows]
 
+    @transactional
     async def update_task(self, task_id: int, update_data: dict, user_id: int) -> TaskResponse:
         task = await self.get_task(task_id, user_id)
         if update_data.get("sprint_id"):
             sprint = await self.sprint_repository.get_by_id(update_data["sprint_id"])
-            if not sprint or sprint.project_id != task.project.id:
+            if not sprint or sprint.project_id != task.project_id:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Invalid sprint_id for the project"
@@ -128,18 +176,17 @@ class TaskService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Invalid column_id for the project"
                 )
-        updated = await self.task_repository.update(task_id, update_data)
-        task_response = TaskResponse.model_validate(task)
-        updated_response = TaskResponse.model_validate(updated)
+        await self.task_repository.update(task_id, update_data)
+        updated_response = await self._task_response(task_id)
 
         await self.activity_service.log_activity(
-            project_id=updated.project_id,
+            project_id=updated_response.project_id,
             user_id=user_id,
             entity_type=EntityType.TASK,
             entity_id=task_id,
             action=ActionType.UPDATE,
             changes={
-                "old": task_response.model_dump(),
+                "old": task.model_dump(),
                 "new": updated_response.model_dump(),
                 "changed_fields": update_data
             }
@@ -147,6 +194,7 @@ class TaskService:
 
         return updated_response
 
+    @transactional
     async def update_task_partial(
             self,
             task_id: int,
@@ -159,7 +207,7 @@ class TaskService:
             new_status = update_data["status"]
             # Проверка прав на изменение статуса
             if new_status == TaskStatus.APPROVED_BY_LEADER.value:
-                if not await self._is_project_leader(user_id, task.project_id):
+                if not self.permissions.is_leader(task.project_id):
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="Only project leaders can approve tasks"
@@ -171,7 +219,7 @@ class TaskService:
                     )
 
             if new_status == TaskStatus.APPROVED_BY_TEACHER.value:
-                if not await self._is_teacher(user_id):
+                if not self.permissions.is_teacher:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
                         detail="Only teachers can perform this action"
@@ -192,8 +240,7 @@ class TaskService:
             )
 
         updated = await self.task_repository.update_partial(task_id, update_data)
-        task_response = TaskResponse.model_validate(task)
-        updated_response = TaskResponse.model_validate(updated)
+        updated_response = await self._task_response(task_id)
 
         if "status" in update_data and update_data["status"] in [
             TaskStatus.APPROVED_BY_LEADER.value,
@@ -202,7 +249,7 @@ class TaskService:
             await self.grading_service.update_user_progress(updated, updated.assignee_id)
 
         changes = {
-            "old": task_response.model_dump(),
+            "old": task.model_dump(),
             "new": updated_response.model_dump(),
             "changed_fields": update_data
         }
@@ -218,9 +265,9 @@ class TaskService:
 
         return updated_response
 
+    @transactional
     async def delete_task(self, task_id: int, user_id: int) -> None:
         task = await self.get_task(task_id, user_id)
-        task_response = TaskResponse.model_validate(task)
         await self.task_repository.delete(task_id)
 
         await self.activity_service.log_activity(
@@ -229,17 +276,10 @@ class TaskService:
             entity_type=EntityType.TASK,
             entity_id=task_id,
             action=ActionType.DELETE,
-            changes={"task": task_response.model_dump()}
+            changes={"task": task.model_dump()}
         )
 
-    async def _is_project_leader(self, user_id: int, project_id: int) -> bool:
-        user = await self.task_repository.session.get(User, user_id)
-        return user.is_project_leader(project_id)
-
-    async def _is_teacher(self, user_id: int) -> bool:
-        user = await self.task_repository.session.get(User, user_id)
-        return user.is_teacher
-
+    @transactional
     async def assign_task(self, task_id: int, assignee_id: int) -> Task:
         task = await self.task_repository.assign_task(task_id, assignee_id)
         if task and task.project:
@@ -252,6 +292,7 @@ class TaskService:
             )
         return task
 
+    @transactional
     async def update_task_status(self, task_id: int, status: str) -> Task:
         task = await self.task_repository.update_task_status(task_id, status)
         if task and task.assignee_id:
@@ -274,6 +315,7 @@ class TaskService:
         related_tasks = await self.task_repository.get_related_tasks(task_id)
         return [TaskResponse.model_validate(task) for task in related_tasks]
 
+    @transactional
     async def create_task_relation(
         self, 
         source_task_id: int,
@@ -321,6 +363,7 @@ class TaskService:
         
         return await self.get_task(source_task_id, user_id)
 
+    @transactional
     async def delete_task_relation(
         self,
         source_task_id: int,
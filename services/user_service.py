@@ -5,16 +5,21 @@ from models.domain.users import User
 from models.schemas.users import UserResponse, UserUpdate
 from core.storage.utils import validate_file_type, validate_file_size, get_safe_filename
 from core.storage.service import StorageService
+from core.security import invalidate_user
+from services.message_service import invalidate_sender_name
 from io import BytesIO
+from core.db.unit_of_work import UnitOfWork, transactional
 
 class UserService:
     def __init__(self, user_repository: UserRepository, storage_service: StorageService):
         self.user_repo = user_repository
+        self.uow = UnitOfWork(user_repository.session)
         self.storage_service = storage_service
 
-    async def search_users(self, query: str) -> Sequence[UserResponse]:
-        return await self.user_repo.search_users(query)
+    async def search_users(self, query: str, limit: int = 20, prefix: bool = False) -> Sequence[UserResponse]:
+        return await self.user_repo.search_users(query, limit, prefix)
 
+    @transactional
     async def update_avatar(self, user_id: int, file: UploadFile) -> User:
         """Обновляет аватар пользователя"""
         contents = await file.read()
@@ -35,8 +40,14 @@ class UserService:
         file_obj.content_type = file.content_type
         
         avatar_url = await self.storage_service.upload_file(user_id, file_obj, safe_filename, is_user=True)
-        return await self.user_repo.update(user_id, {"avatar": avatar_url})
+        user = await self.user_repo.update(user_id, {"avatar": avatar_url})
+        await self.uow.after_commit(lambda: invalidate_user(user_id))
+        return user
 
+    @transactional
     async def update_profile(self, user_id: int, user_data: UserUpdate) -> User:
         """Обновляет данные пользователя"""
-        return await self.user_repo.update(user_id, user_data.model_dump(exclude_unset=True))
\ No newline at end of file
+        user = await self.user_repo.update(user_id, user_data.model_dump(exclude_unset=True))
+        await self.uow.after_commit(lambda: invalidate_user(user_id))
+        await self.uow.after_commit(lambda: invalidate_sender_name(user_id))
+        return user
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import AsyncGenerator
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from core.db import Base, get_db
+from core.db import Base, get_db, get_session_factory
 
 sys.modules['core.logging.config'] = MagicMock()
 
@@ -26,6 +26,7 @@ async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session_factory] = lambda: async_session_maker
 
 @pytest.fixture(autouse=True)
 async def init_db():
@@ -14,6 +14,15 @@ async def test_register(client: AsyncClient):
     assert "id" in data
     assert data["email"] == "test@test.com"
 
+@pytest.mark.asyncio
+async def test_register_requires_password(client: AsyncClient):
+    response = await client.post("/register", json={
+        "email": "test@test.com",
+        "first_name": "Test",
+        "last_name": "User"
+    })
+    assert response.status_code == 422
+
 @pytest.mark.asyncio
 async def test_login(client: AsyncClient):
     # Регистрация пользователя
@@ -31,4 +40,89 @@ async def test_login(client: AsyncClient):
     })
     assert response.status_code == 200
     data = response.json()
-    assert "access_token" in data
\ No newline at end of file
+    assert "access_token" in data
+
+@pytest.mark.asyncio
+async def test_login_wrong_password(client: AsyncClient):
+    await client.post("/register", json={
+        "email": "test@test.com",
+        "password": "test123",
+        "first_name": "Test",
+        "last_name": "User"
+    })
+
+    # Проверка пароля асинхронная: без await любой пароль считался верным
+    response = await client.post("/login/local", json={
+        "email": "test@test.com",
+        "password": "wrong-password"
+    })
+    assert response.status_code == 401
+    assert "access_token" not in response.json()
+
+@pytest.mark.asyncio
+async def test_logout_invalidates_cached_token(client: AsyncClient):
+    await client.post("/register", json={
+        "email": "test@test.com",
+        "password": "test123",
+        "first_name": "Test",
+        "last_name": "User"
+    })
+    response = await client.post("/login/local", json={
+        "email": "test@test.com",
+        "password": "test123"
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    # Второй запрос обслуживается из кэша токенов
+    assert (await client.get("/me", headers=headers)).status_code == 200
+    assert (await client.get("/me", headers=headers)).status_code == 200
+
+    await client.post("/logout", headers=headers)
+
+    response = await client.get("/me", headers=headers)
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_search_users(client: AsyncClient):
+    for email, first_name, last_name in [
+        ("test@test.com", "Test", "User"),
+        ("ivanov@sevsu.ru", "Иван", "Иванов"),
+        ("ivanova@sevsu.ru", "Мария", "Иванова"),
+        ("petrov@sevsu.ru", "Пётр", "Петров"),
+    ]:
+        await client.post("/register", json={
+            "email": email, "password": "test123", "first_name": first_name, "last_name": last_name
+        })
+    response = await client.post("/login/local", json={"email": "test@test.com", "password": "test123"})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await client.get("/users/search", params={"q": "иванов"}, headers=headers)
+    assert response.status_code == 200
+    # точное совпадение фамилии ранжируется выше частичного
+    assert [user["last_name"] for user in response.json()] == ["Иванов", "Иванова"]
+
+    response = await client.get("/users/search", params={"q": "иванов", "limit": 1}, headers=headers)
+    assert len(response.json()) == 1
+
+    response = await client.get("/users/search", params={"q": "ван", "prefix": True}, headers=headers)
+    assert response.json() == []
+
+    response = await client.get("/users/search", params={"q": "pe"}, headers=headers)
+    assert [user["email"] for user in response.json()] == ["petrov@sevsu.ru"]
+
+@pytest.mark.asyncio
+async def test_metrics_require_teacher(client: AsyncClient):
+    assert (await client.get("/metrics")).status_code == 401
+
+    await client.post("/register", json={
+        "email": "test@test.com",
+        "password": "test123",
+        "first_name": "Test",
+        "last_name": "User"
+    })
+    response = await client.post("/login/local", json={
+        "email": "test@test.com",
+        "password": "test123"
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert (await client.get("/metrics", headers=headers)).status_code == 403
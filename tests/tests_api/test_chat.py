@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from .test_fixtures import auth_headers, project_id, TEST_USER, assert_page_limit
+
+
+@pytest.mark.asyncio
+async def test_concurrent_messages_written_in_batches(client: AsyncClient, auth_headers, project_id):
+    responses = await asyncio.gather(*[
+        client.post(
+            f"/projects/{project_id}/chat/messages/",
+            json={"content": f"Сообщение {n}"},
+            headers=auth_headers
+        )
+        for n in range(10)
+    ])
+    assert all(response.status_code == 201 for response in responses)
+    created = [response.json() for response in responses]
+    assert len({message["id"] for message in created}) == 10
+    assert {message["sender_name"] for message in created} == {TEST_USER["last_name"]}
+
+    response = await client.get(f"/projects/{project_id}/chat/messages/", headers=auth_headers)
+    assert response.status_code == 200
+    listed = response.json()
+    assert {message["id"] for message in listed} == {message["id"] for message in created}
+    # Новые первыми: порядок id внутри пачки совпадает с порядком вставки
+    assert [message["id"] for message in listed] == sorted((m["id"] for m in listed), reverse=True)
+    assert {message["content"] for message in listed} == {f"Сообщение {n}" for n in range(10)}
+
+
+@pytest.mark.asyncio
+async def test_messages_page_limit(client: AsyncClient, auth_headers, project_id):
+    await assert_page_limit(client, f"/projects/{project_id}/chat/messages/", auth_headers)
@@ -0,0 +1,251 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from starlette.websockets import WebSocketState
+
+from main import app
+from core.db import get_session_factory
+from core.permissions import PermissionContext
+from core.security import get_current_user_websocket
+from models.domain.user_project import Role
+from models.schemas.users import UserResponse
+from services.message_service import MessageService, revoke_chat_access
+from services.notification_manager import NotificationManager
+from core.broadcast import InMemoryBroadcast, PostgresBroadcast
+from core.connections import ConnectionRegistry, encode_frame
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.sent = []
+        self.close_code = None
+
+    async def send_text(self, data: str):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.close_code = code
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_slow_client():
+    registry = ConnectionRegistry(queue_size=2, policy="drop_oldest")
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=10)
+    registry.add(1, fast)
+    registry.add(1, slow)
+
+    registry.broadcast(1, {"n": 0})
+    await asyncio.sleep(0.01)
+    for n in range(1, 5):
+        assert registry.broadcast(1, {"n": n}) == 2
+        await asyncio.sleep(0.001)
+
+    assert fast.sent == [{"n": n} for n in range(5)]
+    stats = registry.stats()
+    assert stats["connections"] == 2
+    assert stats["max_queue_depth"] == 2
+    assert stats["dropped_frames"] == 2
+
+    await registry.remove(1, fast)
+    await registry.remove(1, slow)
+    assert registry.stats()["connections"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_client_disconnected_by_policy():
+    registry = ConnectionRegistry(queue_size=1, policy="disconnect")
+    slow = FakeWebSocket(delay=10)
+    registry.add(1, slow)
+
+    for n in range(3):
+        registry.broadcast(1, {"n": n})
+    await asyncio.sleep(0.01)
+
+    assert slow.close_code == 1013
+    assert registry.count(1) == 0
+    assert registry.stats()["slow_disconnects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_backend_delivers_to_local_subscribers():
+    backend = InMemoryBroadcast()
+    registry = ConnectionRegistry(queue_size=8)
+    backend.subscribe("chat", registry.broadcast)
+    websocket = FakeWebSocket()
+    registry.add(7, websocket)
+
+    await backend.publish("chat", 7, {"content": "hi"})
+    await backend.publish("chat", 8, {"content": "other project"})
+    await asyncio.sleep(0.01)
+
+    assert websocket.sent == [{"content": "hi"}]
+    assert backend.stats()["published"] == 2
+    await registry.remove(7, websocket)
+
+
+def test_encode_frame_matches_send_json():
+    data = {"content": "Привет", "id": 1, "sender_name": None}
+    assert encode_frame(data) == json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    assert encode_frame('{"id":1}') == '{"id":1}'
+
+
+@pytest.mark.asyncio
+async def test_postgres_backend_falls_back_to_local_delivery():
+    # Без соединения LISTEN и для событий больше лимита NOTIFY доставка локальная
+    backend = PostgresBroadcast("postgresql://unused", "test_events")
+    received = []
+    backend.subscribe("notifications", lambda key, data: received.append((key, data)))
+
+    await backend.publish("notifications", 1, {"n": 1})
+    await backend.publish("notifications", 2, {"text": "x" * PostgresBroadcast.PAYLOAD_LIMIT})
+
+    assert [key for key, _ in received] == [1, 2]
+    assert json.loads(received[0][1]) == {"n": 1}
+    assert backend.stats()["local_only"] == 2
+
+
+def override_chat_websocket(monkeypatch, roles: dict, session_factory=None) -> dict:
+    """Подменяет пользователя сокета и чтение ролей; roles можно менять во время теста"""
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            pass
+
+    async def load(cls, project_repo, user):
+        return cls(user.id, dict(roles))
+
+    monkeypatch.setattr(PermissionContext, "load", classmethod(load))
+    overrides = {
+        get_session_factory: lambda: session_factory or FakeSession,
+        get_current_user_websocket: lambda: UserResponse.model_construct(id=1, role=None),
+    }
+    app.dependency_overrides.update(overrides)
+    return overrides
+
+
+def test_chat_websocket_holds_no_session_while_open(monkeypatch):
+    open_sessions = []
+
+    class TrackedSession:
+        async def __aenter__(self):
+            open_sessions.append(self)
+            return self
+
+        async def __aexit__(self, *exc_info):
+            open_sessions.remove(self)
+
+    overrides = override_chat_websocket(monkeypatch, {5: Role.MEMBER}, TrackedSession)
+    try:
+        with TestClient(app).websocket_connect("/projects/5/chat/ws"):
+            assert MessageService.connections.count(5) == 1
+            assert open_sessions == []
+    finally:
+        for dependency in overrides:
+            app.dependency_overrides.pop(dependency, None)
+    assert MessageService.connections.count(5) == 0
+
+
+def test_removed_member_cannot_post_through_open_socket(monkeypatch):
+    roles = {5: Role.MEMBER}
+    overrides = override_chat_websocket(monkeypatch, roles)
+    try:
+        with TestClient(app).websocket_connect("/projects/5/chat/ws") as websocket:
+            assert MessageService.connections.count(5) == 1
+            # Участника исключили из проекта: следующая операция перечитывает роли
+            roles.clear()
+            websocket.send_text("после исключения")
+            with pytest.raises(WebSocketDisconnect) as closed:
+                websocket.receive_text()
+            assert closed.value.code == 1008
+    finally:
+        for dependency in overrides:
+            app.dependency_overrides.pop(dependency, None)
+    assert MessageService.connections.count(5) == 0
+
+
+@pytest.mark.asyncio
+async def test_revoke_chat_access_closes_only_removed_member_sockets():
+    removed, other = FakeWebSocket(), FakeWebSocket()
+    MessageService.connections.add(5, removed, user_id=1)
+    MessageService.connections.add(5, other, user_id=2)
+
+    await revoke_chat_access(5, 1)
+    await asyncio.sleep(0.01)
+
+    assert removed.close_code == 1008
+    assert MessageService.connections.count(5) == 1
+    await MessageService.connections.remove(5, other)
+
+
+@pytest.mark.asyncio
+async def test_connection_limits_per_user_and_process():
+    registry = ConnectionRegistry(queue_size=4, max_per_user=2)
+    sockets = [FakeWebSocket() for _ in range(2)]
+
+    # Место занимается до accept(), поэтому незавершенное рукопожатие тоже учитывается
+    assert registry.reserve(10) is None
+    assert registry.reserve(10) is None
+    assert registry.reserve(10) == "Too many connections for user"
+    registry.add(1, sockets[0], user_id=10, reserved=True)
+    registry.release(10)
+    registry.add(2, sockets[1], user_id=10)
+    assert registry.reserve(10) == "Too many connections for user"
+
+    registry.max_total = ConnectionRegistry.open_connections
+    assert registry.reserve(11) == "Too many connections"
+
+    await registry.remove(1, sockets[0])
+    registry.max_total = 0
+    assert registry.reserve(10) is None
+    registry.release(10)
+    await registry.remove(2, sockets[1])
+    assert registry.user_connections == {}
+    assert registry.stats()["rejected"] == 0
+
+
+class HandshakeWebSocket(FakeWebSocket):
+    async def accept(self):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handshakes_respect_user_limit():
+    manager = NotificationManager()
+    manager.connections.max_per_user = 2
+    sockets = [HandshakeWebSocket() for _ in range(4)]
+
+    results = await asyncio.gather(*(manager.connect(ws, 10) for ws in sockets), return_exceptions=True)
+
+    assert manager.connections.count(10) == 2
+    assert sum(isinstance(result, HTTPException) for result in results) == 2
+    assert [ws.close_code for ws in sockets].count(1013) == 2
+    assert manager.connections.stats()["rejected"] == 2
+    await manager.disconnect()
+    assert manager.connections.user_connections == {}
+
+
+@pytest.mark.asyncio
+async def test_reap_closes_idle_and_disconnected_sockets():
+    registry = ConnectionRegistry(queue_size=4)
+    idle, active, gone = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    registry.add(1, idle).last_seen -= 120
+    registry.add(1, active)
+    registry.add(2, gone)
+    gone.client_state = WebSocketState.DISCONNECTED
+
+    assert registry.reap(idle_timeout=0) == 1
+    assert registry.reap(idle_timeout=60) == 1
+    await asyncio.sleep(0.01)
+
+    assert idle.close_code == 1001
+    assert registry.group_summary() == {"groups": 1, "max_per_group": 1}
+    assert registry.stats()["reaped"] == 2
+    await registry.remove(1, active)
@@ -1,6 +1,8 @@
 import pytest
+from contextlib import contextmanager
 from httpx import AsyncClient
 from datetime import datetime, timedelta
+from core.db.query_stats import track_queries
 
 TEST_USER = {
     "email": "test@test.com",
@@ -9,6 +11,13 @@ TEST_USER = {
     "last_name": "User"
 }
 
+OUTSIDER_USER = {
+    "email": "outsider@test.com",
+    "password": "test123",
+    "first_name": "Outsider",
+    "last_name": "User"
+}
+
 TEST_PROJECT = {
     "title": "Test Project",
     "description": "Test Description"
@@ -24,7 +33,34 @@ async def auth_headers(client: AsyncClient):
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
 
+@pytest.fixture
+async def outsider_headers(client: AsyncClient):
+    """Пользователь, не состоящий ни в одном проекте"""
+    await client.post("/register", json=OUTSIDER_USER)
+    response = await client.post("/login/local", json={
+        "email": OUTSIDER_USER["email"],
+        "password": OUTSIDER_USER["password"]
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
 @pytest.fixture
 async def project_id(client: AsyncClient, auth_headers):
     response = await client.post("/projects/", json=TEST_PROJECT, headers=auth_headers)
-    return response.json()["id"]
\ No newline at end of file
+    return response.json()["id"]
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Проверяет, что код внутри блока выполнил не больше limit SQL-запросов"""
+    with track_queries() as stats:
+        yield stats
+    assert stats.count <= limit, (
+        f"Выполнено {stats.count} запросов, ожидалось не больше {limit}: {stats.repeated()}"
+    )
+
+async def assert_page_limit(client: AsyncClient, path: str, headers: dict):
+    """limit списка должен быть положительным; больше MAX_PAGE_SIZE урезается, а не отклоняется"""
+    for limit in (-5, 0):
+        response = await client.get(path, params={"limit": limit}, headers=headers)
+        assert response.status_code == 422, f"{path}?limit={limit}: {response.status_code}"
+    response = await client.get(path, params={"limit": 1000}, headers=headers)
+    assert response.status_code == 200, f"{path}?limit=1000: {response.status_code}"
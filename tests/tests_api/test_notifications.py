@@ -3,7 +3,7 @@ from httpx import AsyncClient
 from datetime import datetime, timedelta
 from models.domain.tasks import TaskStatus, TaskGrade
 from models.domain.notifications import NotificationType
-from .test_fixtures import auth_headers, project_id
+from .test_fixtures import auth_headers, project_id, assert_page_limit
 from services.notification_service import NotificationService
 from services.notification_manager import NotificationManager
 from repositories.notification_repository import NotificationRepository
@@ -71,4 +71,8 @@ async def test_task_assignment_notification(client: AsyncClient, auth_headers, p
     notification = next(n for n in notifications if n["type"] == NotificationType.TASK_ASSIGNED)
     assert notification["read"] == False
     assert notification["notification_metadata"]["task_id"] == task["id"]
-    assert notification["notification_metadata"]["task_title"] == task_data["title"]
\ No newline at end of file
+    assert notification["notification_metadata"]["task_title"] == task_data["title"]
+
+@pytest.mark.asyncio
+async def test_notifications_page_limit(client: AsyncClient, auth_headers):
+    await assert_page_limit(client, "/notifications/", auth_headers)
@@ -1,6 +1,6 @@
 import pytest
 from httpx import AsyncClient
-from .test_fixtures import TEST_PROJECT, auth_headers, project_id
+from .test_fixtures import TEST_PROJECT, auth_headers, outsider_headers, project_id, assert_max_queries, assert_page_limit
 
 TEST_COLUMN = {
     "name": "Test Column",
@@ -33,6 +33,45 @@ async def test_get_all_projects(client: AsyncClient, auth_headers, project_id):
     data = response.json()
     assert len(data) == 2
 
+@pytest.mark.asyncio
+async def test_get_all_projects_paginated_with_members(client: AsyncClient, auth_headers, project_id):
+    other = (await client.post("/register", json={
+        "email": "other@test.com", "password": "test123", "first_name": "Other", "last_name": "User"
+    })).json()
+    await client.post(f"/projects/{project_id}/users/{other['id']}", headers=auth_headers)
+    for i in range(3):
+        await client.post("/projects/", json={**TEST_PROJECT, "title": f"Project {i}"}, headers=auth_headers)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3, "members_limit": 1, **({"cursor": cursor} if cursor else {})}
+        with assert_max_queries(8):
+            response = await client.get("/projects/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert [project["id"] for project in seen] == sorted((project["id"] for project in seen), reverse=True)
+    assert len(seen) == 4
+    first = next(project for project in seen if project["id"] == project_id)
+    assert first["member_count"] == 2
+    # владелец идет первым в превью участников
+    assert [member["role"] for member in first["members"]] == ["owner"]
+
+@pytest.mark.asyncio
+async def test_user_projects_do_not_expose_members(client: AsyncClient, auth_headers, outsider_headers, project_id):
+    owner_id = (await client.get("/me", headers=auth_headers)).json()["id"]
+
+    response = await client.get(f"/users/{owner_id}/projects", headers=outsider_headers)
+    assert response.status_code == 200
+    projects = response.json()
+    assert [project["id"] for project in projects] == [project_id]
+    assert projects[0]["member_count"] == 1
+    assert projects[0]["members"] is None
+
 @pytest.mark.asyncio
 async def test_update_project(client: AsyncClient, auth_headers, project_id):
     update_data = {
@@ -225,4 +264,106 @@ async def test_get_project_participants_report(client: AsyncClient, auth_headers
     )
     assert response.status_code == 200
     report = response.json()
-    assert isinstance(report, list)
\ No newline at end of file
+    assert isinstance(report, list)
+
+@pytest.mark.asyncio
+async def test_non_member_cannot_access_project(client: AsyncClient, outsider_headers, project_id):
+
+    for path in (
+        f"/projects/{project_id}",
+        f"/projects/{project_id}/users",
+        f"/projects/{project_id}/columns",
+        f"/projects/{project_id}/board",
+        f"/projects/{project_id}/tasks/",
+    ):
+        response = await client.get(path, headers=outsider_headers)
+        assert response.status_code == 403
+
+    for path in ("/projects/999999", "/projects/999999/users", "/projects/999999/columns"):
+        response = await client.get(path, headers=outsider_headers)
+        assert response.status_code == 404
+
+    # Участник проекта проверяется EXISTS-запросом, без загрузки списка участников
+    me = await client.get("/me", headers=auth_headers)
+    response = await client.get(
+        f"/grading/projects/{project_id}/users/{me.json()['id']}/tasks",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    outsider_id = (await client.get("/me", headers=outsider_headers)).json()["id"]
+    response = await client.get(
+        f"/grading/projects/{project_id}/users/{outsider_id}/tasks",
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_project_activities_cursor_pagination(client: AsyncClient, auth_headers, project_id):
+    for i in range(5):
+        await client.post(
+            f"/projects/{project_id}/tasks/",
+            json={"title": f"Task {i}", "priority": "medium"},
+            headers=auth_headers
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/projects/{project_id}/activities", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert len(seen) == len(set(seen)) == 5
+    assert seen == sorted(seen, reverse=True)
+
+    response = await client.get(
+        f"/projects/{project_id}/activities",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_project_activities_page_limit(client: AsyncClient, auth_headers, project_id):
+    await assert_page_limit(client, f"/projects/{project_id}/activities", auth_headers)
+
+@pytest.mark.asyncio
+async def test_get_board(client: AsyncClient, auth_headers, project_id):
+    columns = (await client.get(f"/projects/{project_id}/columns", headers=auth_headers)).json()
+    for i in range(6):
+        await client.post(
+            f"/projects/{project_id}/tasks/",
+            json={"title": f"Task {i}", "column_id": columns[i % 2]["id"]},
+            headers=auth_headers
+        )
+    await client.post(f"/projects/{project_id}/tasks/", json={"title": "No column"}, headers=auth_headers)
+
+    # число запросов не зависит от количества задач
+    with assert_max_queries(10):
+        response = await client.get(f"/projects/{project_id}/board", headers=auth_headers)
+    assert response.status_code == 200
+    board = response.json()
+
+    assert [column["id"] for column in board["columns"]] == [column["id"] for column in columns]
+    assert [len(column["tasks"]) for column in board["columns"]] == [3, 3, 0]
+    assert [task["title"] for task in board["unassigned_tasks"]] == ["No column"]
+    assert len(board["members"]) == 1
+    assert board["members"][0]["role"] == "owner"
+    assert board["sprints"] == []
+
+    owner_id = board["members"][0]["id"]
+    response = await client.get(
+        f"/projects/{project_id}/board",
+        params={"assignee_id": owner_id},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert all(not column["tasks"] for column in response.json()["columns"])
+
+    response = await client.get("/projects/999999/board", headers=auth_headers)
+    assert response.status_code == 404
@@ -2,7 +2,7 @@ import pytest
 from httpx import AsyncClient
 from datetime import datetime, date, timedelta
 from models.domain.reports import Report
-from .test_fixtures import auth_headers, project_id, TEST_PROJECT
+from .test_fixtures import auth_headers, project_id, TEST_PROJECT, assert_page_limit
 
 TEST_REPORT = {
     "title": "Test Report",
@@ -114,4 +114,9 @@ async def test_delete_report(client: AsyncClient, auth_headers, project_id):
         f"/project/{project_id}/report/{report_id}",
         headers=auth_headers
     )
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_reports_page_limit(client: AsyncClient, auth_headers, project_id):
+    await assert_page_limit(client, f"/project/{project_id}/report/", auth_headers)
@@ -0,0 +1,118 @@
+import hashlib
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import FastAPI, Form, Header, HTTPException
+from httpx import AsyncClient, ASGITransport
+from jose import jwk, jwt
+from jose.utils import calculate_at_hash
+
+from core.config.settings import settings
+from core.http_client import get_http_client
+from core.oidc import jwks_cache
+from main import app
+
+ACCESS_TOKEN = "stub-access-token"
+USER_INFO = {
+    "sub": "sevsu-123",
+    "email": "student@sevsu.ru",
+    "given_name": "Иван",
+    "family_name": "Иванов",
+    "syncable_cohorts": ["ИС/б-21-1-о"]
+}
+
+
+class StubOAuthServer:
+    """Локальная замена провайдера SEVSU: token, userinfo и certs"""
+
+    def __init__(self):
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        )
+        public_jwk = jwk.construct(self.private_pem, "RS256").public_key().to_dict()
+        self.jwks = {"keys": [{**public_jwk, "kid": "stub-key", "use": "sig"}]}
+        self.calls = {"token": 0, "userinfo": 0, "certs": 0}
+        self.app = self._build_app()
+
+    def id_token(self) -> str:
+        now = int(time.time())
+        claims = {
+            **USER_INFO,
+            "iss": settings.SEVSU_ISSUER,
+            "aud": settings.SEVSU_CLIENT_ID,
+            "iat": now,
+            "exp": now + 300,
+            "at_hash": calculate_at_hash(ACCESS_TOKEN, hashlib.sha256)
+        }
+        return jwt.encode(claims, self.private_pem, algorithm="RS256", headers={"kid": "stub-key"})
+
+    def _build_app(self) -> FastAPI:
+        stub = FastAPI()
+
+        @stub.post("/realms/portal/protocol/openid-connect/token")
+        async def token(code: str = Form(...)):
+            self.calls["token"] += 1
+            if code != "valid-code":
+                raise HTTPException(status_code=400, detail="invalid_grant")
+            return {"access_token": ACCESS_TOKEN, "id_token": self.id_token(), "token_type": "Bearer"}
+
+        @stub.get("/realms/portal/protocol/openid-connect/userinfo")
+        async def userinfo(authorization: str = Header(...)):
+            self.calls["userinfo"] += 1
+            assert authorization == f"Bearer {ACCESS_TOKEN}"
+            return USER_INFO
+
+        @stub.get("/realms/portal/protocol/openid-connect/certs")
+        async def certs():
+            self.calls["certs"] += 1
+            return self.jwks
+
+        return stub
+
+
+@pytest.fixture
+async def oauth_server():
+    server = StubOAuthServer()
+    http_client = AsyncClient(transport=ASGITransport(app=server.app))
+    app.dependency_overrides[get_http_client] = lambda: http_client
+    jwks_cache.clear()
+    yield server
+    app.dependency_overrides.pop(get_http_client, None)
+    await http_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sevsu_callback_uses_userinfo(client: AsyncClient, oauth_server, monkeypatch):
+    monkeypatch.setattr(settings, "SEVSU_VERIFY_ID_TOKEN", False)
+
+    response = await client.get("/callback", params={"code": "valid-code"})
+    assert response.status_code == 200
+    assert oauth_server.calls == {"token": 1, "userinfo": 1, "certs": 0}
+
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    me = (await client.get("/me", headers=headers)).json()
+    assert me["email"] == USER_INFO["email"]
+    assert me["group"] == USER_INFO["syncable_cohorts"][0]
+
+
+@pytest.mark.asyncio
+async def test_sevsu_callback_verifies_id_token_locally(client: AsyncClient, oauth_server, monkeypatch):
+    monkeypatch.setattr(settings, "SEVSU_VERIFY_ID_TOKEN", True)
+
+    for _ in range(2):
+        response = await client.get("/callback", params={"code": "valid-code"})
+        assert response.status_code == 200
+
+    # userinfo не запрашивается, ключи подписи загружаются один раз
+    assert oauth_server.calls == {"token": 2, "userinfo": 0, "certs": 1}
+
+
+@pytest.mark.asyncio
+async def test_sevsu_callback_rejects_invalid_code(client: AsyncClient, oauth_server):
+    response = await client.get("/callback", params={"code": "wrong-code"})
+    assert response.status_code == 401
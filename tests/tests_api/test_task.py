@@ -1,8 +1,10 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from models.domain.tasks import TaskStatus, TaskGrade
-from .test_fixtures import auth_headers, project_id, TEST_PROJECT
+from .test_fixtures import auth_headers, project_id, TEST_PROJECT, assert_max_queries
 
 TEST_TASK = {
     "title": "Test Task",
@@ -38,6 +40,25 @@ async def test_create_task(client: AsyncClient, auth_headers, project_id):
     assert data["title"] == TEST_TASK["title"]
     assert data["project_id"] == project_id
 
+@pytest.mark.asyncio
+async def test_create_task_commits_once(client: AsyncClient, auth_headers, project_id):
+    user_id = (await client.get("/me", headers=auth_headers)).json()["id"]
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(Session, "after_commit", listener)
+    try:
+        response = await client.post(
+            f"/projects/{project_id}/tasks/",
+            json={**TEST_TASK, "assignee_id": user_id},
+            headers=auth_headers
+        )
+    finally:
+        event.remove(Session, "after_commit", listener)
+
+    assert response.status_code == 201
+    # задача, уведомление исполнителю и запись активности - одна транзакция
+    assert len(commits) == 1
+
 @pytest.mark.asyncio
 async def test_get_task(client: AsyncClient, auth_headers, project_id):
     response = await client.post(
@@ -66,6 +87,190 @@ async def test_get_project_tasks(client: AsyncClient, auth_headers, project_id):
     data = response.json()
     assert len(data) == 2
 
+@pytest.mark.asyncio
+async def test_get_project_tasks_query_count(client: AsyncClient, auth_headers, project_id):
+    for i in range(10):
+        await client.post(f"/projects/{project_id}/tasks/", json={**TEST_TASK, "title": f"Task {i}"}, headers=auth_headers)
+
+    # число запросов не зависит от количества задач
+    with assert_max_queries(10):
+        response = await client.get(f"/projects/{project_id}/tasks/", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_includes_names(client: AsyncClient, auth_headers, project_id):
+    user_id = (await client.get("/me", headers=auth_headers)).json()["id"]
+    column = (await client.get(f"/projects/{project_id}/columns", headers=auth_headers)).json()[0]
+    await client.post(
+        f"/projects/{project_id}/tasks/",
+        json={**TEST_TASK, "assignee_id": user_id, "column_id": column["id"]},
+        headers=auth_headers
+    )
+    await client.post(f"/projects/{project_id}/tasks/", json={**TEST_TASK, "title": "Task 2"}, headers=auth_headers)
+
+    response = await client.get(f"/projects/{project_id}/tasks/", headers=auth_headers)
+    assert response.status_code == 200
+    assigned, unassigned = response.json()
+    assert assigned["assignee_name"] == "Test User"
+    assert assigned["column_name"] == column["name"]
+    assert assigned["status"] == TEST_TASK["status"]
+    assert unassigned["assignee_name"] is None
+    assert unassigned["column_name"] is None
+
+@pytest.mark.asyncio
+async def test_single_task_endpoints_include_names(client: AsyncClient, auth_headers, project_id):
+    user_id = (await client.get("/me", headers=auth_headers)).json()["id"]
+    columns = (await client.get(f"/projects/{project_id}/columns", headers=auth_headers)).json()
+    response = await client.post(
+        f"/projects/{project_id}/tasks/",
+        json={**TEST_TASK, "assignee_id": user_id, "column_id": columns[0]["id"]},
+        headers=auth_headers
+    )
+    created = response.json()
+    assert created["assignee_name"] == "Test User"
+    assert created["column_name"] == columns[0]["name"]
+
+    response = await client.get(f"/projects/{project_id}/tasks/{created['id']}", headers=auth_headers)
+    assert response.json()["assignee_name"] == "Test User"
+    assert response.json()["column_name"] == columns[0]["name"]
+
+    response = await client.patch(
+        f"/projects/{project_id}/tasks/{created['id']}",
+        json={"column_id": columns[1]["id"]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["assignee_name"] == "Test User"
+    assert response.json()["column_name"] == columns[1]["name"]
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_filter_sort_paginate(client: AsyncClient, auth_headers, project_id):
+    priorities = ["low", "high", "medium", "high", "low", "high"]
+    for i, priority in enumerate(priorities):
+        await client.post(
+            f"/projects/{project_id}/tasks/",
+            json={**TEST_TASK, "title": f"Task {i}", "priority": priority},
+            headers=auth_headers
+        )
+    await client.post(f"/projects/{project_id}/tasks/", json={**TEST_TASK, "title": "Other"}, headers=auth_headers)
+
+    response = await client.get(
+        f"/projects/{project_id}/tasks/",
+        params={"priority": ["high", "low"], "q": "task"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert sorted(task["title"] for task in response.json()) == ["Task 0", "Task 1", "Task 3", "Task 4", "Task 5"]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "Task", "sort": "-priority", "limit": 4, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/projects/{project_id}/tasks/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert [task["priority"] for task in seen] == ["high"] * 3 + ["medium"] + ["low"] * 2
+    assert len({task["id"] for task in seen}) == 6
+
+    response = await client.get(
+        f"/projects/{project_id}/tasks/",
+        params={"sort": "title", "cursor": cursor or "not-a-cursor"},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_search_tasks(client: AsyncClient, auth_headers, project_id):
+    for title, description in [
+        ("Настроить базу данных", "Создать <схему> и миграции"),
+        ("Deploy database", "Run migrations on the staging server"),
+        ("Написать тесты", "Покрыть тестами API"),
+    ]:
+        await client.post(
+            f"/projects/{project_id}/tasks/",
+            json={**TEST_TASK, "title": title, "description": description},
+            headers=auth_headers
+        )
+
+    response = await client.get(f"/projects/{project_id}/tasks/search", params={"q": "базы"}, headers=auth_headers)
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["title"] for result in results] == ["Настроить базу данных"]
+    assert "<mark>базу</mark>" in results[0]["title_highlight"]
+
+    # текст задачи экранирован, размечены только совпадения
+    response = await client.get(f"/projects/{project_id}/tasks/search", params={"q": "схема"}, headers=auth_headers)
+    results = response.json()
+    assert len(results) == 1
+    assert "&lt;<mark>схему</mark>&gt;" in results[0]["description_highlight"]
+
+    # английские словоформы размечаются так же, как русские
+    response = await client.get(f"/projects/{project_id}/tasks/search", params={"q": "migrating"}, headers=auth_headers)
+    results = response.json()
+    assert [result["title"] for result in results] == ["Deploy database"]
+    assert "<mark>migrations</mark>" in results[0]["description_highlight"]
+    assert "<mark><mark>" not in results[0]["description_highlight"]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "database OR тесты OR миграции", "limit": 1, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(f"/projects/{project_id}/tasks/search", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(result["id"] for result in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 3
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_conditional_get(client: AsyncClient, auth_headers, project_id):
+    await client.post(f"/projects/{project_id}/tasks/", json=TEST_TASK, headers=auth_headers)
+
+    response = await client.get(f"/projects/{project_id}/tasks/", headers=auth_headers)
+    etag = response.headers["ETag"]
+
+    response = await client.get(f"/projects/{project_id}/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    # другие фильтры - другой ETag
+    response = await client.get(
+        f"/projects/{project_id}/tasks/", params={"limit": 1}, headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    # любое изменение колонки проекта меняет версию
+    columns = (await client.get(f"/projects/{project_id}/columns", headers=auth_headers)).json()
+    await client.put(
+        f"/projects/{project_id}/columns/{columns[0]['id']}", json={"name": "Renamed"}, headers=auth_headers
+    )
+    response = await client.get(f"/projects/{project_id}/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+@pytest.mark.asyncio
+async def test_task_list_etag_tracks_assignee_name(client: AsyncClient, auth_headers, project_id):
+    me = (await client.get("/me", headers=auth_headers)).json()
+    await client.post(
+        f"/projects/{project_id}/tasks/", json={**TEST_TASK, "assignee_id": me["id"]}, headers=auth_headers
+    )
+    etag = (await client.get(f"/projects/{project_id}/tasks/", headers=auth_headers)).headers["ETag"]
+
+    # то же имя - версия проекта не меняется
+    await client.put("/users/profile", json={"last_name": me["last_name"]}, headers=auth_headers)
+    response = await client.get(f"/projects/{project_id}/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.put("/users/profile", json={"last_name": "Renamed"}, headers=auth_headers)
+    response = await client.get(f"/projects/{project_id}/tasks/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["assignee_name"] == f"{me['first_name']} Renamed"
+
 @pytest.mark.asyncio
 async def test_update_task(client: AsyncClient, auth_headers, project_id):
     response = await client.post(